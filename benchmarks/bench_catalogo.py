@@ -0,0 +1,83 @@
+# Imports de sistema
+import gc
+import random
+import time
+import tracemalloc
+
+# Imports locais
+from benchmarks.gerador import gerarCurso
+from src.CatalogoUnidades import CatalogoUnidades
+from src.Normalizacao import normalizarNome
+
+
+'''
+Benchmark do catálogo global de UCs (src/CatalogoUnidades.py). Monta um catálogo sintético em que os cursos são
+variações de poucas matrizes (como os cursos de uma mesma faculdade) e compara a memória dos cursos separados com a
+dos cursos registrados no catálogo, e o tempo da consulta "quais cursos aproveitam as UCs deste estudante" pelo
+índice reverso e por uma varredura de todas as matrizes.
+
+Como rodar (a partir da raiz do repositório):
+    ~$ python3 -m benchmarks.bench_catalogo
+'''
+
+N_CURSOS = 300
+N_UNIDADES = 80
+N_MATRIZES = 6
+
+
+def memoria(funcao) -> tuple[object, int]:
+    '''
+    Função que executa a função informada e retorna o resultado e a memória alocada que continua em uso, em bytes.
+    '''
+    gc.collect()
+    tracemalloc.start()
+    resultado = funcao()
+    gc.collect()
+    usada = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return resultado, usada
+
+
+def main() -> None:
+    cursos, separados = memoria(lambda: [gerarCurso(N_UNIDADES, codigo=codigo, semente=codigo % N_MATRIZES) for codigo in range(N_CURSOS)])
+    print(f"{N_CURSOS} cursos de {N_UNIDADES} UCs, {N_MATRIZES} matrizes distintas")
+    print(f"{'cursos separados':<28} {separados / 1024:9.0f} KiB")
+
+    def registrar():
+        catalogo = CatalogoUnidades()
+        return catalogo, [catalogo.registrar(gerarCurso(N_UNIDADES, codigo=codigo, semente=codigo % N_MATRIZES)) for codigo in range(N_CURSOS)]
+
+    (catalogo, registrados), compartilhados = memoria(registrar)
+    print(f"{'cursos no catálogo':<28} {compartilhados / 1024:9.0f} KiB ({separados / compartilhados:.1f}x menos)")
+
+    aleatorio = random.Random(0)
+    cursadas = aleatorio.sample(registrados[0].matriz_curricular, 20)
+
+    inicio = time.perf_counter()
+    for _ in range(100):
+        catalogo.cursos_que_aceitam(cursadas)
+    indice = (time.perf_counter() - inicio) / 100
+
+    def varredura():
+        chaves = {(normalizarNome(unidade_curricular.nome), unidade_curricular.carga_horaria) for unidade_curricular in cursadas}
+        resultado = []
+
+        for curso in cursos:
+            aproveitadas = sum((normalizarNome(unidade_curricular.nome), unidade_curricular.carga_horaria) in chaves for unidade_curricular in curso.matriz_curricular)
+            if aproveitadas > 0:
+                resultado.append((curso.id, aproveitadas))
+
+        return resultado
+
+    inicio = time.perf_counter()
+    for _ in range(5):
+        varredura()
+    varrido = (time.perf_counter() - inicio) / 5
+
+    print(f"{'consulta pelo índice':<28} {indice * 1000:9.3f} ms")
+    print(f"{'consulta por varredura':<28} {varrido * 1000:9.3f} ms ({varrido / indice:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Imports de sistema
+import time
+
+# Imports locais
+from benchmarks.gerador import gerarCurso, gerarCursadas
+
+
+'''
+Benchmark das consultas de elegibilidade: compara o laço por estudante (Curso.optativas_cursaveis) com o cálculo
+em lote por bitsets (Curso.optativas_cursaveis_lote) para turmas de tamanhos crescentes.
+
+Como rodar (a partir da raiz do repositório):
+    ~$ python3 -m benchmarks.bench_elegibilidade
+'''
+
+
+def medir(funcao, *args) -> float:
+    '''
+    Função que mede o tempo de uma chamada, em segundos.
+
+    Parâmetros:
+    - funcao (Callable): Função a ser medida.
+    - args: Argumentos da função.
+
+    Retorno:
+    - (float): Tempo da chamada.
+    '''
+    inicio = time.perf_counter()
+    funcao(*args)
+    return time.perf_counter() - inicio
+
+
+def main():
+    curso = gerarCurso(300)
+    curso.grafo
+
+    print(f"{'estudantes':>10} {'por estudante (s)':>18} {'lote (s)':>10} {'ganho':>7}")
+
+    for n_estudantes in (100, 1000, 10000, 50000):
+        lote = gerarCursadas(curso, n_estudantes)
+
+        por_estudante = medir(lambda: [curso.optativas_cursaveis(cursadas) for cursadas in lote])
+        em_lote = medir(curso.optativas_cursaveis_lote, lote)
+
+        print(f"{n_estudantes:>10} {por_estudante:>18.4f} {em_lote:>10.4f} {por_estudante / em_lote:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
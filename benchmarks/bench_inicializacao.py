@@ -0,0 +1,86 @@
+# Imports de sistema
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from os import path
+
+# Imports locais
+from benchmarks.gerador import gerarCurso
+from src.Snapshot import Snapshot
+
+
+'''
+Benchmark do tempo de inicialização da linha de comando. Cada caso é um processo Python novo (como o usuário roda o
+programa), executado várias vezes depois de uma execução de aquecimento, que deixa os .pyc prontos. Os casos são o
+interpretador sozinho (a base), a importação do main.py, o --help e um "check" que não acessa a rede, lendo o curso
+de um snapshot. Também são listadas as bibliotecas pesadas que a importação do main.py carrega: nenhuma delas
+deveria aparecer, já que só são necessárias quando um curso é baixado do site.
+
+Como rodar (a partir da raiz do repositório):
+    ~$ python3 -m benchmarks.bench_inicializacao
+'''
+
+RAIZ = path.dirname(path.dirname(path.abspath(__file__)))
+PESADAS = ("requests", "urllib3", "bs4", "lxml", "sqlite3", "concurrent.futures", "html.parser")
+
+
+def medir(comando: list[str], repeticoes: int) -> list[float]:
+    '''
+    Função que executa o comando várias vezes e retorna a duração de cada execução, em milissegundos.
+    '''
+    subprocess.run(comando, cwd=RAIZ, capture_output=True, check=True)
+
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run(comando, cwd=RAIZ, capture_output=True, check=True)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+
+    return tempos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tempo de inicialização da linha de comando.")
+    parser.add_argument("--repeticoes", type=int, default=10, help="Número de execuções de cada caso.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        curso = gerarCurso(80, codigo=1, semente=0)
+
+        caminho_snapshot = path.join(diretorio, "catalogo.snapshot")
+        Snapshot.escrever([curso], caminho_snapshot)
+
+        caminho_cursadas = path.join(diretorio, "estudante.csv")
+        with open(caminho_cursadas, "w", encoding="utf-8") as arquivo:
+            arquivo.writelines(f"{unidade_curricular.nome}\n" for unidade_curricular in curso.matriz_curricular[:10])
+
+        casos = {
+            "python -c pass": [sys.executable, "-c", "pass"],
+            "import main": [sys.executable, "-c", "import main"],
+            "main.py --help": [sys.executable, "main.py", "--help"],
+            "check com snapshot": [
+                sys.executable, "main.py", "check", "--snapshot", caminho_snapshot, "--curso", "1", "--cursadas", caminho_cursadas,
+            ],
+        }
+
+        base = None
+        for nome, comando in casos.items():
+            tempos = medir(comando, args.repeticoes)
+            melhor = min(tempos)
+            base = melhor if base is None else base
+
+            print(f"{nome:<22} {melhor:8.1f}ms  (mediana {statistics.median(tempos):.1f}ms, +{melhor - base:.1f}ms sobre a base)")
+
+    carregadas = subprocess.run(
+        [sys.executable, "-c", f"import main, sys; print(' '.join(m for m in {PESADAS!r} if m in sys.modules))"],
+        cwd=RAIZ, capture_output=True, text=True, check=True,
+    ).stdout.split()
+
+    print(f"\nBibliotecas pesadas carregadas por 'import main': {', '.join(carregadas) if carregadas else 'nenhuma'}")
+
+
+if __name__ == "__main__":
+    main()
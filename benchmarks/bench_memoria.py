@@ -0,0 +1,102 @@
+# Imports de sistema
+import tracemalloc
+
+# Imports locais
+from src.UnidadeCurricular import UnidadeCurricular
+
+
+'''
+Benchmark de memória das unidades curriculares: compara a representação atual (__slots__, nomes internados e
+pré-requisitos em tupla) com a representação antiga (um __dict__ por instância, uma lista de pré-requisitos por UC
+e uma string nova para cada nome lido), reproduzida abaixo em UnidadeCurricularAntiga.
+
+O cenário simula o catálogo inteiro em memória: vários cursos, cada um com a sua matriz, em que boa parte dos
+nomes se repete entre cursos (como as UCs comuns da Facom).
+
+Como rodar (a partir da raiz do repositório):
+    ~$ python3 -m benchmarks.bench_memoria
+'''
+
+
+class UnidadeCurricularAntiga:
+    '''
+    Representação antiga da UnidadeCurricular, sem validação, usada apenas como referência de memória.
+    '''
+    def __init__(self, nome, carga_horaria, pre_requisitos, obrigatoria):
+        self._nome           = nome
+        self._carga_horaria  = carga_horaria
+        self._pre_requisitos = pre_requisitos
+        self._obrigatoria    = obrigatoria
+
+    def add_pre_requisito(self, pre_requisito):
+        self._pre_requisitos.append(pre_requisito)
+
+
+def montarCatalogo(classe: type, n_cursos: int, n_unidades: int) -> list[list]:
+    '''
+    Função que monta um catálogo sintético com a classe informada.
+
+    Parâmetros:
+    - classe (type): Classe usada para as unidades curriculares.
+    - n_cursos (int): Número de cursos.
+    - n_unidades (int): Número de UCs por curso.
+
+    Retorno:
+    - (list[list]): Matrizes curriculares dos cursos.
+    '''
+    catalogo = []
+
+    for curso in range(n_cursos):
+        matriz_curricular = []
+
+        for i in range(n_unidades):
+            # Metade das UCs é comum a todos os cursos. O nome é montado em tempo de execução, como no scraping.
+            nome = "".join(["Unidade Curricular ", str(i if i % 2 == 0 else curso * n_unidades + i)])
+            unidade_curricular = classe(nome, 68, [], i % 3 != 0)
+
+            if i > 0:
+                unidade_curricular.add_pre_requisito(matriz_curricular[i - 1])
+
+            matriz_curricular.append(unidade_curricular)
+
+        catalogo.append(matriz_curricular)
+
+    return catalogo
+
+
+def medirMemoria(classe: type, n_cursos: int, n_unidades: int) -> int:
+    '''
+    Função que mede a memória alocada para montar o catálogo com a classe informada.
+
+    Parâmetros:
+    - classe (type): Classe usada para as unidades curriculares.
+    - n_cursos (int): Número de cursos.
+    - n_unidades (int): Número de UCs por curso.
+
+    Retorno:
+    - (int): Bytes alocados e ainda vivos ao final da montagem.
+    '''
+    tracemalloc.start()
+    catalogo = montarCatalogo(classe, n_cursos, n_unidades)
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del catalogo
+    return memoria
+
+
+def main():
+    n_cursos, n_unidades = 200, 80
+
+    antiga = medirMemoria(UnidadeCurricularAntiga, n_cursos, n_unidades)
+    atual = medirMemoria(UnidadeCurricular, n_cursos, n_unidades)
+    total = n_cursos * n_unidades
+
+    print(f"{total} unidades curriculares ({n_cursos} cursos x {n_unidades} UCs)")
+    print(f"{'antiga':>8}: {antiga / 1024:>10.1f} KiB ({antiga / total:.0f} B/UC)")
+    print(f"{'atual':>8}: {atual / 1024:>10.1f} KiB ({atual / total:.0f} B/UC)")
+    print(f"{'redução':>8}: {100 * (1 - atual / antiga):>9.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# Imports de sistema
+import time
+from importlib.util import find_spec
+from os import path
+
+# Imports de bibliotecas externas
+from bs4 import BeautifulSoup
+
+# Imports locais
+from src import ParserHTML
+from src.WebScraper import scrapeMatrizCurricular, scrapeNomeCurso
+
+
+'''
+Benchmark do parsing das páginas de curso, sobre as páginas salvas em benchmarks/fixtures. Compara o parsing da
+página inteira com o html.parser (comportamento antigo) com o parsing restrito ao elemento procurado, com o
+html.parser e com o lxml direto (se estiver instalado).
+
+As fixtures foram geradas com benchmarks/gerador.py (renderizarPaginaCurso/renderizarPaginaMatriz).
+
+Como rodar (a partir da raiz do repositório):
+    ~$ python3 -m benchmarks.bench_parser
+'''
+
+FIXTURES = path.join(path.dirname(__file__), "fixtures")
+
+
+def carregarFixture(nome: str) -> bytes:
+    '''
+    Função que lê uma página salva em benchmarks/fixtures.
+
+    Parâmetros:
+    - nome (str): Nome do arquivo.
+
+    Retorno:
+    - (bytes): Conteúdo da página.
+    '''
+    with open(path.join(FIXTURES, nome), "rb") as arquivo:
+        return arquivo.read()
+
+
+def medir(funcao, repeticoes: int = 20) -> float:
+    '''
+    Função que mede o tempo médio de uma chamada, em milissegundos.
+
+    Parâmetros:
+    - funcao (Callable): Função sem argumentos a ser medida.
+    - repeticoes (int): Número de repetições.
+
+    Retorno:
+    - (float): Tempo médio por chamada.
+    '''
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000
+
+
+def main():
+    pagina_curso = carregarFixture("view_sintetico.html")
+    pagina_matriz = carregarFixture("prerequisito_sintetico.html")
+
+    antigo = medir(lambda: (
+        BeautifulSoup(pagina_curso, "html.parser").find("small"),
+        BeautifulSoup(pagina_matriz, "html.parser").find("tbody"),
+    ))
+    print(f"{'página inteira (html.parser)':<32} {antigo:>8.2f} ms")
+
+    parsers = ["html.parser"]
+    if find_spec("lxml") is not None:
+        parsers.append("lxml")
+    else:
+        print("lxml não instalado, medindo apenas o html.parser")
+
+    parser_original = ParserHTML.PARSER
+
+    for parser in parsers:
+        ParserHTML.configurarParser(parser)
+        tempo = medir(lambda: (ParserHTML.extrairTexto(pagina_curso, "small"), ParserHTML.extrairLinhas(pagina_matriz, "tbody")))
+        print(f"{f'só o elemento ({parser})':<32} {tempo:>8.2f} ms ({antigo / tempo:.1f}x)")
+
+        tempo = medir(lambda: (scrapeNomeCurso(1905, pagina_curso), scrapeMatrizCurricular(1905, pagina_matriz)))
+        print(f"{f'scrape completo ({parser})':<32} {tempo:>8.2f} ms")
+
+    ParserHTML.configurarParser(parser_original)
+
+
+if __name__ == "__main__":
+    main()
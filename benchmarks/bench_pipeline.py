@@ -0,0 +1,74 @@
+# Imports de sistema
+import argparse
+import multiprocessing
+import os
+import time
+
+# Imports locais
+from benchmarks.site_local import SiteLocal
+from src import WebScraper
+
+
+'''
+Benchmark da carga em lote de cursos com threads (findCursos) e com o pipeline de rede e processos
+(findCursosProcessos). O site local roda em um processo separado, para não disputar o GIL com o processo medido, e
+cada configuração carrega todos os cursos, sem cache. O ganho do pipeline cresce com o número de núcleos: com um
+único núcleo, os processos só acrescentam o custo de criá-los e de serializar as páginas e os registros.
+
+Como rodar (a partir da raiz do repositório):
+    ~$ python3 -m benchmarks.bench_pipeline --cursos 200 --unidades 150
+'''
+
+
+def servirSite(n_cursos: int, n_unidades: int, latencia: float, enderecos: "multiprocessing.Queue", parar: "multiprocessing.Event") -> None:
+    '''
+    Função executada no processo do site local: inicia o servidor, informa o endereço e espera o fim do benchmark.
+    '''
+    site = SiteLocal(range(1, n_cursos + 1), n_unidades=n_unidades, latencia=latencia)
+    site.iniciar()
+    enderecos.put(site.url)
+    parar.wait()
+    site.parar()
+
+
+def medir(nome: str, cursos) -> None:
+    '''
+    Função que consome o iterador de cursos e imprime o tempo total e a vazão.
+    '''
+    inicio = time.perf_counter()
+    resultados = list(cursos)
+    duracao = time.perf_counter() - inicio
+
+    erros = sum(isinstance(curso, Exception) for _, curso in resultados)
+    print(f"{nome:<28} {duracao:8.2f}s  {len(resultados) / duracao:8.1f} cursos/s  ({erros} erros)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Carga em lote com threads e com o pipeline de processos.")
+    parser.add_argument("--cursos", type=int, default=200, help="Número de cursos do site local.")
+    parser.add_argument("--unidades", type=int, default=150, help="Número de UCs de cada curso.")
+    parser.add_argument("--latencia", type=float, default=0.0, help="Latência de cada resposta do site, em segundos.")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="Número de downloads ao mesmo tempo.")
+    args = parser.parse_args()
+
+    contexto = multiprocessing.get_context("spawn")
+    enderecos, parar = contexto.Queue(), contexto.Event()
+    processo = contexto.Process(target=servirSite, args=(args.cursos, args.unidades, args.latencia, enderecos, parar))
+    processo.start()
+
+    try:
+        WebScraper.configurarSessao(pool_size=args.max_concurrency, url_base=enderecos.get(timeout=60))
+        codigos = range(1, args.cursos + 1)
+
+        print(f"{args.cursos} cursos de {args.unidades} UCs, {os.cpu_count()} núcleos")
+        medir("threads", WebScraper.findCursos(codigos, args.max_concurrency))
+
+        for processos in sorted({1, 2, os.cpu_count() or 1}):
+            medir(f"pipeline, {processos} processo(s)", WebScraper.findCursosProcessos(codigos, args.max_concurrency, processos))
+    finally:
+        parar.set()
+        processo.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Imports de sistema
+import time
+from typing import TYPE_CHECKING
+
+# Imports locais
+from benchmarks.gerador import gerarCurso
+from src.Estudante import Estudante
+from src.Planejador import planejarSemestres
+
+if TYPE_CHECKING:
+    from src.UnidadeCurricular import UnidadeCurricular
+
+
+'''
+Benchmark do planejador de semestres em currículos sintéticos de tamanhos crescentes. Para cada tamanho mostra o
+tempo do planejamento, o número de semestres do plano e o limite inferior (caminho crítico ou carga total dividida
+pela carga por semestre), que dá uma ideia da qualidade da heurística.
+
+Como rodar (a partir da raiz do repositório):
+    ~$ python3 -m benchmarks.bench_planejador
+'''
+
+
+def limiteInferior(semestres: list[list["UnidadeCurricular"]], carga_maxima: int) -> int:
+    '''
+    Função que calcula um limite inferior para o número de semestres do plano: o maior entre a carga total dividida
+    pela carga por semestre e a maior cadeia de pré-requisitos entre as UCs do plano.
+
+    Parâmetros:
+    - semestres (list[list[UnidadeCurricular]]): Plano de semestres.
+    - carga_maxima (int): Carga horária máxima por semestre.
+
+    Retorno:
+    - (int): Limite inferior.
+    '''
+    planejadas = [unidade_curricular for semestre in semestres for unidade_curricular in semestre]
+    horas = sum(unidade_curricular.carga_horaria for unidade_curricular in planejadas)
+
+    cadeia = {}
+    for unidade_curricular in planejadas:
+        cadeia[unidade_curricular] = 1 + max((cadeia[p] for p in unidade_curricular.pre_requisitos if p in cadeia), default=0)
+
+    return max(-(-horas // carga_maxima), max(cadeia.values(), default=0))
+
+
+def main():
+    carga_maxima, horas_optativas = 408, 340
+
+    print(f"{'UCs':>6} {'tempo (ms)':>11} {'semestres':>10} {'limite inferior':>16}")
+
+    for n_unidades in (60, 120, 300, 1000, 3000):
+        curso = gerarCurso(n_unidades)
+        estudante = Estudante("Estudante", curso, [])
+        curso.grafo.fechamento
+
+        inicio = time.perf_counter()
+        semestres = planejarSemestres(estudante, carga_maxima, horas_optativas)
+        tempo = (time.perf_counter() - inicio) * 1000
+
+        print(f"{n_unidades:>6} {tempo:>11.1f} {len(semestres):>10} {limiteInferior(semestres, carga_maxima):>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Imports de sistema
+import tempfile
+import time
+from os import path
+
+# Imports locais
+from benchmarks.site_local import SiteLocal
+from src import Rastreador, WebScraper
+from src.CacheCursos import CacheCursos
+
+
+'''
+Benchmark do rastreador de cursos (src/Rastreador.py), contra o site local de benchmarks/site_local.py. Mede o
+tempo, o número de requisições e os bytes transferidos de uma carga completa do catálogo e de atualizações
+seguintes: sem alterações (com e sem ETag no site) e com parte das matrizes alteradas.
+
+Como rodar (a partir da raiz do repositório):
+    ~$ python3 -m benchmarks.bench_rastreador
+'''
+
+N_CURSOS = 200
+N_UNIDADES = 80
+PROPORCAO_ALTERADOS = 0.1
+
+
+def medir(rotulo: str, site: "SiteLocal", cache: "CacheCursos", codigos: list[int] = None) -> None:
+    '''
+    Função que executa uma atualização do catálogo e imprime o seu custo.
+    '''
+    requisicoes, transferidos = site.requisicoes, site.bytes
+
+    inicio = time.perf_counter()
+    resumo = Rastreador.atualizarCatalogo(cache, codigos)
+    tempo = time.perf_counter() - inicio
+
+    print(f"{rotulo:<32} {tempo:7.2f}s {site.requisicoes - requisicoes:6d} req {(site.bytes - transferidos) / 1024:9.0f} KiB  {resumo}")
+
+
+def main() -> None:
+    for etag in (True, False):
+        site = SiteLocal(range(1, N_CURSOS + 1), N_UNIDADES, etag=etag).iniciar()
+        WebScraper.configurarSessao(url_base=site.url)
+
+        with tempfile.TemporaryDirectory() as diretorio:
+            cache = CacheCursos(path.join(diretorio, "cursos.sqlite3"), ttl=0)
+
+            print(f"Site {'com' if etag else 'sem'} ETag, {N_CURSOS} cursos de {N_UNIDADES} UCs:")
+            medir("carga completa", site, cache, Rastreador.listarCodigos())
+            medir("atualização sem alterações", site, cache)
+
+            alterados = range(1, N_CURSOS + 1, int(1 / PROPORCAO_ALTERADOS))
+            for codigo in alterados:
+                pagina = site.paginas[("prerequisito", codigo)]
+                site.alterar(codigo, pagina.replace(b"Unidade Curricular 1<", b"Unidade Curricular Um<", 1))
+
+            medir(f"atualização com {len(alterados)} alterados", site, cache)
+            cache.fechar()
+
+        site.parar()
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Imports de sistema
+import tempfile
+import time
+from os import path
+
+# Imports locais
+from benchmarks.gerador import gerarCurso
+from src.CacheCursos import CacheCursos
+from src.Snapshot import Snapshot
+
+
+'''
+Benchmark do snapshot do catálogo (src/Snapshot.py). Compara o tempo para ter um curso pronto para consulta a
+partir de um processo novo: carregando o catálogo inteiro do cache SQLite, abrindo o snapshot e criando só o curso
+pedido, e abrindo o snapshot e criando todos os cursos.
+
+Como rodar (a partir da raiz do repositório):
+    ~$ python3 -m benchmarks.bench_snapshot
+'''
+
+N_CURSOS = 1000
+N_UNIDADES = 80
+
+
+def main() -> None:
+    cursos = [gerarCurso(N_UNIDADES, codigo=codigo, semente=codigo) for codigo in range(1, N_CURSOS + 1)]
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        cache = CacheCursos(path.join(diretorio, "cursos.sqlite3"), max_cursos=N_CURSOS)
+        for curso in cursos:
+            cache.salvar(curso)
+
+        caminho = path.join(diretorio, "catalogo.snapshot")
+        tamanho = Snapshot.escrever(cursos, caminho)
+        print(f"{N_CURSOS} cursos de {N_UNIDADES} UCs, snapshot de {tamanho / 1024:.0f} KiB")
+
+        inicio = time.perf_counter()
+        catalogo = {curso.id: curso for curso in cache.cursos()}
+        print(f"{'cache SQLite, catálogo inteiro':<36} {(time.perf_counter() - inicio) * 1000:9.2f}ms")
+
+        inicio = time.perf_counter()
+        with Snapshot(caminho) as snapshot:
+            aberto = time.perf_counter()
+            snapshot.curso(N_CURSOS // 2)
+            fim = time.perf_counter()
+        print(f"{'snapshot, abertura':<36} {(aberto - inicio) * 1000:9.2f}ms")
+        print(f"{'snapshot, abertura + um curso':<36} {(fim - inicio) * 1000:9.2f}ms")
+
+        inicio = time.perf_counter()
+        with Snapshot(caminho) as snapshot:
+            for codigo in snapshot.codigos():
+                snapshot.curso(codigo)
+        print(f"{'snapshot, catálogo inteiro':<36} {(time.perf_counter() - inicio) * 1000:9.2f}ms")
+
+        cache.fechar()
+
+
+if __name__ == "__main__":
+    main()
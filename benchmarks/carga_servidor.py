@@ -0,0 +1,133 @@
+# Imports de sistema
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+
+# Imports locais
+from benchmarks.site_local import SiteLocal
+from src import WebScraper
+from src.Servidor import ServidorElegibilidade
+
+
+'''
+Teste de carga do servidor de elegibilidade (src/Servidor.py). Um site local (benchmarks/site_local.py) faz o papel
+do site da UFMS, com uma latência artificial, e o servidor roda em uma thread com o seu próprio event loop. Várias
+conexões keep-alive fazem consultas de optativas sobre cursos sorteados; no começo todas pedem cursos que ainda não
+estão em memória, o que mostra a união das buscas simultâneas (o site deve receber só duas requisições por curso).
+
+Ao final são impressos a vazão e os percentis p50/p99 da latência, separados entre o começo frio e o resto.
+
+Como rodar (a partir da raiz do repositório):
+    ~$ python3 -m benchmarks.carga_servidor --conexoes 64 --requisicoes 20000
+'''
+
+
+def percentil(valores: list[float], p: float) -> float:
+    '''
+    Função que retorna o percentil p (entre 0 e 100) de uma lista de valores.
+
+    Parâmetros:
+    - valores (list[float]): Valores.
+    - p (float): Percentil.
+
+    Retorno:
+    - (float): Valor do percentil.
+    '''
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(len(valores) * p / 100))]
+
+
+async def cliente(porta: int, pedidos: list[tuple[int, list[int]]], latencias: list[float]) -> None:
+    '''
+    Função que envia os pedidos em sequência por uma conexão keep-alive, guardando a latência de cada um.
+    '''
+    leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+
+    for codigo, cursadas in pedidos:
+        corpo = json.dumps({"curso": codigo, "cursadas": cursadas}).encode("utf-8")
+        inicio = time.perf_counter()
+
+        escritor.write(
+            f"POST /elegibilidade HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(corpo)}\r\n\r\n".encode("latin-1") + corpo
+        )
+        await escritor.drain()
+
+        status = await leitor.readline()
+        tamanho = 0
+        while True:
+            linha = await leitor.readline()
+            if linha == b"\r\n":
+                break
+            if linha.lower().startswith(b"content-length:"):
+                tamanho = int(linha.split(b":")[1])
+        await leitor.readexactly(tamanho)
+
+        latencias.append(time.perf_counter() - inicio)
+
+        if not status.startswith(b"HTTP/1.1 200"):
+            raise RuntimeError(status.decode("latin-1"))
+
+    escritor.close()
+
+
+async def carga(porta: int, n_cursos: int, n_unidades: int, conexoes: int, requisicoes: int, semente: int) -> tuple[list, list, float]:
+    '''
+    Função que distribui as requisições entre as conexões e as executa ao mesmo tempo.
+    '''
+    aleatorio = random.Random(semente)
+    pedidos = [
+        (aleatorio.randint(1, n_cursos), aleatorio.sample(range(n_unidades), aleatorio.randint(0, n_unidades // 2)))
+        for _ in range(requisicoes)
+    ]
+
+    # Primeira rodada: uma requisição por conexão, com todos os cursos ainda fora da memória
+    frias = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(cliente(porta, [pedidos[i]], frias) for i in range(conexoes)))
+
+    quentes = []
+    await asyncio.gather(*(cliente(porta, pedidos[conexoes + i::conexoes], quentes) for i in range(conexoes)))
+
+    return frias, quentes, time.perf_counter() - inicio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Teste de carga do servidor de elegibilidade.")
+    parser.add_argument("--cursos", type=int, default=16)
+    parser.add_argument("--unidades", type=int, default=80)
+    parser.add_argument("--conexoes", type=int, default=32)
+    parser.add_argument("--requisicoes", type=int, default=5000)
+    parser.add_argument("--latencia", type=float, default=0.05, help="Latência do site local, em segundos.")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    site = SiteLocal(range(1, args.cursos + 1), args.unidades, args.latencia).iniciar()
+    WebScraper.configurarSessao(url_base=site.url)
+
+    # O servidor roda no event loop de outra thread, para não disputar o loop com os clientes
+    loop = asyncio.new_event_loop()
+    servidor = ServidorElegibilidade()
+    porta = asyncio.run_coroutine_threadsafe(servidor.iniciar(porta=0), loop)
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    porta = porta.result().sockets[0].getsockname()[1]
+
+    frias, quentes, tempo = asyncio.run(
+        carga(porta, args.cursos, args.unidades, args.conexoes, args.requisicoes, args.semente)
+    )
+
+    print(f"{len(frias) + len(quentes)} requisições em {tempo:.2f}s ({(len(frias) + len(quentes)) / tempo:.0f} req/s), {args.conexoes} conexões")
+    print(f"Requisições ao site local: {site.requisicoes} ({args.cursos} cursos)")
+
+    for rotulo, latencias in (("frias", frias), ("quentes", quentes)):
+        print(f"{rotulo:>8}: p50 {percentil(latencias, 50) * 1000:8.2f}ms  p99 {percentil(latencias, 99) * 1000:8.2f}ms")
+
+    loop.call_soon_threadsafe(loop.stop)
+    site.parar()
+
+
+if __name__ == "__main__":
+    main()
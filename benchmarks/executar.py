@@ -0,0 +1,199 @@
+# Imports de sistema
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from os import path
+
+# Imports locais
+from benchmarks.gerador import gerarCurso, gerarCursadas, renderizarPaginaMatriz
+from src import ParserHTML
+from src.Curso import Curso
+from src.UnidadeCurricular import UnidadeCurricular
+from src.WebScraper import filtrarCargaHoraria, filtrarLinha, filtrarNome, filtrarPreRequisitos, isObrigatoria, scrapeMatrizCurricular, vincularPreRequisitos
+
+
+'''
+Conjunto de benchmarks dos caminhos mais usados do programa, com resultado em JSON para comparar commits.
+
+Cada caso é medido com timeit: o número de chamadas por repetição é calibrado para durar pelo menos 0,2s, e são
+guardados o melhor tempo e a mediana por chamada (em microssegundos) entre as repetições. Os casos usam a fixture
+salva em benchmarks/fixtures e um curso sintético (benchmarks/gerador.py) com o número de UCs e de estudantes
+informado, sempre com a mesma semente.
+
+Casos:
+- filtrar_nome: filtrarNome sobre a primeira célula de todas as linhas da matriz sintética.
+- parse_fixture: extração das linhas da tabela da fixture (ParserHTML.extrairLinhas).
+- scrape_fixture / scrape_sintetico: scrapeMatrizCurricular completo (parsing, criação das UCs e vinculação).
+- vinculacao: criação das UCs sem validação seguida de vincularPreRequisitos.
+- construcao_validada / construcao_confiavel: criação das UCs e do Curso pelos construtores que validam e pelos
+  construtores de_confianca.
+- elegibilidade_individual / elegibilidade_lote: optativas cursáveis de todos os estudantes, um por um e em lote.
+- busca_aproximada: 20 nomes digitados de forma aproximada procurados na matriz sintética (IndiceNomes já montado).
+
+Como rodar (a partir da raiz do repositório):
+    ~$ python3 -m benchmarks.executar --saida antes.json
+    ~$ python3 -m benchmarks.executar --saida depois.json --comparar antes.json
+'''
+
+FIXTURES = path.join(path.dirname(__file__), "fixtures")
+
+
+def commitAtual() -> str:
+    '''
+    Função que retorna o hash do commit atual do repositório, ou None se não for possível obtê-lo.
+    '''
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, cwd=path.dirname(__file__)
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def prepararCasos(n_unidades: int, n_estudantes: int) -> dict:
+    '''
+    Função que prepara os dados e devolve os casos de benchmark, como funções sem argumentos.
+
+    Parâmetros:
+    - n_unidades (int): Número de UCs do curso sintético.
+    - n_estudantes (int): Número de estudantes das consultas de elegibilidade.
+
+    Retorno:
+    - casos (dict[str, Callable]): Casos, pelo nome.
+    '''
+    with open(path.join(FIXTURES, "prerequisito_sintetico.html"), "rb") as arquivo:
+        pagina_fixture = arquivo.read()
+
+    curso = gerarCurso(n_unidades, codigo=1, semente=0)
+    pagina_sintetica = renderizarPaginaMatriz(curso).encode("utf-8")
+
+    linhas = [td for td in ParserHTML.extrairLinhas(pagina_sintetica) if len(td) > 2]
+    celulas_nome = [td[0] for td in linhas]
+    dados = [(filtrarNome(td[0]), filtrarCargaHoraria(td[1].strip()), isObrigatoria(td[0])) for td in linhas]
+    nomes_pre_requisitos = [filtrarPreRequisitos(td[2]) for td in linhas]
+
+    lote = gerarCursadas(curso, n_estudantes, semente=0)
+
+    indice_nomes = curso.grafo.indice_nomes
+    consultas = [f"unid. curric. {i}" if i % 2 else f"Unidade Curicular {i}" for i in range(0, n_unidades, max(1, n_unidades // 20))]
+
+    def vinculacao():
+        matriz = [UnidadeCurricular.de_confianca(nome, carga, (), obrigatoria) for nome, carga, obrigatoria in dados]
+        vincularPreRequisitos(matriz, nomes_pre_requisitos)
+
+    def construcaoValidada():
+        return Curso(1, "Curso Sintético", [filtrarLinha(td)[0] for td in linhas])
+
+    def construcaoConfiavel():
+        matriz = [UnidadeCurricular.de_confianca(nome, carga, (), obrigatoria) for nome, carga, obrigatoria in dados]
+        return Curso.de_confianca(1, "Curso Sintético", matriz)
+
+    return {
+        "filtrar_nome": lambda: [filtrarNome(celula) for celula in celulas_nome],
+        "parse_fixture": lambda: ParserHTML.extrairLinhas(pagina_fixture),
+        "scrape_fixture": lambda: scrapeMatrizCurricular(0, pagina_fixture),
+        "scrape_sintetico": lambda: scrapeMatrizCurricular(0, pagina_sintetica),
+        "vinculacao": vinculacao,
+        "construcao_validada": construcaoValidada,
+        "construcao_confiavel": construcaoConfiavel,
+        "elegibilidade_individual": lambda: [curso.optativas_cursaveis(cursadas) for cursadas in lote],
+        "elegibilidade_lote": lambda: curso.optativas_cursaveis_lote(lote),
+        "busca_aproximada": lambda: [indice_nomes.buscar(consulta) for consulta in consultas],
+    }
+
+
+def medir(funcao, repeticoes: int) -> dict:
+    '''
+    Função que mede um caso com timeit.
+
+    Parâmetros:
+    - funcao (Callable): Caso a ser medido.
+    - repeticoes (int): Número de repetições.
+
+    Retorno:
+    - (dict): Melhor tempo e mediana por chamada (em microssegundos), chamadas por repetição e repetições.
+    '''
+    temporizador = timeit.Timer(funcao)
+    numero, _ = temporizador.autorange()
+    numero = max(1, numero)
+
+    tempos = [tempo / numero * 1e6 for tempo in temporizador.repeat(repeat=repeticoes, number=numero)]
+
+    return {"melhor_us": min(tempos), "mediana_us": statistics.median(tempos), "numero": numero, "repeticoes": repeticoes}
+
+
+def comparar(atual: dict, base: dict, limite: float) -> list[str]:
+    '''
+    Função que imprime a razão entre os tempos atuais e os de uma execução anterior, e retorna os casos que ficaram
+    mais lentos que o limite. É usado o melhor tempo, que é o menos sensível a ruído.
+    '''
+    regressoes = []
+
+    print(f"\nComparação com {base['metadados'].get('commit')} (atual / base):")
+
+    for nome, resultado in atual["casos"].items():
+        anterior = base["casos"].get(nome)
+        if anterior is None:
+            print(f"  {nome:<26} (novo)")
+            continue
+
+        razao = resultado["melhor_us"] / anterior["melhor_us"]
+        marca = " <- regressão" if razao > limite else ""
+        print(f"  {nome:<26} {razao:6.2f}x{marca}")
+
+        if razao > limite:
+            regressoes.append(nome)
+
+    return regressoes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks dos caminhos mais usados do verificador.")
+    parser.add_argument("--unidades", type=int, default=300, help="Número de UCs do curso sintético.")
+    parser.add_argument("--estudantes", type=int, default=500, help="Número de estudantes nas consultas.")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Número de repetições de cada caso.")
+    parser.add_argument("--casos", nargs="+", help="Casos a executar (padrão: todos).")
+    parser.add_argument("--saida", help="Arquivo JSON onde os resultados são gravados.")
+    parser.add_argument("--comparar", help="Arquivo JSON de uma execução anterior para comparação.")
+    parser.add_argument("--limite", type=float, default=1.2, help="Razão a partir da qual um caso é uma regressão.")
+    args = parser.parse_args()
+
+    casos = prepararCasos(args.unidades, args.estudantes)
+    selecionados = args.casos if args.casos else list(casos)
+
+    resultado = {
+        "metadados": {
+            "commit": commitAtual(),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "parser": ParserHTML.PARSER,
+            "unidades": args.unidades,
+            "estudantes": args.estudantes,
+        },
+        "casos": {},
+    }
+
+    for nome in selecionados:
+        resultado["casos"][nome] = medir(casos[nome], args.repeticoes)
+        print(f"{nome:<26} {resultado['casos'][nome]['melhor_us']:12.1f}us  (mediana {resultado['casos'][nome]['mediana_us']:.1f}us)")
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, ensure_ascii=False, indent=2)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as arquivo:
+            regressoes = comparar(resultado, json.load(arquivo), args.limite)
+
+        if regressoes:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+# Imports de sistema
+import html
+import random
+
+# Imports locais
+from src.Curso import Curso
+from src.UnidadeCurricular import UnidadeCurricular
+
+
+'''
+Este arquivo contém o gerador de currículos sintéticos usado pelos benchmarks. As matrizes geradas seguem o
+formato das matrizes da UFMS: UCs obrigatórias e optativas com carga horária múltipla de 17h, em que cada UC
+só depende de UCs que aparecem antes dela na matriz (então o grafo de pré-requisitos nunca tem ciclos).
+'''
+
+
+def gerarMatriz(n_unidades: int, proporcao_optativas: float = 0.4, max_pre_requisitos: int = 3, semente: int = 0) -> list["UnidadeCurricular"]:
+    '''
+    Função que gera uma matriz curricular sintética.
+
+    Parâmetros:
+    - n_unidades (int): Número de unidades curriculares.
+    - proporcao_optativas (float): Proporção de UCs optativas.
+    - max_pre_requisitos (int): Número máximo de pré-requisitos por UC.
+    - semente (int): Semente do gerador aleatório.
+
+    Retorno:
+    - matriz_curricular (list[UnidadeCurricular]): Matriz gerada.
+    '''
+    aleatorio = random.Random(semente)
+    matriz_curricular = []
+
+    for i in range(n_unidades):
+        obrigatoria = aleatorio.random() >= proporcao_optativas
+        unidade_curricular = UnidadeCurricular(f"Unidade Curricular {i}", 17 * aleatorio.choice((2, 3, 4)), [], obrigatoria)
+
+        if i > 0:
+            quantidade = aleatorio.randint(0, min(max_pre_requisitos, i))
+            for pre_requisito in aleatorio.sample(matriz_curricular[max(0, i - 40):], min(quantidade, len(matriz_curricular[max(0, i - 40):]))):
+                unidade_curricular.add_pre_requisito(pre_requisito)
+
+        matriz_curricular.append(unidade_curricular)
+
+    return matriz_curricular
+
+
+def gerarCurso(n_unidades: int, codigo: int = 1, semente: int = 0) -> "Curso":
+    '''
+    Função que gera um curso sintético.
+
+    Parâmetros:
+    - n_unidades (int): Número de unidades curriculares.
+    - codigo (int): Código do curso.
+    - semente (int): Semente do gerador aleatório.
+
+    Retorno:
+    - (Curso): Curso gerado.
+    '''
+    return Curso(codigo, f"Curso Sintético {codigo}", gerarMatriz(n_unidades, semente=semente))
+
+
+def gerarCursadas(curso: "Curso", n_estudantes: int, semente: int = 0) -> list[list["UnidadeCurricular"]]:
+    '''
+    Função que gera, para cada estudante, uma lista de UCs cursadas que respeita os pré-requisitos: cada estudante
+    cursou um prefixo aleatório da matriz, com algumas optativas puladas.
+
+    Parâmetros:
+    - curso (Curso): Curso dos estudantes.
+    - n_estudantes (int): Número de estudantes.
+    - semente (int): Semente do gerador aleatório.
+
+    Retorno:
+    - (list[list[UnidadeCurricular]]): Unidades cursadas por cada estudante.
+    '''
+    aleatorio = random.Random(semente)
+    matriz_curricular = curso.matriz_curricular
+    lote = []
+
+    for _ in range(n_estudantes):
+        cursadas = set()
+        for unidade_curricular in matriz_curricular[:aleatorio.randint(0, len(matriz_curricular))]:
+            if unidade_curricular.obrigatoria or aleatorio.random() < 0.5:
+                if all(pre_requisito in cursadas for pre_requisito in unidade_curricular.pre_requisitos):
+                    cursadas.add(unidade_curricular)
+
+        lote.append([unidade_curricular for unidade_curricular in matriz_curricular if unidade_curricular in cursadas])
+
+    return lote
+
+
+def _paginaCompleta(titulo: str, conteudo: str) -> str:
+    '''
+    Função que envolve o conteúdo com cabeçalho, menu, scripts e rodapé, para que a página tenha um tamanho parecido
+    com o das páginas reais do site de ensino.
+    '''
+    menu = "".join(f'<li class="nav-item"><a class="nav-link" href="/cursos/view/{i}">Curso {i}</a></li>' for i in range(300))
+    script = "<script>" + "var x = 0;\n" * 800 + "</script>"
+    rodape = "<footer>" + "<p>Universidade Federal de Mato Grosso do Sul</p>" * 100 + "</footer>"
+
+    return (
+        f"<!DOCTYPE html><html><head><title>{html.escape(titulo)}</title>{script}</head>"
+        f'<body><nav><ul class="nav">{menu}</ul></nav><main>{conteudo}</main>{rodape}</body></html>'
+    )
+
+
+def renderizarPaginaCurso(curso: "Curso") -> str:
+    '''
+    Função que gera o HTML da página /cursos/view/{codigo} de um curso.
+
+    Parâmetros:
+    - curso (Curso): Curso da página.
+
+    Retorno:
+    - (str): HTML da página.
+    '''
+    conteudo = f"<h1>Curso <small>Curso {curso.id} {html.escape(curso.nome)}</small></h1>"
+    return _paginaCompleta(curso.nome, conteudo)
+
+
+def renderizarPaginaMatriz(curso: "Curso") -> str:
+    '''
+    Função que gera o HTML da página /cursos/prerequisito/{codigo} de um curso, no formato da tabela da UFMS:
+    nome com (OBR)/(OPT), carga horária terminada em 'h' e pré-requisitos separados por <br>, com linhas vazias
+    entre as UCs.
+
+    Parâmetros:
+    - curso (Curso): Curso da página.
+
+    Retorno:
+    - (str): HTML da página.
+    '''
+    linhas = []
+
+    for unidade_curricular in curso.matriz_curricular:
+        tipo = "(OBR)" if unidade_curricular.obrigatoria else "(OPT)"
+        pre_requisitos = "<br>".join(html.escape(pre_requisito.nome) for pre_requisito in unidade_curricular.pre_requisitos)
+
+        linhas.append(
+            f"<tr><td>{tipo} {html.escape(unidade_curricular.nome)}</td><td>{unidade_curricular.carga_horaria}h</td>"
+            f"<td>{pre_requisitos}</td></tr><tr><td></td></tr>"
+        )
+
+    conteudo = f'<table class="table"><thead><tr><th>Componente</th><th>CH</th><th>Pré-requisito</th></tr></thead><tbody>{"".join(linhas)}</tbody></table>'
+    return _paginaCompleta(curso.nome, conteudo)
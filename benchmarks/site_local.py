@@ -0,0 +1,158 @@
+# Imports de sistema
+import hashlib
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Imports locais
+from benchmarks.gerador import gerarCurso, renderizarPaginaCurso, renderizarPaginaMatriz
+
+
+'''
+Este arquivo contém um substituto local do site da UFMS, usado pelos benchmarks que precisam de HTTP. Ele serve as
+páginas /cursos/view/{codigo} e /cursos/prerequisito/{codigo} de cursos sintéticos (benchmarks/gerador.py), com ETag
+na página da matriz (se etag=True), uma listagem em /cursos com os links de todos os cursos, e responde 404 para
+códigos que não existem. Uma latência artificial pode ser configurada para
+imitar o tempo de resposta do site real.
+
+Uso:
+    site = SiteLocal(range(1, 51), n_unidades=80)
+    site.iniciar()
+    WebScraper.configurarSessao(url_base=site.url)
+'''
+
+
+class SiteLocal:
+    '''
+    Servidor HTTP com as páginas de cursos sintéticos, rodando em uma thread.
+    '''
+
+
+    def __init__(self, codigos, n_unidades: int = 60, latencia: float = 0.0, etag: bool = True) -> None:
+        '''
+        Construtor da classe SiteLocal.
+
+        Parâmetros:
+        - codigos (Iterable[int]): Códigos dos cursos que existem no site.
+        - n_unidades (int): Número de UCs de cada curso.
+        - latencia (float): Tempo, em segundos, esperado antes de cada resposta.
+        - etag (bool): Se a página da matriz é servida com ETag (e aceita requisições condicionais).
+
+        Retorno:
+        - None.
+        '''
+        codigos = list(codigos)
+
+        self.paginas = {}
+        for codigo in codigos:
+            curso = gerarCurso(n_unidades, codigo=codigo, semente=codigo)
+            matriz = renderizarPaginaMatriz(curso).encode("utf-8")
+
+            self.paginas[("view", codigo)] = renderizarPaginaCurso(curso).encode("utf-8")
+            self.paginas[("prerequisito", codigo)] = matriz
+            self.paginas[("etag", codigo)] = '"' + hashlib.blake2b(matriz, digest_size=8).hexdigest() + '"'
+
+        self.listagem = "".join(f'<a href="/cursos/view/{codigo}">Curso {codigo}</a>' for codigo in codigos).encode("utf-8")
+
+        self.latencia    = latencia
+        self.etag        = etag
+        self.requisicoes = 0
+        self.bytes       = 0
+
+        self._lock     = threading.Lock()
+        self._servidor = None
+
+
+    @property
+    def url(self) -> str:
+        '''
+        Propriedade com a URL base do site, no formato de WebScraper.URL_BASE.
+        '''
+        host, porta = self._servidor.server_address[:2]
+        return f"http://{host}:{porta}"
+
+
+    def alterar(self, codigo: int, html: bytes) -> None:
+        '''
+        Método que troca a página da matriz de um curso, como se ela tivesse sido atualizada no site.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+        - html (bytes): Nova página.
+
+        Retorno:
+        - None.
+        '''
+        self.paginas[("prerequisito", codigo)] = html
+        self.paginas[("etag", codigo)] = '"' + hashlib.blake2b(html, digest_size=8).hexdigest() + '"'
+
+
+    def iniciar(self, porta: int = 0) -> "SiteLocal":
+        '''
+        Método que inicia o servidor em uma thread.
+
+        Parâmetros:
+        - porta (int): Porta do servidor (0 escolhe uma porta livre).
+
+        Retorno:
+        - (SiteLocal): O próprio site, para encadear com a construção.
+        '''
+        site = self
+
+        class Manipulador(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                if site.latencia > 0:
+                    time.sleep(site.latencia)
+
+                encontrado = re.fullmatch(r"/cursos/(view|prerequisito)/(\d+)", self.path)
+                chave = (encontrado.group(1), int(encontrado.group(2))) if encontrado else None
+                corpo = site.paginas.get(chave, b"")
+                etag = site.paginas.get(("etag", chave[1])) if site.etag and chave and chave[0] == "prerequisito" else None
+
+                if self.path.rstrip("/") == "/cursos":
+                    corpo = site.listagem
+                    self.send_response(200)
+                elif chave not in site.paginas:
+                    self.send_response(404)
+                elif etag is not None and self.headers.get("If-None-Match") == etag:
+                    corpo = b""
+                    self.send_response(304)
+                else:
+                    self.send_response(200)
+
+                if etag is not None:
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+                with site._lock:
+                    site.requisicoes += 1
+                    site.bytes += len(corpo)
+
+        self._servidor = ThreadingHTTPServer(("127.0.0.1", porta), Manipulador)
+        self._servidor.daemon_threads = True
+        threading.Thread(target=self._servidor.serve_forever, daemon=True).start()
+
+        return self
+
+
+    def parar(self) -> None:
+        '''
+        Método que para o servidor.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - None.
+        '''
+        self._servidor.shutdown()
+        self._servidor.server_close()
@@ -1,20 +1,345 @@
 # Imports de sistema
-from os import name, system, listdir as os_name
+import argparse
+import csv
+import json
+import sys
+from os import name, path, scandir
 
 # Imports locais
+from src import Instrumentacao
+from src.CatalogoUnidades import CatalogoUnidades
 from src.Curso import Curso
+from src.CursoException import CursoException
 from src.Estudante import Estudante
+from src.EstudanteException import EstudanteException
+from src.Normalizacao import normalizarNome
+from src.Perfil import EXTENSAO_BINARIA, EXTENSAO_JSON, carregarPerfil
+from src.Snapshot import Snapshot
 from src.UnidadeCurricular import UnidadeCurricular
 
+# O scraper (requests, lxml), o rastreador e o cache (sqlite3) são importados dentro das funções que os usam, para que
+# os comandos que não acessam o site, como abrir um perfil salvo ou consultar um snapshot, iniciem rápido.
+
+
+# Cursos já carregados nesta execução, indexados pelo código
+cursos = {}
+cache = None
+snapshot = None
+catalogo = CatalogoUnidades()
+
 
 def clear():
     '''
-    Função responsável por limpar o terminal/cmd independente do sistema operacional do usuário.
+    Função responsável por limpar o terminal/cmd independente do sistema operacional do usuário. A tela é limpa com
+    as sequências de escape ANSI, sem abrir um shell; no Windows o console precisa que elas sejam habilitadas antes.
+    '''
+    if not sys.stdout.isatty():
+        return
+
+    if name == "nt":
+        habilitarAnsiWindows()
+
+    sys.stdout.write("\033[2J\033[H")
+    sys.stdout.flush()
+
+
+def habilitarAnsiWindows():
+    '''
+    Função que habilita o processamento das sequências de escape ANSI no console do Windows
+    (ENABLE_VIRTUAL_TERMINAL_PROCESSING).
+    '''
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    saida = kernel32.GetStdHandle(-11)
+    modo = ctypes.c_uint32()
+
+    if kernel32.GetConsoleMode(saida, ctypes.byref(modo)):
+        kernel32.SetConsoleMode(saida, modo.value | 0x0004)
+
+
+def obterCurso(codigo: int) -> "Curso":
+    '''
+    Função que devolve o curso com o código informado, usando primeiro os cursos já carregados nesta execução,
+    depois o snapshot do catálogo (se houver) e o cache local, e só então o site da UFMS. Os cursos carregados são
+    registrados no catálogo de UCs, para que as UCs comuns entre eles sejam compartilhadas.
+    '''
+    global cache
+
+    if codigo not in cursos:
+        if snapshot is not None and codigo in snapshot:
+            cursos[codigo] = catalogo.registrar(snapshot.curso(codigo))
+            return cursos[codigo]
+
+        from src.CacheCursos import CacheCursos
+        from src.WebScraper import findCurso
+
+        if cache is None:
+            cache = CacheCursos()
+
+        cursos[codigo] = catalogo.registrar(findCurso(codigo, cache))
+
+    return cursos[codigo]
+
+
+def carregarPerfilArquivo():
+    '''
+    Função que carrega um perfil salvo em arquivo e mostra as optativas que o estudante pode cursar.
+    '''
+    caminho = input("Caminho do arquivo de perfil: ").strip()
+
+    try:
+        estudante = carregarPerfil(caminho, obterCurso)
+    except OSError:
+        print(f"[!] Não foi possível abrir o arquivo {caminho}.")
+        return
+    except (CursoException, EstudanteException) as erro:
+        print(f"[!] {erro.mensagem}")
+        return
+
+    print("")
+    estudante.printInfo()
+    print("")
+    print(f"{f' Optativas que podem ser cursadas ':*^50}")
+    for unidade_curricular in estudante.optativas_cursaveis():
+        print(f"{f'{unidade_curricular}':<50}")
+
+
+def expandirArquivos(caminhos: list[str]) -> list[str]:
+    '''
+    Função que troca cada diretório da lista pelos arquivos dentro dele, em ordem alfabética.
+    '''
+    arquivos = []
+
+    for caminho in caminhos:
+        if path.isdir(caminho):
+            arquivos.extend(sorted(entrada.path for entrada in scandir(caminho) if entrada.is_file()))
+        else:
+            arquivos.append(caminho)
+
+    return arquivos
+
+
+def lerCursadas(caminho: str) -> list[str]:
     '''
-    if os_name == "nt":
-        _ = system("cls")
+    Função que lê os nomes das unidades cursadas de um arquivo CSV/texto: um nome por linha, na primeira coluna.
+    Linhas vazias e linhas começando com '#' são ignoradas.
+    '''
+    with open(caminho, "r", encoding="utf-8", newline="") as arquivo:
+        return [
+            linha[0].strip() for linha in csv.reader(arquivo)
+            if linha and linha[0].strip() != "" and not linha[0].lstrip().startswith("#")
+        ]
+
+
+def verificarArquivo(caminho: str, codigo: int) -> dict:
+    '''
+    Função que calcula as optativas cursáveis de um estudante a partir de um arquivo: um perfil salvo (.json ou
+    .perfil), que já indica o curso, ou uma lista de unidades cursadas (CSV/texto) do curso informado em --curso.
+    Nomes digitados de forma aproximada são aceitos e listados em "aproximadas", com o nome da UC escolhida.
+    '''
+    nao_encontradas = []
+    aproximadas = []
+
+    if caminho.endswith((EXTENSAO_JSON, EXTENSAO_BINARIA)):
+        estudante = carregarPerfil(caminho, obterCurso)
     else:
-        _ = system("clear")
+        if codigo is None:
+            raise CursoException("CursoNaoInformado", "Informe o curso (--curso) para arquivos de unidades cursadas.")
+
+        curso = obterCurso(codigo)
+        unidades_cursadas = []
+
+        for nome in lerCursadas(caminho):
+            unidade_curricular = curso.buscar_unidade_curricular(nome, aproximado=True)
+
+            if unidade_curricular is None:
+                nao_encontradas.append(nome)
+                continue
+
+            if normalizarNome(unidade_curricular.nome) != normalizarNome(nome):
+                aproximadas.append({"informado": nome, "nome": unidade_curricular.nome})
+
+            if unidade_curricular not in unidades_cursadas:
+                unidades_cursadas.append(unidade_curricular)
+
+        estudante = Estudante.de_confianca(path.splitext(path.basename(caminho))[0], curso, unidades_cursadas)
+
+    return {
+        "arquivo": caminho,
+        "estudante": estudante.nome,
+        "curso": estudante.curso.id,
+        "optativas": [
+            {"nome": unidade_curricular.nome, "carga_horaria": unidade_curricular.carga_horaria}
+            for unidade_curricular in estudante.optativas_cursaveis()
+        ],
+        "nao_encontradas": nao_encontradas,
+        "aproximadas": aproximadas,
+    }
+
+
+def check(args: argparse.Namespace) -> int:
+    '''
+    Função do comando "check": verifica as optativas de cada arquivo e escreve um resultado por estudante na saída
+    padrão assim que ele fica pronto. Os cursos são carregados uma única vez (e usam o cache local).
+    '''
+    global cache, snapshot
+
+    if args.cache is not None:
+        from src.CacheCursos import CacheCursos
+
+        cache = CacheCursos(args.cache)
+
+    if args.snapshot is not None:
+        snapshot = Snapshot(args.snapshot)
+
+    erros = 0
+    escritor = None
+
+    if args.format == "csv":
+        escritor = csv.writer(sys.stdout)
+        escritor.writerow(["arquivo", "estudante", "curso", "optativa", "carga_horaria"])
+
+    for caminho in expandirArquivos(args.cursadas):
+        try:
+            resultado = verificarArquivo(caminho, args.curso)
+        except (CursoException, EstudanteException) as erro:
+            resultado = {"arquivo": caminho, "erro": erro.mensagem}
+        except OSError as erro:
+            # Os erros do requests também são OSError, mas sem strerror: são falhas ao baixar o curso
+            if erro.strerror is not None:
+                resultado = {"arquivo": caminho, "erro": f"Não foi possível abrir o arquivo: {erro.strerror}."}
+            else:
+                resultado = {"arquivo": caminho, "erro": f"Não foi possível obter o curso: {erro}"}
+        except ValueError as erro:
+            # Inclui UnicodeDecodeError de arquivos que não estão em UTF-8
+            resultado = {"arquivo": caminho, "erro": f"Não foi possível ler o arquivo: {erro}"}
+        except Exception as erro:
+            resultado = {"arquivo": caminho, "erro": f"Erro inesperado ({type(erro).__name__}): {erro}"}
+
+        if "erro" in resultado:
+            erros += 1
+
+        if escritor is None:
+            sys.stdout.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+        elif "erro" in resultado:
+            print(f"[!] {resultado['arquivo']}: {resultado['erro']}", file=sys.stderr)
+        else:
+            # No CSV só cabem as optativas; os nomes não encontrados ou aproximados viram avisos na saída de erro
+            for nome in resultado["nao_encontradas"]:
+                print(f"[!] {caminho}: UC não encontrada: {nome}", file=sys.stderr)
+            for aproximada in resultado["aproximadas"]:
+                print(f"[~] {caminho}: '{aproximada['informado']}' lido como '{aproximada['nome']}'", file=sys.stderr)
+
+            for optativa in resultado["optativas"]:
+                escritor.writerow([caminho, resultado["estudante"], resultado["curso"], optativa["nome"], optativa["carga_horaria"]])
+
+            # Um estudante sem optativas cursáveis ainda aparece, com as colunas da optativa vazias
+            if not resultado["optativas"]:
+                escritor.writerow([caminho, resultado["estudante"], resultado["curso"], "", ""])
+
+        sys.stdout.flush()
+
+    return 1 if erros > 0 else 0
+
+
+def crawl(args: argparse.Namespace) -> int:
+    '''
+    Função do comando "crawl": descobre os códigos dos cursos (pela listagem ou sondando um intervalo) e atualiza o
+    cache local, processando de novo só os cursos cuja matriz mudou. Escreve um resumo em JSON na saída padrão.
+    '''
+    from src.CacheCursos import CacheCursos
+    from src.Rastreador import atualizarCatalogo, listarCodigos, sondarCodigos
+
+    cache_cursos = CacheCursos(args.cache, max_cursos=args.max_cursos)
+
+    if args.sondar is not None:
+        codigos = sondarCodigos(range(args.sondar[0], args.sondar[1] + 1), args.max_concurrency)
+    elif args.listagem:
+        codigos = listarCodigos(None if args.listagem is True else args.listagem)
+    else:
+        codigos = None
+
+    resumo = atualizarCatalogo(cache_cursos, codigos, args.max_concurrency, args.processos)
+    cache_cursos.fechar()
+
+    print(json.dumps(resumo, ensure_ascii=False))
+    return 1 if resumo["erro"] > 0 else 0
+
+
+def exportarSnapshot(args: argparse.Namespace) -> int:
+    '''
+    Função do comando "snapshot": grava todos os cursos do cache local em um snapshot do catálogo.
+    '''
+    from src.CacheCursos import CacheCursos
+
+    cache_cursos = CacheCursos(args.cache)
+    tamanho = Snapshot.escrever(cache_cursos.cursos(), args.saida)
+    cache_cursos.fechar()
+
+    with Snapshot(args.saida) as catalogo:
+        print(f"{len(catalogo)} cursos gravados em {args.saida} ({tamanho} bytes).")
+
+    return 0
+
+
+def cli(argv: list[str]) -> int:
+    '''
+    Função que interpreta os argumentos da linha de comando do modo não interativo.
+
+    Exemplo:
+        ~$ python3 main.py check --curso 1905 --cursadas estudantes/ --format jsonl
+    '''
+    parser = argparse.ArgumentParser(prog="main.py", description="Verificador de matérias optativas UFMS.")
+    parser.add_argument(
+        "--instrumentar", metavar="ARQUIVO",
+        help="Grava em ARQUIVO (\"-\" para a saída de erro) o tempo de cada etapa do carregamento dos cursos, em JSON.",
+    )
+    parser.add_argument("--perfil", metavar="ARQUIVO", help="Grava um cProfile da execução em ARQUIVO.")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    parser_check = subparsers.add_parser("check", help="Lista as optativas cursáveis de vários estudantes.")
+    parser_check.add_argument("--curso", type=int, help="Código do curso dos arquivos de unidades cursadas (CSV).")
+    parser_check.add_argument(
+        "--cursadas", nargs="+", required=True,
+        help="Arquivos (ou diretórios) de estudantes: CSV com uma UC cursada por linha, ou perfis .json/.perfil.",
+    )
+    parser_check.add_argument("--format", choices=("jsonl", "csv"), default="jsonl", help="Formato da saída.")
+    parser_check.add_argument("--cache", help="Caminho do banco do cache de cursos.")
+    parser_check.add_argument("--snapshot", help="Snapshot do catálogo consultado antes do cache e do site.")
+    parser_check.set_defaults(funcao=check)
+
+    parser_crawl = subparsers.add_parser("crawl", help="Atualiza o cache local com todos os cursos do site.")
+    origem = parser_crawl.add_mutually_exclusive_group()
+    origem.add_argument(
+        "--listagem", nargs="?", const=True,
+        help="Descobre os códigos pelos links da página de listagem (padrão: https://ensino.ufms.br/cursos).",
+    )
+    origem.add_argument("--sondar", nargs=2, type=int, metavar=("INICIO", "FIM"), help="Sonda os códigos do intervalo.")
+    parser_crawl.add_argument("--cache", default=".cache/cursos.sqlite3", help="Caminho do banco do cache de cursos.")
+    parser_crawl.add_argument("--max-cursos", type=int, default=10000, help="Número máximo de cursos no cache.")
+    parser_crawl.add_argument("--max-concurrency", type=int, default=8, help="Número de cursos atualizados ao mesmo tempo.")
+    parser_crawl.add_argument("--processos", type=int, help="Faz o parsing das matrizes em N processos.", metavar="N")
+    parser_crawl.set_defaults(funcao=crawl)
+
+    parser_snapshot = subparsers.add_parser("snapshot", help="Grava os cursos do cache local em um snapshot do catálogo.")
+    parser_snapshot.add_argument("--cache", default=".cache/cursos.sqlite3", help="Caminho do banco do cache de cursos.")
+    parser_snapshot.add_argument("--saida", default="catalogo.snapshot", help="Caminho do snapshot.")
+    parser_snapshot.set_defaults(funcao=exportarSnapshot)
+
+    args = parser.parse_args(argv)
+
+    if args.instrumentar is None and args.perfil is None:
+        return args.funcao(args)
+
+    Instrumentacao.ativar(args.perfil)
+    try:
+        return args.funcao(args)
+    finally:
+        Instrumentacao.desativar()
+
+        if args.instrumentar is not None:
+            Instrumentacao.gravarResumo(None if args.instrumentar == "-" else args.instrumentar)
 
 
 def maisInformacoes():
@@ -51,7 +376,7 @@ def main():
                     print("a")
                     input()
                 case 2:
-                    print("b")
+                    carregarPerfilArquivo()
                     input()
                 case 3:
                     print("c")
@@ -69,6 +394,9 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(cli(sys.argv[1:]))
+
     try:
         main()
     except (KeyboardInterrupt, EOFError):
@@ -0,0 +1,111 @@
+# Imports de sistema
+import threading
+import time
+from concurrent.futures import Future
+
+# Imports locais
+from src.CacheCursos import CacheCursos
+from src.Curso import Curso
+from src.CursoException import CursoException
+from src.WebScraper import findCurso
+
+
+class BuscaCoalescida:
+    '''
+    Este arquivo contém a classe que une buscas simultâneas de um mesmo curso (single-flight), para uso com threads.
+    Quando várias threads pedem o mesmo código ao mesmo tempo, só a primeira chama findCurso; as outras esperam o
+    resultado dela e recebem o mesmo curso ou a mesma exceção.
+
+    Erros que indicam que o curso não existe (CursoDoesNotExist, por padrão) são lembrados por ttl_negativo segundos,
+    e nesse tempo novas buscas do código falham sem acessar o site. Os outros erros (de rede, por exemplo) não são
+    guardados, e a próxima busca tenta de novo.
+
+    A versão para asyncio é a classe BuscaCoalescidaAsync.
+    '''
+
+
+    def __init__(self, cache: "CacheCursos" = None, ttl_negativo: float = 30.0, negativos: tuple[str, ...] = ("CursoDoesNotExist",), buscar=findCurso) -> None:
+        '''
+        Construtor da classe BuscaCoalescida.
+
+        Parâmetros:
+        - cache (CacheCursos): Cache local de cursos repassado para a busca (opcional).
+        - ttl_negativo (float): Tempo, em segundos, que um erro de curso inexistente é lembrado.
+        - negativos (tuple[str, ...]): Valores de CursoException que são lembrados.
+        - buscar (Callable[[int, CacheCursos], Curso]): Função de busca, findCurso por padrão.
+
+        Retorno:
+        - None.
+        '''
+        self.cache        = cache
+        self.ttl_negativo = ttl_negativo
+        self.negativos    = negativos
+        self.buscar       = buscar
+
+        self._lock         = threading.Lock()
+        self._em_andamento = {}
+        self._erros        = {}
+
+
+    def obter(self, codigo: int) -> "Curso":
+        '''
+        Método que busca um curso, esperando uma busca já em andamento do mesmo código se houver.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - (Curso): Curso.
+        '''
+        with self._lock:
+            erro = self._erros.get(codigo)
+            if erro is not None:
+                if erro[0] > time.monotonic():
+                    raise CursoException(erro[1], erro[2])
+
+                del self._erros[codigo]
+
+            futuro = self._em_andamento.get(codigo)
+            lider = futuro is None
+
+            if lider:
+                futuro = Future()
+                self._em_andamento[codigo] = futuro
+
+        if not lider:
+            return futuro.result()
+
+        try:
+            curso = self.buscar(codigo, self.cache)
+        except BaseException as erro:
+            with self._lock:
+                del self._em_andamento[codigo]
+
+                if isinstance(erro, CursoException) and erro.valor in self.negativos:
+                    self._erros[codigo] = (time.monotonic() + self.ttl_negativo, erro.valor, erro.mensagem)
+
+            futuro.set_exception(erro)
+            raise
+
+        with self._lock:
+            del self._em_andamento[codigo]
+
+        futuro.set_result(curso)
+        return curso
+
+
+    def esquecer(self, codigo: int = None) -> None:
+        '''
+        Método que descarta os erros lembrados de um código, ou de todos.
+
+        Parâmetros:
+        - codigo (int): Código do curso. Se for None, todos os erros são descartados.
+
+        Retorno:
+        - None.
+        '''
+        with self._lock:
+            if codigo is None:
+                self._erros.clear()
+            else:
+                self._erros.pop(codigo, None)
@@ -0,0 +1,112 @@
+# Imports de sistema
+import asyncio
+import time
+from concurrent.futures import Executor
+from functools import partial
+
+# Imports locais
+from src.CacheCursos import CacheCursos
+from src.Curso import Curso
+from src.CursoException import CursoException
+from src.WebScraper import findCurso
+
+
+class BuscaCoalescidaAsync:
+    '''
+    Este arquivo contém a versão para asyncio da classe BuscaCoalescida. A busca (findCurso, que é bloqueante) roda
+    em um executor, e todas as corrotinas que pedem o mesmo código enquanto ela está em andamento esperam o mesmo
+    futuro. Os erros de curso inexistente são lembrados por ttl_negativo segundos, como na versão com threads.
+
+    Quem guarda os cursos em memória deve fazê-lo pela função ao_concluir, chamada no mesmo passo do event loop em que
+    a busca deixa de estar em andamento; guardar o curso só depois do await deixaria uma janela em que outra corrotina
+    não o encontra em memória e começa uma nova busca.
+
+    Um objeto desta classe deve ser usado sempre a partir do mesmo event loop.
+    '''
+
+
+    def __init__(self, cache: "CacheCursos" = None, ttl_negativo: float = 30.0, negativos: tuple[str, ...] = ("CursoDoesNotExist",), executor: "Executor" = None, ao_concluir=None, buscar=findCurso) -> None:
+        '''
+        Construtor da classe BuscaCoalescidaAsync.
+
+        Parâmetros:
+        - cache (CacheCursos): Cache local de cursos repassado para a busca (opcional).
+        - ttl_negativo (float): Tempo, em segundos, que um erro de curso inexistente é lembrado.
+        - negativos (tuple[str, ...]): Valores de CursoException que são lembrados.
+        - executor (Executor): Executor onde a busca roda. Se for None, é usado o executor padrão do loop.
+        - ao_concluir (Callable[[int, Curso], None]): Função chamada com cada curso buscado com sucesso (opcional).
+        - buscar (Callable[[int, CacheCursos], Curso]): Função de busca, findCurso por padrão.
+
+        Retorno:
+        - None.
+        '''
+        self.cache        = cache
+        self.ttl_negativo = ttl_negativo
+        self.negativos    = negativos
+        self.executor     = executor
+        self.ao_concluir  = ao_concluir
+        self.buscar       = buscar
+
+        self._em_andamento = {}
+        self._erros        = {}
+
+
+    async def obter(self, codigo: int) -> "Curso":
+        '''
+        Método que busca um curso, esperando uma busca já em andamento do mesmo código se houver.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - (Curso): Curso.
+        '''
+        erro = self._erros.get(codigo)
+        if erro is not None:
+            if erro[0] > time.monotonic():
+                raise CursoException(erro[1], erro[2])
+
+            del self._erros[codigo]
+
+        futuro = self._em_andamento.get(codigo)
+        if futuro is None:
+            futuro = asyncio.get_running_loop().run_in_executor(self.executor, self.buscar, codigo, self.cache)
+            futuro.add_done_callback(partial(self._concluir, codigo))
+            self._em_andamento[codigo] = futuro
+
+        # O shield impede que uma corrotina cancelada cancele a busca que as outras estão esperando
+        return await asyncio.shield(futuro)
+
+
+    def _concluir(self, codigo: int, futuro: "asyncio.Future") -> None:
+        '''
+        Método chamado quando uma busca termina. Remove a busca das que estão em andamento e guarda o erro, se ele
+        indicar que o curso não existe, ou repassa o curso para ao_concluir.
+        '''
+        del self._em_andamento[codigo]
+
+        if futuro.cancelled():
+            return
+
+        erro = futuro.exception()
+        if erro is None:
+            if self.ao_concluir is not None:
+                self.ao_concluir(codigo, futuro.result())
+        elif isinstance(erro, CursoException) and erro.valor in self.negativos:
+            self._erros[codigo] = (time.monotonic() + self.ttl_negativo, erro.valor, erro.mensagem)
+
+
+    def esquecer(self, codigo: int = None) -> None:
+        '''
+        Método que descarta os erros lembrados de um código, ou de todos.
+
+        Parâmetros:
+        - codigo (int): Código do curso. Se for None, todos os erros são descartados.
+
+        Retorno:
+        - None.
+        '''
+        if codigo is None:
+            self._erros.clear()
+        else:
+            self._erros.pop(codigo, None)
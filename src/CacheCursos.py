@@ -0,0 +1,289 @@
+# Imports de sistema
+import json
+import sqlite3
+import threading
+import time
+from os import makedirs, path
+from typing import Iterator
+
+# Imports locais
+from src.Curso import Curso
+from src.Serializacao import matrizParaRegistros, registrosParaMatriz
+
+
+class CacheCursos:
+    '''
+    Este arquivo contém a classe do cache local de cursos. Ela guarda em um banco SQLite o nome e a matriz curricular
+    já processados de cada curso, indexados pelo código, para que o programa não precise acessar o site da UFMS e
+    refazer o parsing do HTML toda vez que um curso é carregado.
+
+    Cada entrada tem um tempo de vida (ttl). Enquanto a entrada está dentro desse tempo ela é devolvida direto do
+    disco. Depois disso ela continua guardada junto com o ETag/Last-Modified da página da matriz, que são usados
+    para uma requisição condicional: se o site responder 304, a entrada só é renovada. O número de cursos guardados
+    é limitado por max_cursos, e quando o limite é ultrapassado os cursos acessados há mais tempo são removidos.
+
+    Uma segunda tabela (catalogo) guarda, para o rastreador de cursos (src/Rastreador.py), o hash do conteúdo da
+    matriz de cada código conhecido. Ela não é limitada por max_cursos.
+    '''
+
+
+    def __init__(self, caminho: str = ".cache/cursos.sqlite3", ttl: float = 7 * 24 * 60 * 60, max_cursos: int = 1000) -> None:
+        '''
+        Construtor da classe CacheCursos.
+
+        Parâmetros:
+        - caminho (str): Caminho do arquivo do banco de dados.
+        - ttl (float): Tempo, em segundos, que uma entrada é considerada atualizada.
+        - max_cursos (int): Número máximo de cursos guardados.
+
+        Retorno:
+        - None.
+        '''
+        diretorio = path.dirname(caminho)
+        if diretorio != "":
+            makedirs(diretorio, exist_ok=True)
+
+        self.ttl        = ttl
+        self.max_cursos = max_cursos
+
+        self._lock     = threading.Lock()
+        self._conexao  = sqlite3.connect(caminho, check_same_thread=False)
+        self._conexao.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS cursos (
+                codigo        INTEGER PRIMARY KEY,
+                nome          TEXT NOT NULL,
+                matriz        TEXT NOT NULL,
+                etag          TEXT,
+                last_modified TEXT,
+                atualizado    REAL NOT NULL,
+                acessado      REAL NOT NULL
+            )
+            '''
+        )
+        self._conexao.execute(
+            '''
+            CREATE TABLE IF NOT EXISTS catalogo (
+                codigo     INTEGER PRIMARY KEY,
+                hash       TEXT NOT NULL,
+                verificado REAL NOT NULL
+            )
+            '''
+        )
+        self._conexao.commit()
+
+
+    def __len__(self) -> int:
+        '''
+        Método que retorna o número de cursos guardados no cache.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - (int): Número de cursos.
+        '''
+        with self._lock:
+            return self._conexao.execute("SELECT COUNT(*) FROM cursos").fetchone()[0]
+
+
+    def obter(self, codigo: int) -> "Curso":
+        '''
+        Método que retorna o curso guardado, caso a entrada ainda esteja dentro do ttl.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - (Curso): Curso guardado, ou None se não houver entrada ou se ela estiver expirada.
+        '''
+        return self._carregar(codigo, time.time() - self.ttl)
+
+
+    def _carregar(self, codigo: int, atualizado_desde: float) -> "Curso":
+        '''
+        Método que lê uma entrada atualizada a partir de um instante e marca o seu último acesso.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+        - atualizado_desde (float): Instante mínimo da última atualização da entrada.
+
+        Retorno:
+        - (Curso): Curso guardado, ou None se não houver entrada válida.
+        '''
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT nome, matriz FROM cursos WHERE codigo = ? AND atualizado >= ?", (codigo, atualizado_desde)
+            ).fetchone()
+
+            if linha is None:
+                return None
+
+            self._conexao.execute("UPDATE cursos SET acessado = ? WHERE codigo = ?", (time.time(), codigo))
+            self._conexao.commit()
+
+        nome, matriz = linha
+        return Curso.de_confianca(codigo, nome, registrosParaMatriz(json.loads(matriz)))
+
+
+    def cursos(self) -> Iterator["Curso"]:
+        '''
+        Método que percorre todos os cursos guardados, atualizados ou não, sem alterar o seu último acesso.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - (Iterator[Curso]): Cursos guardados, em ordem de código.
+        '''
+        with self._lock:
+            linhas = self._conexao.execute("SELECT codigo, nome, matriz FROM cursos ORDER BY codigo").fetchall()
+
+        for codigo, nome, matriz in linhas:
+            yield Curso.de_confianca(codigo, nome, registrosParaMatriz(json.loads(matriz)))
+
+
+    def cabecalhos_condicionais(self, codigo: int) -> dict[str, str]:
+        '''
+        Método que monta os cabeçalhos para revalidar uma entrada expirada com o site.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - cabecalhos (dict[str, str]): If-None-Match/If-Modified-Since. Vazio se não houver entrada.
+        '''
+        with self._lock:
+            linha = self._conexao.execute("SELECT etag, last_modified FROM cursos WHERE codigo = ?", (codigo,)).fetchone()
+
+        cabecalhos = {}
+
+        if linha is not None:
+            etag, last_modified = linha
+
+            if etag:
+                cabecalhos["If-None-Match"] = etag
+            if last_modified:
+                cabecalhos["If-Modified-Since"] = last_modified
+
+        return cabecalhos
+
+
+    def revalidar(self, codigo: int) -> "Curso":
+        '''
+        Método chamado quando o site confirma (status 304) que a matriz não mudou. Renova o ttl da entrada.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - (Curso): Curso guardado, ou None se não houver entrada.
+        '''
+        with self._lock:
+            self._conexao.execute("UPDATE cursos SET atualizado = ? WHERE codigo = ?", (time.time(), codigo))
+            self._conexao.commit()
+
+        return self._carregar(codigo, 0)
+
+
+    def salvar(self, curso: "Curso", etag: str = None, last_modified: str = None) -> None:
+        '''
+        Método que guarda um curso no cache, removendo os menos acessados se o limite for ultrapassado.
+
+        Parâmetros:
+        - curso (Curso): Curso a ser guardado.
+        - etag (str): ETag da página da matriz curricular.
+        - last_modified (str): Last-Modified da página da matriz curricular.
+
+        Retorno:
+        - None.
+        '''
+        matriz = json.dumps(matrizParaRegistros(curso.matriz_curricular), ensure_ascii=False, separators=(",", ":"))
+        agora = time.time()
+
+        with self._lock:
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO cursos VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (curso.id, curso.nome, matriz, etag, last_modified, agora, agora),
+            )
+            self._conexao.execute(
+                "DELETE FROM cursos WHERE codigo NOT IN (SELECT codigo FROM cursos ORDER BY acessado DESC LIMIT ?)",
+                (self.max_cursos,),
+            )
+            self._conexao.commit()
+
+
+    def remover(self, codigo: int) -> None:
+        '''
+        Método que remove um curso do cache.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - None.
+        '''
+        with self._lock:
+            self._conexao.execute("DELETE FROM cursos WHERE codigo = ?", (codigo,))
+            self._conexao.execute("DELETE FROM catalogo WHERE codigo = ?", (codigo,))
+            self._conexao.commit()
+
+
+    def obter_hash(self, codigo: int) -> str:
+        '''
+        Método que retorna o hash da matriz curricular registrado no catálogo para um código.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - (str): Hash da matriz, ou None se o código não estiver no catálogo.
+        '''
+        with self._lock:
+            linha = self._conexao.execute("SELECT hash FROM catalogo WHERE codigo = ?", (codigo,)).fetchone()
+
+        return None if linha is None else linha[0]
+
+
+    def salvar_hash(self, codigo: int, hash_matriz: str) -> None:
+        '''
+        Método que registra no catálogo o hash da matriz curricular de um código e o instante da verificação.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+        - hash_matriz (str): Hash da matriz.
+
+        Retorno:
+        - None.
+        '''
+        with self._lock:
+            self._conexao.execute("INSERT OR REPLACE INTO catalogo VALUES (?, ?, ?)", (codigo, hash_matriz, time.time()))
+            self._conexao.commit()
+
+
+    def codigos_catalogados(self) -> list[int]:
+        '''
+        Método que retorna os códigos registrados no catálogo.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - (list[int]): Códigos, em ordem crescente.
+        '''
+        with self._lock:
+            return [codigo for (codigo,) in self._conexao.execute("SELECT codigo FROM catalogo ORDER BY codigo")]
+
+
+    def fechar(self) -> None:
+        '''
+        Método que fecha a conexão com o banco de dados.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - None.
+        '''
+        with self._lock:
+            self._conexao.close()
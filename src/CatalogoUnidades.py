@@ -0,0 +1,227 @@
+# Imports de sistema
+import weakref
+from collections import Counter
+from typing import Iterable
+
+# Imports locais
+from src.Curso import Curso
+from src.CursoException import CursoException
+from src.Normalizacao import normalizarNome
+from src.UnidadeCurricular import UnidadeCurricular
+
+
+class CatalogoUnidades:
+    '''
+    Este arquivo contém a classe do catálogo global de unidades curriculares, que faz com que UCs iguais em cursos
+    diferentes (como "Algoritmos e Programação I" nos cursos da Facom) sejam um único objeto em memória, e mantém um
+    índice reverso de cada UC para os cursos que a têm.
+
+    Duas UCs são a mesma UC quando têm o mesmo nome normalizado (ver Normalizacao.normalizarNome) e a mesma carga
+    horária. Mas o objeto só é compartilhado quando a obrigatoriedade e os pré-requisitos também são iguais, porque
+    esses atributos fazem parte da UC e mudam as consultas de cada curso. Os cursos são registrados em ordem
+    topológica, então os pré-requisitos de uma UC já foram trocados pelos objetos do catálogo quando ela é comparada.
+
+    As UCs de um curso registrado são compartilhadas com outros cursos e não devem ser alteradas (add_pre_requisito,
+    setters): a alteração apareceria em todos os cursos que têm a UC.
+    '''
+
+
+    def __init__(self) -> None:
+        '''
+        Construtor da classe CatalogoUnidades.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - None.
+        '''
+        # (nome normalizado, carga horária, obrigatória, ids dos pré-requisitos) -> UC. Os ids são estáveis enquanto
+        # a UC existir, pois ela mantém os seus pré-requisitos vivos; quando nenhum curso a usa mais, a entrada some.
+        self._variantes = weakref.WeakValueDictionary()
+
+        # (nome normalizado, carga horária) -> {código do curso: UC}
+        self._indice = {}
+
+        self._cursos = {}
+
+
+    def __len__(self) -> int:
+        '''
+        Método que retorna o número de UCs distintas (pelo nome normalizado e carga horária) no catálogo.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - (int): Número de UCs.
+        '''
+        return len(self._indice)
+
+
+    def __contains__(self, codigo: int) -> bool:
+        '''
+        Método que informa se um curso está registrado.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - (bool): True se o curso está registrado.
+        '''
+        return codigo in self._cursos
+
+
+    @staticmethod
+    def chave(unidade_curricular: "UnidadeCurricular") -> tuple[str, int]:
+        '''
+        Método que retorna a chave que identifica uma UC entre cursos.
+
+        Parâmetros:
+        - unidade_curricular (UnidadeCurricular): Unidade curricular.
+
+        Retorno:
+        - (tuple[str, int]): Nome normalizado e carga horária.
+        '''
+        return normalizarNome(unidade_curricular.nome), unidade_curricular.carga_horaria
+
+
+    def registrar(self, curso: "Curso") -> "Curso":
+        '''
+        Método que registra um curso no catálogo. As UCs que já existem no catálogo são trocadas pelos objetos dele,
+        e um novo Curso com a matriz resultante é devolvido; o curso informado não é alterado. Registrar de novo um
+        código substitui o registro anterior.
+
+        Parâmetros:
+        - curso (Curso): Curso a ser registrado.
+
+        Retorno:
+        - (Curso): Curso com as UCs do catálogo, na mesma ordem da matriz original.
+        '''
+        if curso.id in self._cursos:
+            self.remover(curso.id)
+
+        try:
+            ordem = curso.ordem_topologica()
+        except CursoException:
+            # Com ciclo nos pré-requisitos não há ordem para comparar as UCs, então elas não são compartilhadas
+            ordem = None
+
+        canonicas, chaves, usadas = {}, {}, set()
+
+        for unidade_curricular in (ordem if ordem is not None else curso.matriz_curricular):
+            chave = chaves[unidade_curricular] = self.chave(unidade_curricular)
+
+            if ordem is None:
+                canonicas[unidade_curricular] = unidade_curricular
+                continue
+
+            pre_requisitos = tuple(canonicas.get(pre_requisito, pre_requisito) for pre_requisito in unidade_curricular.pre_requisitos)
+            variante = (*chave, unidade_curricular.obrigatoria, frozenset(map(id, pre_requisitos)))
+
+            canonica = self._variantes.get(variante)
+            if canonica is None or canonica in usadas:
+                # Uma UC repetida dentro da própria matriz continua sendo um objeto separado
+                if all(a is b for a, b in zip(pre_requisitos, unidade_curricular.pre_requisitos)):
+                    canonica = unidade_curricular
+                else:
+                    canonica = UnidadeCurricular.de_confianca(unidade_curricular.nome, unidade_curricular.carga_horaria, pre_requisitos, unidade_curricular.obrigatoria)
+
+                self._variantes.setdefault(variante, canonica)
+
+            canonicas[unidade_curricular] = canonica
+            usadas.add(canonica)
+
+        matriz_curricular = [canonicas[unidade_curricular] for unidade_curricular in curso.matriz_curricular]
+
+        for original, unidade_curricular in zip(curso.matriz_curricular, matriz_curricular):
+            self._indice.setdefault(chaves[original], {})[curso.id] = unidade_curricular
+
+        registrado = Curso.de_confianca(curso.id, curso.nome, matriz_curricular)
+        self._cursos[curso.id] = registrado
+
+        return registrado
+
+
+    def remover(self, codigo: int) -> None:
+        '''
+        Método que remove um curso do catálogo. As UCs usadas só por ele deixam de ser guardadas.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - None.
+        '''
+        curso = self._cursos.pop(codigo, None)
+        if curso is None:
+            return
+
+        for unidade_curricular in curso.matriz_curricular:
+            chave = self.chave(unidade_curricular)
+            cursos = self._indice.get(chave)
+
+            if cursos is not None:
+                cursos.pop(codigo, None)
+                if not cursos:
+                    del self._indice[chave]
+
+
+    def curso(self, codigo: int) -> "Curso":
+        '''
+        Método que retorna um curso registrado.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - (Curso): Curso, ou None se ele não estiver registrado.
+        '''
+        return self._cursos.get(codigo)
+
+
+    def cursos_com(self, unidade_curricular: "UnidadeCurricular") -> set[int]:
+        '''
+        Método que retorna os códigos dos cursos que têm a UC (pelo nome normalizado e carga horária).
+
+        Parâmetros:
+        - unidade_curricular (UnidadeCurricular): Unidade curricular, de qualquer curso.
+
+        Retorno:
+        - (set[int]): Códigos dos cursos.
+        '''
+        return set(self._indice.get(self.chave(unidade_curricular), ()))
+
+
+    def equivalente(self, unidade_curricular: "UnidadeCurricular", codigo: int) -> "UnidadeCurricular":
+        '''
+        Método que retorna a UC de um curso que corresponde à UC informada.
+
+        Parâmetros:
+        - unidade_curricular (UnidadeCurricular): Unidade curricular, de qualquer curso.
+        - codigo (int): Código do curso onde a UC é procurada.
+
+        Retorno:
+        - (UnidadeCurricular): UC do curso, ou None se o curso não a tiver.
+        '''
+        return self._indice.get(self.chave(unidade_curricular), {}).get(codigo)
+
+
+    def cursos_que_aceitam(self, unidades_cursadas: Iterable["UnidadeCurricular"]) -> list[tuple[int, int]]:
+        '''
+        Método que retorna os cursos que têm alguma das UCs cursadas e quantas delas cada um aproveita, como para
+        um estudante que pensa em mudar de curso.
+
+        Parâmetros:
+        - unidades_cursadas (Iterable[UnidadeCurricular]): UCs cursadas, de qualquer curso.
+
+        Retorno:
+        - (list[tuple[int, int]]): Pares (código do curso, UCs aproveitadas), do que aproveita mais para o que
+          aproveita menos.
+        '''
+        aproveitadas = Counter()
+
+        for chave in {self.chave(unidade_curricular) for unidade_curricular in unidades_cursadas}:
+            aproveitadas.update(self._indice.get(chave, {}).keys())
+
+        return sorted(aproveitadas.items(), key=lambda par: (-par[1], par[0]))
@@ -1,5 +1,7 @@
 # Imports locais
 from src.CursoException import CursoException
+from src.GrafoCurso import GrafoCurso
+from src.Normalizacao import normalizarNome
 from src.UnidadeCurricular import UnidadeCurricular
 
 
@@ -32,6 +34,30 @@ class Curso:
         self.matriz_curricular = matriz_curricular
 
 
+    @classmethod
+    def de_confianca(cls, id: int, nome: str, matriz_curricular: list["UnidadeCurricular"]) -> "Curso":
+        '''
+        Construtor alternativo que não valida os atributos nem cada unidade da matriz. Deve ser usado apenas com dados
+        já validados, como a saída do scraper e do cache, para montar matrizes grandes em tempo linear.
+
+        Parâmetros:
+        - id (int): Id do curso.
+        - nome (str): Nome do curso.
+        - matriz_curricular (list[UnidadeCurricular]): Matriz curricular do curso.
+
+        Retorno:
+        - (Curso): Curso criado.
+        '''
+        curso = cls.__new__(cls)
+        curso._id                = id
+        curso._nome              = nome
+        curso._matriz_curricular = matriz_curricular
+        curso._unidades          = set(matriz_curricular)
+        curso._grafo             = None
+
+        return curso
+
+
     def __str__(self) -> str:
         '''
         Método chamado quando uma objeto da classe é chamado através do print().
@@ -158,6 +184,8 @@ class Curso:
             raise CursoException("UnidadesCurricularesInvalidas", "Nem todas as unidades curriculares são válidas.")
 
         self._matriz_curricular = matriz_curricular
+        self._unidades          = set(matriz_curricular)
+        self._grafo             = None
 
     
     def add_unidade_curricular(self, unidade_curricular: "UnidadeCurricular") -> None:
@@ -173,10 +201,14 @@ class Curso:
         if not isinstance(unidade_curricular, UnidadeCurricular):
             raise CursoException("UnidadeCurricularInvalida", "A unidade curricular informada é inválida.")
         
-        if unidade_curricular in self.matriz_curricular:
+        if unidade_curricular in self._unidades:
             raise CursoException("UnidadeCurricularJaAdicionada", "A unidade curricular já está presente na matriz.")
 
         self.matriz_curricular.append(unidade_curricular)
+        self._unidades.add(unidade_curricular)
+
+        if self._grafo is not None and not self._grafo.adicionar(unidade_curricular):
+            self._grafo = None
 
     
     def del_unidade_curricular(self, unidade_curricular: "UnidadeCurricular") -> None:
@@ -192,5 +224,156 @@ class Curso:
         if not isinstance(unidade_curricular, UnidadeCurricular):
             raise CursoException("UnidadeCurricularInvalida", "A unidade curricular informada é inválida.")
 
-        if unidade_curricular in self.matriz_curricular:
-            self.matriz_curricular.remove(unidade_curricular)
\ No newline at end of file
+        if unidade_curricular in self._unidades:
+            self.matriz_curricular.remove(unidade_curricular)
+            self._unidades.discard(unidade_curricular)
+            self._grafo = None
+
+
+    @property
+    def grafo(self) -> "GrafoCurso":
+        '''
+        Getter para o grafo de pré-requisitos do curso (índices densos e bitsets). Ele é calculado na primeira
+        consulta e atualizado de forma incremental quando uma UC é adicionada ou quando uma UC da matriz muda (ver
+        GrafoCurso); só a remoção de uma UC faz com que ele seja refeito.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - grafo (GrafoCurso): Grafo de pré-requisitos do curso.
+        '''
+        if self._grafo is None:
+            self._grafo = GrafoCurso(self.matriz_curricular)
+
+        return self._grafo
+
+
+    def buscar_unidade_curricular(self, nome: str, aproximado: bool = False) -> "UnidadeCurricular":
+        '''
+        Método que procura uma unidade curricular da matriz pelo nome, sem diferenciar acentos, maiúsculas ou espaços.
+
+        Parâmetros:
+        - nome (str): Nome da unidade curricular.
+        - aproximado (bool): Se nenhuma UC tiver exatamente esse nome, aceita a única UC com nome bem parecido
+          (abreviações, erros de digitação, "1" no lugar de "I"), se houver.
+
+        Retorno:
+        - (UnidadeCurricular): Unidade encontrada, ou None se nenhuma tiver esse nome.
+        '''
+        grafo = self.grafo
+        indice = grafo.nomes.get(normalizarNome(nome))
+
+        if indice is None and aproximado:
+            indice = grafo.indice_nomes.melhor(nome)
+
+        return None if indice is None else grafo.unidades[indice]
+
+
+    def buscar_aproximado(self, nome: str, limite: int = 5, minimo: float = 0.5) -> list[tuple["UnidadeCurricular", float]]:
+        '''
+        Método que procura as unidades curriculares da matriz com os nomes mais parecidos com o informado.
+
+        Parâmetros:
+        - nome (str): Nome procurado, como digitado.
+        - limite (int): Número máximo de resultados.
+        - minimo (float): Nota mínima (entre 0 e 1) de um resultado.
+
+        Retorno:
+        - (list[tuple[UnidadeCurricular, float]]): Pares (UC, nota), da mais parecida para a menos parecida.
+        '''
+        grafo = self.grafo
+        return [(grafo.unidades[indice], nota) for indice, nota in grafo.indice_nomes.buscar(nome, limite, minimo)]
+
+
+    def optativas_cursaveis(self, unidades_cursadas: list["UnidadeCurricular"]) -> list["UnidadeCurricular"]:
+        '''
+        Método que retorna as unidades curriculares optativas que podem ser cursadas por quem já cursou as unidades
+        informadas, ou seja, as optativas ainda não cursadas que têm todos os pré-requisitos cumpridos.
+
+        As unidades cursadas são colocadas em um conjunto (set), então cada verificação de pré-requisito custa O(1)
+        e a consulta inteira é linear no número de arestas de pré-requisito da matriz.
+
+        Parâmetros:
+        - unidades_cursadas (list[UnidadeCurricular]): Unidades curriculares já cursadas.
+
+        Retorno:
+        - optativas (list[UnidadeCurricular]): Optativas que podem ser cursadas, na ordem da matriz.
+        '''
+        cursadas = set(unidades_cursadas)
+
+        return [
+            unidade_curricular
+            for unidade_curricular in self.matriz_curricular
+            if not unidade_curricular.obrigatoria
+            and unidade_curricular not in cursadas
+            and all(pre_requisito in cursadas for pre_requisito in unidade_curricular.pre_requisitos)
+        ]
+
+
+    def optativas_cursaveis_lote(self, lote_cursadas: list[list["UnidadeCurricular"]]) -> list[list["UnidadeCurricular"]]:
+        '''
+        Método que calcula as optativas cursáveis para vários estudantes de uma vez, usando bitsets.
+
+        Parâmetros:
+        - lote_cursadas (list[list[UnidadeCurricular]]): Unidades cursadas por cada estudante.
+
+        Retorno:
+        - (list[list[UnidadeCurricular]]): Optativas cursáveis de cada estudante, na mesma ordem do lote.
+        '''
+        return self.grafo.optativas_cursaveis_lote(lote_cursadas)
+
+
+    def ordem_topologica(self) -> list["UnidadeCurricular"]:
+        '''
+        Método que retorna as unidades curriculares da matriz em uma ordem em que cada uma aparece depois de todos
+        os seus pré-requisitos.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - (list[UnidadeCurricular]): Unidades em ordem topológica.
+        '''
+        grafo = self.grafo
+        return [grafo.unidades[i] for i in grafo.ordem_topologica]
+
+
+    def pre_requisitos_transitivos(self, unidade_curricular: "UnidadeCurricular") -> list["UnidadeCurricular"]:
+        '''
+        Método que retorna todas as unidades que precisam ser cursadas antes da unidade informada, direta ou
+        indiretamente.
+
+        Parâmetros:
+        - unidade_curricular (UnidadeCurricular): Unidade da matriz.
+
+        Retorno:
+        - (list[UnidadeCurricular]): Pré-requisitos transitivos, em ordem topológica.
+        '''
+        grafo = self.grafo
+        indice = grafo.indices.get(unidade_curricular)
+
+        if indice is None:
+            raise CursoException("UnidadeCurricularNaoEncontrada", "A unidade curricular informada não está na matriz.")
+
+        return grafo.ordenar(grafo.fechamento[indice])
+
+
+    def pre_requisitos_faltantes(self, unidade_curricular: "UnidadeCurricular", unidades_cursadas: list["UnidadeCurricular"]) -> list["UnidadeCurricular"]:
+        '''
+        Método que retorna o que ainda falta cursar antes de poder cursar a unidade informada.
+
+        Parâmetros:
+        - unidade_curricular (UnidadeCurricular): Unidade da matriz.
+        - unidades_cursadas (list[UnidadeCurricular]): Unidades curriculares já cursadas.
+
+        Retorno:
+        - (list[UnidadeCurricular]): Pré-requisitos transitivos ainda não cursados, em ordem topológica.
+        '''
+        grafo = self.grafo
+        indice = grafo.indices.get(unidade_curricular)
+
+        if indice is None:
+            raise CursoException("UnidadeCurricularNaoEncontrada", "A unidade curricular informada não está na matriz.")
+
+        return grafo.ordenar(grafo.fechamento[indice] & ~grafo.mascara(unidades_cursadas))
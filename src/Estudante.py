@@ -1,3 +1,6 @@
+# Imports de sistema
+from typing import Callable
+
 # Imports locais
 from src.Curso import Curso
 from src.UnidadeCurricular import UnidadeCurricular
@@ -11,6 +14,11 @@ class Estudante:
     um diferencial, para facilitar a diferenciação entre os arquivos salvos localmente na máquina, enquanto o
     curso e as unidades cursadas servem para cumprir o principal objetivo do código: verificar quais matérias
     optativas um estudante pode cursar.
+
+    Para edição interativa, o estudante pode manter as optativas cursáveis de forma incremental (ver
+    ativar_modo_incremental): cada UC da matriz guarda quantos pré-requisitos ainda faltam, e marcar ou desmarcar uma
+    UC como cursada só atualiza os contadores dos seus dependentes diretos, em O(grau de saída), avisando os
+    observadores registrados sobre as optativas que entraram ou saíram.
     '''
 
 
@@ -26,11 +34,41 @@ class Estudante:
         Retorno:
         - None.
         '''
+        self._incremental      = None
+        self._cursaveis        = set()
+        self._observadores     = []
+
         self.nome              = nome
         self.curso             = curso
         self.unidades_cursadas = unidades_cursadas
 
 
+    @classmethod
+    def de_confianca(cls, nome: str, curso: "Curso", unidades_cursadas: list["UnidadeCurricular"]) -> "Estudante":
+        '''
+        Construtor alternativo que não valida os atributos nem cada unidade cursada. Deve ser usado apenas com dados
+        já validados, como perfis gravados pelo próprio programa.
+
+        Parâmetros:
+        - nome (str): Nome do estudante.
+        - curso (Curso): Curso que o estudante está matriculado.
+        - unidades_cursadas (list[UnidadeCurricular]): Lista de unidades curriculares cursadas.
+
+        Retorno:
+        - (Estudante): Estudante criado.
+        '''
+        estudante = cls.__new__(cls)
+        estudante._nome              = nome
+        estudante._curso             = curso
+        estudante._unidades_cursadas = unidades_cursadas
+        estudante._cursadas          = set(unidades_cursadas)
+        estudante._incremental       = None
+        estudante._cursaveis         = set()
+        estudante._observadores      = []
+
+        return estudante
+
+
     def printInfo(self) -> None:
         '''
         Método para printar as informações do estudante.
@@ -110,6 +148,9 @@ class Estudante:
             raise EstudanteException("CursoInvalido", "O curso informado é inválido.")
 
         self._curso  = curso
+
+        if self._incremental is not None:
+            self._reconstruir_incremental()
     
 
     @property
@@ -144,6 +185,10 @@ class Estudante:
             raise EstudanteException("UnidadesCursadasInvalidas", "Nem todas as unidades curriculares são válidas.")
 
         self._unidades_cursadas = unidades_cursadas
+        self._cursadas          = set(unidades_cursadas)
+
+        if self._incremental is not None:
+            self._reconstruir_incremental()
 
 
     def add_unidade_curricular(self, unidade_curricular: "UnidadeCurricular") -> None:
@@ -159,10 +204,14 @@ class Estudante:
         if not isinstance(unidade_curricular, UnidadeCurricular):
             raise EstudanteException("UnidadeCurricularInvalida", "A unidade curricular informada é inválida.")
 
-        if unidade_curricular in self.unidades_cursadas:
+        if unidade_curricular in self._cursadas:
             raise EstudanteException("UnidadeCurricularJaCursada", "A unidade curricular informada já foi cursada.")
 
         self.unidades_cursadas.append(unidade_curricular)
+        self._cursadas.add(unidade_curricular)
+
+        if self._incremental is not None:
+            self._atualizar_incremental(unidade_curricular, True)
 
     
     def del_unidade_curricular(self, unidade_curricular: "UnidadeCurricular") -> None:
@@ -178,5 +227,154 @@ class Estudante:
         if not isinstance(unidade_curricular, UnidadeCurricular):
             raise EstudanteException("UnidadeCurricularInvalida", "A unidade curricular informada é inválida.")
 
-        if unidade_curricular in self.unidades_cursadas:
-            self.unidades_cursadas.remove(unidade_curricular)
\ No newline at end of file
+        if unidade_curricular in self._cursadas:
+            self.unidades_cursadas.remove(unidade_curricular)
+            self._cursadas.discard(unidade_curricular)
+
+            if self._incremental is not None:
+                self._atualizar_incremental(unidade_curricular, False)
+
+
+    def optativas_cursaveis(self) -> list["UnidadeCurricular"]:
+        '''
+        Método que retorna as unidades curriculares optativas do curso que o estudante pode cursar com base nas
+        unidades que ele já cursou.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - optativas (list[UnidadeCurricular]): Optativas que podem ser cursadas, na ordem da matriz.
+        '''
+        if self._incremental is not None:
+            grafo = self._validar_incremental()
+            return [grafo.unidades[i] for i in sorted(self._cursaveis)]
+
+        return self.curso.optativas_cursaveis(self.unidades_cursadas)
+
+
+    def ativar_modo_incremental(self) -> None:
+        '''
+        Método que passa a manter as optativas cursáveis de forma incremental. Os contadores são montados uma vez
+        (O(arestas da matriz)) e depois atualizados a cada add_unidade_curricular/del_unidade_curricular.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - None.
+        '''
+        if self._incremental is None:
+            self._reconstruir_incremental()
+
+
+    def observar_optativas(self, observador: Callable[[list["UnidadeCurricular"], list["UnidadeCurricular"]], None]) -> None:
+        '''
+        Método que registra uma função chamada sempre que as optativas cursáveis mudam. Ativa o modo incremental.
+
+        Parâmetros:
+        - observador (Callable): Função que recebe (optativas que entraram, optativas que saíram).
+
+        Retorno:
+        - None.
+        '''
+        self._observadores.append(observador)
+        self.ativar_modo_incremental()
+
+
+    def _notificar(self, entraram: list[int], sairam: list[int]) -> None:
+        '''
+        Método que avisa os observadores sobre as optativas (índices do grafo) que entraram ou saíram.
+        '''
+        if (entraram or sairam) and self._observadores:
+            unidades = self._incremental.unidades
+            entraram = [unidades[i] for i in entraram]
+            sairam = [unidades[i] for i in sairam]
+
+            for observador in self._observadores:
+                observador(entraram, sairam)
+
+
+    def _reconstruir_incremental(self) -> None:
+        '''
+        Método que monta do zero os contadores de pré-requisitos faltantes e o conjunto de optativas cursáveis.
+        '''
+        grafo = self.curso.grafo
+        cursadas = {grafo.indices[unidade_curricular] for unidade_curricular in self._cursadas if unidade_curricular in grafo.indices}
+
+        # Os pré-requisitos de fora da matriz contam como faltantes enquanto o estudante não os cursou
+        faltantes = [
+            sum(1 for pre_requisito in pre_requisitos if pre_requisito not in cursadas)
+            + sum(1 for pre_requisito in externos if pre_requisito not in self._cursadas)
+            for pre_requisitos, externos in zip(grafo.pre_requisitos, grafo.pre_requisitos_externos)
+        ]
+        cursaveis = {
+            i for i in range(len(grafo))
+            if faltantes[i] == 0 and i not in cursadas and (grafo.mascara_optativas >> i) & 1
+        }
+
+        anteriores = self._cursaveis
+
+        self._incremental = grafo
+        self._versao      = grafo.versao
+        self._faltantes   = faltantes
+        self._cursaveis   = cursaveis
+
+        self._notificar(sorted(cursaveis - anteriores), sorted(anteriores - cursaveis))
+
+
+    def _validar_incremental(self) -> "GrafoCurso":
+        '''
+        Método que remonta os contadores se o grafo do curso mudou desde a última atualização.
+        '''
+        grafo = self.curso.grafo
+
+        if grafo is not self._incremental or grafo.versao != self._versao:
+            self._reconstruir_incremental()
+
+        return grafo
+
+
+    def _atualizar_incremental(self, unidade_curricular: "UnidadeCurricular", cursada: bool) -> None:
+        '''
+        Método que atualiza os contadores depois que uma UC foi marcada (cursada=True) ou desmarcada como cursada.
+        Só os dependentes diretos da UC são visitados (para uma UC de fora da matriz, as UCs que a citam).
+        '''
+        grafo = self.curso.grafo
+
+        if grafo is not self._incremental or grafo.versao != self._versao:
+            self._reconstruir_incremental()
+            return
+
+        i = grafo.indices.get(unidade_curricular)
+        dependentes = grafo.dependentes[i] if i is not None else grafo.dependentes_externos(unidade_curricular)
+
+        optativas = grafo.mascara_optativas
+        faltantes = self._faltantes
+        cursaveis = self._cursaveis
+        entraram, sairam = [], []
+
+        if cursada:
+            if i in cursaveis:
+                cursaveis.discard(i)
+                sairam.append(i)
+
+            for dependente in dependentes:
+                faltantes[dependente] -= 1
+
+                if faltantes[dependente] == 0 and (optativas >> dependente) & 1 and grafo.unidades[dependente] not in self._cursadas:
+                    cursaveis.add(dependente)
+                    entraram.append(dependente)
+        else:
+            for dependente in dependentes:
+                if dependente in cursaveis:
+                    cursaveis.discard(dependente)
+                    sairam.append(dependente)
+
+                faltantes[dependente] += 1
+
+            if i is not None and faltantes[i] == 0 and (optativas >> i) & 1:
+                cursaveis.add(i)
+                entraram.append(i)
+
+        self._notificar(entraram, sairam)
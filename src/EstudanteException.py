@@ -1,4 +1,4 @@
-def EstudanteException(Exception):
+class EstudanteException(Exception):
     def __init__(self, valor:str, mensagem:str):
         self.valor    = valor
         self.mensagem = mensagem
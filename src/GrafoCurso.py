@@ -0,0 +1,546 @@
+# Imports de sistema
+import hashlib
+import weakref
+
+# Imports locais
+from src.CursoException import CursoException
+from src.IndiceNomes import IndiceNomes
+from src.Normalizacao import normalizarNome
+from src.UnidadeCurricular import UnidadeCurricular
+
+
+class GrafoCurso:
+    '''
+    Este arquivo contém a classe que guarda as estruturas calculadas a partir da matriz curricular de um curso.
+    Cada unidade curricular recebe um índice denso (a sua posição na matriz) e os pré-requisitos de cada uma são
+    representados como um bitset, usando os inteiros do Python: o bit i está ligado se a UC de índice i é
+    pré-requisito.
+
+    A ordem topológica e o fecho transitivo dos pré-requisitos (também em bitsets) são calculados apenas na primeira
+    consulta. Depois disso, "tudo o que vem antes da UC X" é um único inteiro, e consultas sobre ele custam O(1) ou
+    O(popcount).
+
+    Os objetos dessa classe são criados pelo Curso quando necessário, e cada UC da matriz guarda uma referência fraca
+    ao grafo (ver UnidadeCurricular.registrar_grafo). Assim, uma mudança em uma UC atualiza só os grafos dos cursos que
+    a têm, e de forma incremental:
+    - uma UC nova adicionada ao curso é incluída sem recalcular o resto;
+    - mudar os pré-requisitos de uma UC refaz só a linha dela, e o fecho transitivo só dela e dos seus dependentes. A
+      ordem topológica continua valendo se os novos pré-requisitos já vêm antes da UC (sempre, em uma remoção);
+    - mudar a obrigatoriedade troca um bit, e mudar o nome ou a carga horária descarta só os índices de nomes e a
+      assinatura.
+    O contador versao aumenta a cada mudança nas arestas ou na obrigatoriedade, para quem guarda estruturas calculadas
+    a partir do grafo (como o modo incremental do Estudante). A remoção de UCs ainda faz o Curso descartar o grafo.
+    '''
+
+
+    def __init__(self, matriz_curricular: list["UnidadeCurricular"]) -> None:
+        '''
+        Construtor da classe GrafoCurso.
+
+        Parâmetros:
+        - matriz_curricular (list[UnidadeCurricular]): Matriz curricular do curso.
+
+        Retorno:
+        - None.
+        '''
+        self.versao   = 0
+        self.unidades = list(matriz_curricular)
+        self.indices  = {unidade_curricular: i for i, unidade_curricular in enumerate(self.unidades)}
+
+        self.pre_requisitos = []
+        self.mascaras_pre_requisitos = []
+        self.mascara_optativas = 0
+
+        # Pré-requisitos de cada UC que não estão na matriz (quase sempre nenhum). Eles não têm bit nos bitsets, mas,
+        # como em Curso.optativas_cursaveis, só estão cumpridos se o estudante os cursou, então as consultas de
+        # elegibilidade (optativas_cursaveis_lote e o modo incremental do Estudante) os verificam à parte.
+        self.pre_requisitos_externos = []
+
+        # UCs citadas como pré-requisito que não estão na matriz, com os índices das UCs que as citam. Se uma delas for
+        # adicionada à matriz depois, essas arestas passam a ter bits, e o grafo precisa ser refeito.
+        self._externas = {}
+
+        self._assinatura  = None
+        self._nomes       = None
+        self._indice_nomes = None
+        self._dependentes = None
+        self._ordem       = None
+        self._posicoes   = None
+        self._fechamento = None
+
+        for unidade_curricular in self.unidades:
+            self._indexar(unidade_curricular)
+
+        self._referencia = weakref.ref(self)
+        for unidade_curricular in self.unidades:
+            unidade_curricular.registrar_grafo(self._referencia)
+
+
+    def _indexar(self, unidade_curricular: "UnidadeCurricular") -> None:
+        '''
+        Método que monta os pré-requisitos (índices e bitset) da UC que ocupa o próximo índice.
+        '''
+        i = len(self.pre_requisitos)
+        pre_requisitos = []
+        externos = []
+        mascara = 0
+
+        for pre_requisito in unidade_curricular.pre_requisitos:
+            indice = self.indices.get(pre_requisito)
+
+            if indice is None:
+                externos.append(pre_requisito)
+                self._externas.setdefault(pre_requisito, []).append(i)
+            else:
+                pre_requisitos.append(indice)
+                mascara |= 1 << indice
+
+        self.pre_requisitos.append(tuple(pre_requisitos))
+        self.pre_requisitos_externos.append(tuple(externos))
+        self.mascaras_pre_requisitos.append(mascara)
+
+        if not unidade_curricular.obrigatoria:
+            self.mascara_optativas |= 1 << i
+
+
+    def adicionar(self, unidade_curricular: "UnidadeCurricular") -> bool:
+        '''
+        Método que inclui uma UC recém-adicionada à matriz no grafo, sem recalcular as estruturas das outras UCs.
+        A ordem topológica e o fecho transitivo, se já foram calculados, são estendidos com a nova UC.
+
+        Parâmetros:
+        - unidade_curricular (UnidadeCurricular): UC adicionada ao final da matriz.
+
+        Retorno:
+        - (bool): False se a UC já era citada como pré-requisito por outra, caso em que o grafo precisa ser refeito.
+        '''
+        if unidade_curricular in self._externas:
+            return False
+
+        i = len(self.unidades)
+        self.unidades.append(unidade_curricular)
+        self.indices[unidade_curricular] = i
+        self._indexar(unidade_curricular)
+        self._assinatura = None
+
+        if self._nomes is not None:
+            self._nomes.setdefault(normalizarNome(unidade_curricular.nome), i)
+
+        if self._indice_nomes is not None:
+            self._indice_nomes.adicionar(unidade_curricular.nome)
+
+        unidade_curricular.registrar_grafo(self._referencia)
+        self.versao += 1
+
+        if self._dependentes is not None:
+            self._dependentes.append([])
+            for pre_requisito in self.pre_requisitos[i]:
+                self._dependentes[pre_requisito].append(i)
+
+        if self._ordem is not None:
+            # Todos os pré-requisitos da nova UC já estão no grafo, então ela pode ir para o fim da ordem
+            self._posicoes.append(len(self._ordem))
+            self._ordem.append(i)
+
+            fechamento = 0
+            for pre_requisito in self.pre_requisitos[i]:
+                fechamento |= self._fechamento[pre_requisito] | (1 << pre_requisito)
+            self._fechamento.append(fechamento)
+
+        return True
+
+
+    def atualizar(self, unidade_curricular: "UnidadeCurricular", atributo: str) -> None:
+        '''
+        Método chamado pela UC quando um dos seus atributos muda, que atualiza só as estruturas que dependem dele.
+
+        Parâmetros:
+        - unidade_curricular (UnidadeCurricular): UC alterada.
+        - atributo (str): "nome", "carga_horaria", "pre_requisitos" ou "obrigatoria".
+
+        Retorno:
+        - None.
+        '''
+        i = self.indices.get(unidade_curricular)
+        if i is None:
+            return
+
+        if atributo == "nome":
+            self._nomes = None
+            self._indice_nomes = None
+            self._assinatura = None
+        elif atributo == "carga_horaria":
+            self._assinatura = None
+        elif atributo == "obrigatoria":
+            if unidade_curricular.obrigatoria:
+                self.mascara_optativas &= ~(1 << i)
+            else:
+                self.mascara_optativas |= 1 << i
+
+            self.versao += 1
+        elif atributo == "pre_requisitos":
+            self._religar(i, unidade_curricular)
+            self.versao += 1
+
+
+    def _religar(self, i: int, unidade_curricular: "UnidadeCurricular") -> None:
+        '''
+        Método que refaz os pré-requisitos da UC de índice i e atualiza os dependentes, a ordem e o fecho.
+        '''
+        antigos = self.pre_requisitos[i]
+        novos = []
+        externos = []
+        mascara = 0
+
+        for pre_requisito in self.pre_requisitos_externos[i]:
+            citantes = self._externas[pre_requisito]
+            citantes.remove(i)
+            if not citantes:
+                del self._externas[pre_requisito]
+
+        for pre_requisito in unidade_curricular.pre_requisitos:
+            indice = self.indices.get(pre_requisito)
+
+            if indice is None:
+                externos.append(pre_requisito)
+                self._externas.setdefault(pre_requisito, []).append(i)
+            else:
+                novos.append(indice)
+                mascara |= 1 << indice
+
+        self.pre_requisitos[i] = tuple(novos)
+        self.pre_requisitos_externos[i] = tuple(externos)
+        self.mascaras_pre_requisitos[i] = mascara
+
+        if self._dependentes is not None:
+            for pre_requisito in antigos:
+                self._dependentes[pre_requisito].remove(i)
+            for pre_requisito in novos:
+                self._dependentes[pre_requisito].append(i)
+
+        if self._ordem is None:
+            return
+
+        if any(self._posicoes[pre_requisito] > self._posicoes[i] for pre_requisito in novos):
+            # A nova aresta contraria a ordem atual (ou fecha um ciclo): a ordem é refeita na próxima consulta
+            self._ordem, self._posicoes, self._fechamento = None, None, None
+            return
+
+        # O fecho muda só para a UC e para quem depende dela, direta ou indiretamente, recalculados em ordem
+        afetadas = {i}
+        pilha = [i]
+        dependentes = self.dependentes
+
+        while pilha:
+            for dependente in dependentes[pilha.pop()]:
+                if dependente not in afetadas:
+                    afetadas.add(dependente)
+                    pilha.append(dependente)
+
+        for j in sorted(afetadas, key=self._posicoes.__getitem__):
+            fechamento = 0
+            for pre_requisito in self.pre_requisitos[j]:
+                fechamento |= self._fechamento[pre_requisito] | (1 << pre_requisito)
+            self._fechamento[j] = fechamento
+
+
+    def __len__(self) -> int:
+        '''
+        Método que retorna o número de unidades curriculares do grafo.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - (int): Número de unidades curriculares.
+        '''
+        return len(self.unidades)
+
+
+    @property
+    def assinatura(self) -> str:
+        '''
+        Getter para a assinatura da matriz: um hash curto dos nomes e cargas horárias das UCs, na ordem dos índices.
+        Serve para conferir se índices gravados em arquivo ainda apontam para as mesmas UCs.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - assinatura (str): Hash hexadecimal de 16 caracteres.
+        '''
+        if self._assinatura is None:
+            conteudo = "\n".join(f"{unidade_curricular.nome}|{unidade_curricular.carga_horaria}" for unidade_curricular in self.unidades)
+            self._assinatura = hashlib.blake2b(conteudo.encode("utf-8"), digest_size=8).hexdigest()
+
+        return self._assinatura
+
+
+    @property
+    def nomes(self) -> dict[str, int]:
+        '''
+        Getter para o índice de nomes: nome normalizado (ver normalizarNome) para o índice da UC.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - nomes (dict[str, int]): Índice dos nomes normalizados.
+        '''
+        if self._nomes is None:
+            nomes = {}
+            for i, unidade_curricular in enumerate(self.unidades):
+                nomes.setdefault(normalizarNome(unidade_curricular.nome), i)
+
+            self._nomes = nomes
+
+        return self._nomes
+
+
+    @property
+    def indice_nomes(self) -> "IndiceNomes":
+        '''
+        Getter para o índice de busca aproximada dos nomes das UCs (ver IndiceNomes), com as posições iguais aos
+        índices do grafo. Ele é montado na primeira busca.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - indice_nomes (IndiceNomes): Índice de busca aproximada.
+        '''
+        if self._indice_nomes is None:
+            self._indice_nomes = IndiceNomes(unidade_curricular.nome for unidade_curricular in self.unidades)
+
+        return self._indice_nomes
+
+
+    @property
+    def dependentes(self) -> list[list[int]]:
+        '''
+        Getter para as arestas de saída do grafo: dependentes[i] são os índices das UCs que têm a UC i como
+        pré-requisito direto.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - dependentes (list[list[int]]): Dependentes diretos de cada UC.
+        '''
+        if self._dependentes is None:
+            dependentes = [[] for _ in self.unidades]
+
+            for i, pre_requisitos in enumerate(self.pre_requisitos):
+                for pre_requisito in pre_requisitos:
+                    dependentes[pre_requisito].append(i)
+
+            self._dependentes = dependentes
+
+        return self._dependentes
+
+
+    def dependentes_externos(self, unidade_curricular: "UnidadeCurricular") -> list[int]:
+        '''
+        Método que retorna as UCs da matriz que têm como pré-requisito uma UC de fora da matriz.
+
+        Parâmetros:
+        - unidade_curricular (UnidadeCurricular): UC de fora da matriz.
+
+        Retorno:
+        - (list[int]): Índices das UCs que a citam (vazia se nenhuma cita).
+        '''
+        return self._externas.get(unidade_curricular, [])
+
+
+    def _calcularOrdem(self) -> None:
+        '''
+        Método que calcula a ordem topológica (algoritmo de Kahn) e, seguindo essa ordem, o fecho transitivo dos
+        pré-requisitos de cada UC: fecho[i] = OU de (fecho[p] | bit p) para cada pré-requisito p de i.
+        '''
+        n = len(self.unidades)
+        pendentes = [len(pre_requisitos) for pre_requisitos in self.pre_requisitos]
+        dependentes = self.dependentes
+
+        ordem = [i for i in range(n) if pendentes[i] == 0]
+
+        for i in ordem:
+            for dependente in dependentes[i]:
+                pendentes[dependente] -= 1
+                if pendentes[dependente] == 0:
+                    ordem.append(dependente)
+
+        if len(ordem) < n:
+            ciclo = ", ".join(self.unidades[i].nome for i in range(n) if pendentes[i] > 0)
+            raise CursoException("CicloPreRequisitos", f"Os pré-requisitos das unidades curriculares formam um ciclo: {ciclo}.")
+
+        fechamento = [0] * n
+        for i in ordem:
+            mascara = 0
+            for pre_requisito in self.pre_requisitos[i]:
+                mascara |= fechamento[pre_requisito] | (1 << pre_requisito)
+            fechamento[i] = mascara
+
+        posicoes = [0] * n
+        for posicao, i in enumerate(ordem):
+            posicoes[i] = posicao
+
+        self._ordem      = ordem
+        self._posicoes   = posicoes
+        self._fechamento = fechamento
+
+
+    @property
+    def ordem_topologica(self) -> list[int]:
+        '''
+        Getter para a ordem topológica dos índices: cada UC aparece depois de todos os seus pré-requisitos.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - ordem (list[int]): Índices das UCs em ordem topológica.
+        '''
+        if self._ordem is None:
+            self._calcularOrdem()
+
+        return self._ordem
+
+
+    @property
+    def fechamento(self) -> list[int]:
+        '''
+        Getter para o fecho transitivo: fechamento[i] é o bitset de todas as UCs que precisam ser cursadas, direta ou
+        indiretamente, antes da UC de índice i.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - fechamento (list[int]): Bitset do fecho de cada UC.
+        '''
+        if self._fechamento is None:
+            self._calcularOrdem()
+
+        return self._fechamento
+
+
+    def ordenar(self, mascara: int) -> list["UnidadeCurricular"]:
+        '''
+        Método que converte um bitset para a lista de UCs em ordem topológica.
+
+        Parâmetros:
+        - mascara (int): Bitset com os índices das unidades.
+
+        Retorno:
+        - (list[UnidadeCurricular]): Unidades do bitset, cada uma depois dos seus pré-requisitos.
+        '''
+        if self._posicoes is None:
+            self._calcularOrdem()
+
+        indices = [i for i, bit in enumerate(bin(mascara)[:1:-1]) if bit == "1"]
+        indices.sort(key=self._posicoes.__getitem__)
+
+        return [self.unidades[i] for i in indices]
+
+
+    def mascara(self, unidades_curriculares: list["UnidadeCurricular"]) -> int:
+        '''
+        Método que converte uma lista de unidades curriculares em um bitset. UCs fora da matriz são ignoradas.
+
+        Parâmetros:
+        - unidades_curriculares (list[UnidadeCurricular]): Unidades curriculares.
+
+        Retorno:
+        - mascara (int): Bitset com os índices das unidades.
+        '''
+        mascara = 0
+
+        for unidade_curricular in unidades_curriculares:
+            indice = self.indices.get(unidade_curricular)
+            if indice is not None:
+                mascara |= 1 << indice
+
+        return mascara
+
+
+    def unidades_da_mascara(self, mascara: int) -> list["UnidadeCurricular"]:
+        '''
+        Método que converte um bitset de volta para a lista de unidades curriculares, na ordem da matriz.
+
+        Parâmetros:
+        - mascara (int): Bitset com os índices das unidades.
+
+        Retorno:
+        - (list[UnidadeCurricular]): Unidades curriculares do bitset.
+        '''
+        bits = bin(mascara)[:1:-1]
+        return [self.unidades[i] for i, bit in enumerate(bits) if bit == "1"]
+
+
+    def optativas_cursaveis_lote(self, lote_cursadas: list[list["UnidadeCurricular"]]) -> list[list["UnidadeCurricular"]]:
+        '''
+        Método que calcula as optativas cursáveis de vários estudantes de uma só vez.
+
+        Em vez de um bitset de UCs por estudante, o lote é "transposto": para cada UC é montado um bitset com os
+        estudantes que já a cursaram (bit s ligado para o estudante s). Assim, os estudantes que podem cursar a
+        optativa i são calculados com uma operação AND por pré-requisito, e cada operação trata o lote inteiro.
+        O custo fica em O(arestas de pré-requisito × N/64) operações de máquina, em vez de O(N × arestas) passos
+        do interpretador.
+
+        Parâmetros:
+        - lote_cursadas (list[list[UnidadeCurricular]]): Unidades cursadas por cada estudante.
+
+        Retorno:
+        - (list[list[UnidadeCurricular]]): Optativas cursáveis de cada estudante, na ordem do lote.
+        '''
+        n_estudantes = len(lote_cursadas)
+        n_bytes = (n_estudantes + 7) // 8
+
+        colunas = [None] * len(self.unidades)
+        colunas_externas = {}
+
+        for estudante, cursadas in enumerate(lote_cursadas):
+            byte, bit = estudante >> 3, 1 << (estudante & 7)
+
+            for unidade_curricular in cursadas:
+                indice = self.indices.get(unidade_curricular)
+
+                if indice is not None:
+                    coluna = colunas[indice]
+                    if coluna is None:
+                        coluna = colunas[indice] = bytearray(n_bytes)
+                elif unidade_curricular in self._externas:
+                    coluna = colunas_externas.get(unidade_curricular)
+                    if coluna is None:
+                        coluna = colunas_externas[unidade_curricular] = bytearray(n_bytes)
+                else:
+                    continue
+
+                coluna[byte] |= bit
+
+        estudantes = [int.from_bytes(coluna, "little") if coluna is not None else 0 for coluna in colunas]
+        estudantes_externas = {unidade_curricular: int.from_bytes(coluna, "little") for unidade_curricular, coluna in colunas_externas.items()}
+        todos = (1 << n_estudantes) - 1
+
+        resultado = [[] for _ in range(n_estudantes)]
+
+        for i, unidade_curricular in enumerate(self.unidades):
+            if unidade_curricular.obrigatoria:
+                continue
+
+            aptos = todos & ~estudantes[i]
+            for pre_requisito in self.pre_requisitos[i]:
+                aptos &= estudantes[pre_requisito]
+                if aptos == 0:
+                    break
+
+            for pre_requisito in self.pre_requisitos_externos[i]:
+                aptos &= estudantes_externas.get(pre_requisito, 0)
+
+            bits = bin(aptos)[:1:-1]
+            estudante = bits.find("1")
+            while estudante != -1:
+                resultado[estudante].append(unidade_curricular)
+                estudante = bits.find("1", estudante + 1)
+
+        return resultado
@@ -0,0 +1,228 @@
+# Imports de sistema
+import heapq
+import re
+from collections import Counter
+from typing import Iterable
+
+# Imports locais
+from src.Normalizacao import normalizarNome
+
+
+class IndiceNomes:
+    '''
+    Este arquivo contém a classe do índice de busca aproximada de nomes de unidades curriculares, usado quando o nome
+    digitado pelo estudante, ou lido de uma célula de pré-requisitos, não é exatamente igual ao nome da matriz.
+
+    Os nomes passam por normalizarNome (acentos, maiúsculas e espaços), perdem a pontuação e têm os números de 1 a 10
+    trocados por algarismos romanos ("Cálculo 1" vira "calculo i"). Cada nome é indexado pelos trigramas das suas
+    palavras (listas invertidas de trigrama para nomes). Uma busca reúne os candidatos que têm trigramas em comum com
+    a consulta e os ordena por uma nota entre 0 e 1 que combina (com peso maior para a melhor das duas):
+    - a semelhança de trigramas (coeficiente de Dice), que tolera erros de digitação;
+    - quantas palavras da consulta e do nome se correspondem, aceitando abreviações ("Alg. e Prog. I") e pequenas
+      diferenças no fim da palavra.
+
+    Em buscar() um algarismo romano diferente só diminui a nota, pois os resultados são sugestões. Já melhor(), que
+    escolhe a UC sem confirmação, descarta os nomes cujos algarismos romanos não são exatamente os da consulta:
+    "Cálculo I" não é "Cálculo II", e "Estruturas de Dados II" não é "Estruturas de Dados".
+    '''
+
+    ROMANOS = {"1": "i", "2": "ii", "3": "iii", "4": "iv", "5": "v", "6": "vi", "7": "vii", "8": "viii", "9": "ix", "10": "x"}
+    NUMERAIS = frozenset(ROMANOS.values())
+    IGNORADAS = frozenset({"a", "o", "e", "de", "da", "do", "das", "dos", "em", "na", "no", "para", "com"})
+
+    # Número de candidatos, pela semelhança de trigramas, que recebem a nota completa
+    CANDIDATOS = 32
+
+
+    def __init__(self, nomes: Iterable[str] = ()) -> None:
+        '''
+        Construtor da classe IndiceNomes.
+
+        Parâmetros:
+        - nomes (Iterable[str]): Nomes indexados. O resultado das buscas é a posição do nome nesta sequência.
+
+        Retorno:
+        - None.
+        '''
+        self._formas     = []
+        self._palavras   = []
+        self._relevantes = []
+        self._trigramas  = []
+        self._numerais   = []
+        self._exatos     = {}
+        self._invertidos = {}
+
+        for nome in nomes:
+            self.adicionar(nome)
+
+
+    def __len__(self) -> int:
+        return len(self._formas)
+
+
+    @classmethod
+    def _palavrasDe(cls, nome: str) -> list[str]:
+        '''
+        Método que divide um nome em palavras normalizadas, com os números trocados por algarismos romanos.
+        '''
+        return [cls.ROMANOS.get(palavra, palavra) for palavra in re.findall(r"[a-z0-9]+", normalizarNome(nome))]
+
+
+    @staticmethod
+    def _trigramasDe(palavras: list[str]) -> set[str]:
+        '''
+        Método que retorna os trigramas das palavras, cada uma com espaços nas pontas para marcar início e fim.
+        '''
+        trigramas = set()
+
+        for palavra in palavras:
+            palavra = f" {palavra} "
+            trigramas.update(palavra[i:i + 3] for i in range(len(palavra) - 2))
+
+        return trigramas
+
+
+    @classmethod
+    def _correspondem(cls, consulta: str, palavra: str) -> bool:
+        '''
+        Método que informa se uma palavra da consulta corresponde a uma palavra de um nome.
+        '''
+        if consulta == palavra:
+            return True
+
+        if consulta in cls.NUMERAIS or palavra in cls.NUMERAIS:
+            return False
+
+        # Abreviação ("prog" -> "programacao") ou diferença só no fim da palavra ("algoritimos" -> "algoritmos")
+        return (len(consulta) >= 3 and palavra.startswith(consulta)) or (len(consulta) >= 5 and len(palavra) >= 5 and consulta[:4] == palavra[:4])
+
+
+    @classmethod
+    def _significativas(cls, palavras: list[str]) -> list[str]:
+        '''
+        Método que retorna as palavras sem as preposições e artigos (ou todas, se só houver essas).
+        '''
+        return [palavra for palavra in palavras if palavra not in cls.IGNORADAS] or palavras
+
+
+    @classmethod
+    def _numeraisDe(cls, palavras: list[str]) -> tuple[str, ...]:
+        '''
+        Método que retorna os algarismos romanos das palavras, na ordem em que aparecem.
+        '''
+        return tuple(palavra for palavra in palavras if palavra in cls.NUMERAIS)
+
+
+    def adicionar(self, nome: str) -> int:
+        '''
+        Método que adiciona um nome ao índice.
+
+        Parâmetros:
+        - nome (str): Nome da unidade curricular.
+
+        Retorno:
+        - (int): Posição do nome no índice.
+        '''
+        i = len(self._formas)
+        palavras = self._palavrasDe(nome)
+        trigramas = self._trigramasDe(palavras)
+        forma = " ".join(palavras)
+
+        self._formas.append(forma)
+        self._palavras.append(palavras)
+        self._relevantes.append(self._significativas(palavras))
+        self._trigramas.append(len(trigramas))
+        self._numerais.append(self._numeraisDe(palavras))
+        self._exatos.setdefault(forma, i)
+
+        for trigrama in trigramas:
+            self._invertidos.setdefault(trigrama, []).append(i)
+
+        return i
+
+
+    def buscar(self, consulta: str, limite: int = 5, minimo: float = 0.5) -> list[tuple[int, float]]:
+        '''
+        Método que procura os nomes mais parecidos com a consulta.
+
+        Parâmetros:
+        - consulta (str): Nome procurado, como digitado.
+        - limite (int): Número máximo de resultados.
+        - minimo (float): Nota mínima (entre 0 e 1) de um resultado.
+
+        Retorno:
+        - (list[tuple[int, float]]): Pares (posição do nome, nota), da maior nota para a menor.
+        '''
+        palavras = self._palavrasDe(consulta)
+        trigramas = self._trigramasDe(palavras)
+
+        if not trigramas:
+            return []
+
+        comuns = Counter()
+        for trigrama in trigramas:
+            comuns.update(self._invertidos.get(trigrama, ()))
+
+        dice = {i: 2 * n / (len(trigramas) + self._trigramas[i]) for i, n in comuns.items()}
+
+        significativas = self._significativas(palavras)
+
+        # Palavra do índice -> palavras da consulta que correspondem a ela. Os candidatos costumam repetir palavras,
+        # então cada palavra é comparada com a consulta uma única vez.
+        casadas = {}
+
+        resultados = []
+        for i in heapq.nlargest(self.CANDIDATOS, dice, key=dice.__getitem__):
+            cobertas = set()
+            for outra in self._palavras[i]:
+                correspondentes = casadas.get(outra)
+
+                if correspondentes is None:
+                    correspondentes = casadas[outra] = frozenset(
+                        palavra for palavra in significativas if self._correspondem(palavra, outra) or self._correspondem(outra, palavra)
+                    )
+
+                cobertas |= correspondentes
+
+            relevantes = self._relevantes[i]
+            cobertura = (len(cobertas) / len(significativas) + sum(1 for outra in relevantes if casadas[outra]) / len(relevantes)) / 2
+            nota = 0.7 * max(cobertura, dice[i]) + 0.3 * min(cobertura, dice[i])
+
+            if nota >= minimo:
+                resultados.append((i, nota))
+
+        resultados.sort(key=lambda resultado: (-resultado[1], resultado[0]))
+        return resultados[:limite]
+
+
+    def melhor(self, consulta: str, minimo: float = 0.8) -> int:
+        '''
+        Método que retorna o nome que corresponde à consulta, quando há um único candidato claro.
+
+        Parâmetros:
+        - consulta (str): Nome procurado, como digitado.
+        - minimo (float): Nota mínima para aceitar o resultado.
+
+        Retorno:
+        - (int): Posição do nome, ou None se nenhum nome com os mesmos algarismos romanos da consulta atingir a nota
+          mínima, ou se houver empate entre nomes diferentes.
+        '''
+        palavras = self._palavrasDe(consulta)
+
+        exato = self._exatos.get(" ".join(palavras))
+        if exato is not None:
+            return exato
+
+        numerais = self._numeraisDe(palavras)
+        resultados = [
+            resultado for resultado in self.buscar(consulta, limite=self.CANDIDATOS, minimo=minimo)
+            if self._numerais[resultado[0]] == numerais
+        ]
+
+        if not resultados:
+            return None
+
+        if len(resultados) >= 2 and resultados[0][1] - resultados[1][1] < 0.05 and self._formas[resultados[0][0]] != self._formas[resultados[1][0]]:
+            return None
+
+        return resultados[0][0]
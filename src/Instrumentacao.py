@@ -0,0 +1,282 @@
+# Imports de sistema
+import functools
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Iterator
+
+# Imports locais
+from src.Curso import Curso
+from src.UnidadeCurricular import UnidadeCurricular
+
+
+'''
+Este arquivo contém a instrumentação opcional do carregamento de cursos, usada para descobrir para onde vai o tempo
+quando um curso demora a carregar: rede, parsing do HTML, filtragem das linhas, vinculação dos pré-requisitos ou
+construção dos objetos.
+
+A instrumentação começa desligada. Desligada, etapa() devolve sempre o mesmo contexto vazio e registrarResposta()
+retorna na primeira linha, então o custo no scraper é de uma chamada de função por etapa. Ligada com ativar():
+- as etapas marcadas no scraper (with etapa("parsing"): ...) acumulam o número de chamadas e o tempo total;
+- cada resposta HTTP soma nos contadores de requisições, de bytes e de status;
+- os construtores de UnidadeCurricular e Curso (o que valida e o de_confianca) são envolvidos para contar os objetos
+  criados e o tempo gasto neles. O envolvimento é desfeito em desativar(), então não custa nada desligado;
+- opcionalmente, um cProfile da thread que chamou ativar() é gravado em desativar().
+
+As etapas podem ser aninhadas (a construção das UCs acontece dentro da filtragem) e, com várias threads, os tempos
+são somados entre elas, então o total das etapas pode passar do tempo de relógio da execução.
+'''
+
+# Construtores envolvidos enquanto a instrumentação está ligada
+CONSTRUTORES = ((UnidadeCurricular, "__init__"), (UnidadeCurricular, "de_confianca"), (Curso, "__init__"), (Curso, "de_confianca"))
+
+ativa = False
+
+_lock        = threading.Lock()
+_etapas      = {}
+_contadores  = {}
+_construcoes = {}
+_originais   = []
+_perfil      = None
+_caminho     = None
+_inicio      = None
+_NULO        = nullcontext()
+
+
+def zerar() -> None:
+    '''
+    Função que descarta as medições acumuladas até agora.
+
+    Parâmetros:
+    - None.
+
+    Retorno:
+    - None.
+    '''
+    global _inicio
+
+    with _lock:
+        _etapas.clear()
+        _contadores.clear()
+        _construcoes.clear()
+        _inicio = time.perf_counter()
+
+
+def _acumular(nome: str, segundos: float) -> None:
+    '''
+    Função que soma uma chamada e a sua duração a uma etapa.
+    '''
+    with _lock:
+        medicao = _etapas.get(nome)
+
+        if medicao is None:
+            _etapas[nome] = [1, segundos]
+        else:
+            medicao[0] += 1
+            medicao[1] += segundos
+
+
+@contextmanager
+def _cronometrar(nome: str) -> Iterator[None]:
+    '''
+    Função que mede a duração do bloco e a acumula na etapa.
+    '''
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        _acumular(nome, time.perf_counter() - inicio)
+
+
+def etapa(nome: str):
+    '''
+    Função que devolve o contexto que mede uma etapa.
+
+    Exemplo:
+        with Instrumentacao.etapa("parsing"):
+            linhas = extrairLinhas(html, "tbody")
+
+    Parâmetros:
+    - nome (str): Nome da etapa.
+
+    Retorno:
+    - (ContextManager): Contexto que acumula a duração do bloco na etapa, ou um contexto vazio se a instrumentação
+      estiver desligada.
+    '''
+    if not ativa:
+        return _NULO
+
+    return _cronometrar(nome)
+
+
+def contar(nome: str, quantidade: int = 1) -> None:
+    '''
+    Função que soma uma quantidade a um contador.
+
+    Parâmetros:
+    - nome (str): Nome do contador.
+    - quantidade (int): Quantidade somada.
+
+    Retorno:
+    - None.
+    '''
+    if not ativa:
+        return
+
+    with _lock:
+        _contadores[nome] = _contadores.get(nome, 0) + quantidade
+
+
+def registrarResposta(resposta: "requests.Response", stream: bool = False) -> None:
+    '''
+    Função que registra uma resposta HTTP nos contadores de requisições, de bytes e de status.
+
+    Parâmetros:
+    - resposta (requests.Response): Resposta recebida.
+    - stream (bool): Se o corpo ainda não foi lido. Nesse caso o tamanho é o do cabeçalho Content-Length, quando
+      houver, para não consumir o corpo.
+
+    Retorno:
+    - None.
+    '''
+    if not ativa:
+        return
+
+    if stream:
+        tamanho = int(resposta.headers.get("Content-Length", 0))
+    else:
+        tamanho = len(resposta.content)
+
+    contar("http.requisicoes")
+    contar("http.bytes", tamanho)
+    contar(f"http.status.{resposta.status_code}")
+
+
+def _envolver(classe: type, atributo: str) -> None:
+    '''
+    Função que troca um construtor por uma versão que conta os objetos criados e mede o tempo gasto.
+    '''
+    original = classe.__dict__[atributo]
+    metodo = original.__func__ if isinstance(original, classmethod) else original
+    nome = f"construcao.{classe.__name__}.{atributo}"
+
+    @functools.wraps(metodo)
+    def envolvido(*args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return metodo(*args, **kwargs)
+        finally:
+            _acumular(nome, time.perf_counter() - inicio)
+
+            with _lock:
+                _construcoes[classe.__name__] = _construcoes.get(classe.__name__, 0) + 1
+
+    setattr(classe, atributo, classmethod(envolvido) if isinstance(original, classmethod) else envolvido)
+    _originais.append((classe, atributo, original))
+
+
+def ativar(perfil: str = None) -> None:
+    '''
+    Função que liga a instrumentação, descartando as medições anteriores.
+
+    Parâmetros:
+    - perfil (str): Caminho onde um cProfile da thread atual é gravado em desativar() (opcional). O arquivo pode ser
+      lido com pstats ou com ferramentas como o snakeviz.
+
+    Retorno:
+    - None.
+    '''
+    global ativa, _perfil, _caminho
+
+    if ativa:
+        desativar()
+
+    zerar()
+
+    for classe, atributo in CONSTRUTORES:
+        _envolver(classe, atributo)
+
+    if perfil is not None:
+        import cProfile
+
+        _perfil = cProfile.Profile()
+        _caminho = perfil
+        _perfil.enable()
+
+    ativa = True
+
+
+def desativar() -> None:
+    '''
+    Função que desliga a instrumentação, restaura os construtores e grava o cProfile, se ele foi pedido. As medições
+    continuam disponíveis em resumo() até a próxima chamada de ativar() ou zerar().
+
+    Parâmetros:
+    - None.
+
+    Retorno:
+    - None.
+    '''
+    global ativa, _perfil, _caminho
+
+    ativa = False
+
+    while _originais:
+        classe, atributo, original = _originais.pop()
+        setattr(classe, atributo, original)
+
+    if _perfil is not None:
+        _perfil.disable()
+        _perfil.dump_stats(_caminho)
+        _perfil, _caminho = None, None
+
+
+def resumo() -> dict:
+    '''
+    Função que retorna as medições acumuladas.
+
+    Parâmetros:
+    - None.
+
+    Retorno:
+    - (dict): Dicionário com:
+      - "duracao_ms": tempo de relógio desde ativar() (ou zerar());
+      - "etapas": para cada etapa, o número de chamadas, o tempo total em milissegundos e a média em microssegundos;
+      - "contadores": requisições HTTP, bytes, status e outros contadores;
+      - "construcoes": número de objetos criados por classe.
+    '''
+    with _lock:
+        etapas = {
+            nome: {"chamadas": chamadas, "total_ms": segundos * 1000, "media_us": segundos / chamadas * 1e6}
+            for nome, (chamadas, segundos) in _etapas.items()
+        }
+
+        return {
+            "duracao_ms": (time.perf_counter() - _inicio) * 1000 if _inicio is not None else 0.0,
+            "etapas": dict(sorted(etapas.items(), key=lambda item: -item[1]["total_ms"])),
+            "contadores": dict(sorted(_contadores.items())),
+            "construcoes": dict(sorted(_construcoes.items())),
+        }
+
+
+def gravarResumo(caminho: str = None) -> None:
+    '''
+    Função que grava o resumo em JSON.
+
+    Parâmetros:
+    - caminho (str): Arquivo de saída. Se não for informado, o resumo é escrito na saída de erro, para não se misturar
+      com a saída dos comandos.
+
+    Retorno:
+    - None.
+    '''
+    texto = json.dumps(resumo(), ensure_ascii=False, indent=2)
+
+    if caminho is None:
+        print(texto, file=sys.stderr)
+        return
+
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write(texto + "\n")
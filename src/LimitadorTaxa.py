@@ -0,0 +1,52 @@
+# Imports de sistema
+import threading
+import time
+
+
+class LimitadorTaxa:
+    '''
+    Este arquivo contém a classe responsável por limitar a taxa de requisições feitas a cada host. Ela é usada pelo
+    scraper para não sobrecarregar o site da UFMS quando vários cursos são baixados ao mesmo tempo.
+
+    Cada host tem o seu próprio horário da próxima requisição permitida. Uma thread que chama aguardar() reserva o
+    próximo horário livre e dorme até ele, então as requisições ficam espaçadas de maneira uniforme mesmo quando
+    várias threads pedem ao mesmo tempo.
+    '''
+
+
+    def __init__(self, requisicoes_por_segundo: float) -> None:
+        '''
+        Construtor da classe LimitadorTaxa.
+
+        Parâmetros:
+        - requisicoes_por_segundo (float): Número máximo de requisições por segundo para cada host.
+
+        Retorno:
+        - None.
+        '''
+        if requisicoes_por_segundo <= 0:
+            raise ValueError("O número de requisições por segundo deve ser positivo.")
+
+        self.intervalo = 1 / requisicoes_por_segundo
+
+        self._lock    = threading.Lock()
+        self._proximo = {}
+
+
+    def aguardar(self, host: str) -> None:
+        '''
+        Método que bloqueia a thread até que uma nova requisição ao host seja permitida.
+
+        Parâmetros:
+        - host (str): Host que será acessado.
+
+        Retorno:
+        - None.
+        '''
+        with self._lock:
+            agora = time.monotonic()
+            horario = max(agora, self._proximo.get(host, agora))
+            self._proximo[host] = horario + self.intervalo
+
+        if horario > agora:
+            time.sleep(horario - agora)
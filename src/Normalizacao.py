@@ -0,0 +1,24 @@
+# Imports de sistema
+import unicodedata
+
+
+'''
+Este arquivo contém as funções de normalização de nomes de unidades curriculares, usadas para comparar nomes vindos
+de fontes diferentes (a tabela do site, arquivos digitados pelo estudante) sem depender de acentos, maiúsculas ou
+espaços.
+'''
+
+
+def normalizarNome(nome: str) -> str:
+    '''
+    Função que normaliza o nome de uma UC para comparação: remove acentos, ignora maiúsculas/minúsculas e
+    espaços repetidos.
+
+    Parâmetros:
+    - nome (str): Nome da unidade curricular.
+
+    Retorno:
+    - (str): Nome normalizado.
+    '''
+    sem_acentos = unicodedata.normalize("NFKD", nome).encode("ascii", "ignore").decode("ascii")
+    return " ".join(sem_acentos.casefold().split())
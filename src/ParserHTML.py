@@ -0,0 +1,369 @@
+'''
+Este arquivo contém a camada de parsing de HTML usada pelo scraper. As páginas do site da UFMS são grandes (menus,
+rodapé, scripts), mas o scraper só precisa de um elemento de cada uma: as linhas do <tbody> da matriz ou o texto do
+<small> com o nome do curso. Por isso as funções daqui devolvem apenas textos (e não a árvore do BeautifulSoup), e
+existem dois backends:
+
+- "lxml": usado quando o lxml está instalado. A página é lida pelo parser em C do lxml e só o elemento procurado é
+  percorrido, o que é cerca de uma ordem de grandeza mais rápido que o BeautifulSoup.
+- "html.parser": o BeautifulSoup com o parser puro em Python, como antes, mas montando apenas a árvore do elemento
+  procurado (SoupStrainer).
+
+Também há uma versão incremental da leitura das linhas (iterarLinhas), que recebe a página em pedaços conforme ela
+chega pela rede e devolve cada linha assim que o seu </tr> é lido, sem guardar a árvore inteira em memória.
+
+Todos os caminhos devolvem os mesmos textos: a página é decodificada com a codificação declarada nela (<meta charset>,
+ou UTF-8 se não houver declaração), e dentro de uma célula só os <br> viram QUEBRA; o texto de outras tags, como <b>
+ou <a>, é unido sem separador, e o restante do espaço em branco (inclusive as quebras de linha do código da página,
+quando um nome longo é quebrado no HTML) vira um único espaço, sem espaços nas pontas de cada trecho.
+
+Nenhum dos dois backends é importado junto com este arquivo: o lxml e o BeautifulSoup só são carregados na primeira
+página lida, para que os comandos que não acessam o site (como abrir um perfil salvo) iniciem rápido.
+'''
+
+# Imports de sistema
+import codecs
+import itertools
+import re
+from html.parser import HTMLParser
+from importlib.util import find_spec
+from typing import Iterable, Iterator
+
+
+# find_spec só procura o pacote, sem importá-lo
+PARSER = "lxml" if find_spec("lxml") is not None else "html.parser"
+
+# Como nos navegadores, a declaração da codificação é procurada só no início da página
+TAMANHO_DECLARACAO = 1024
+_DECLARACAO = re.compile(rb"""<meta[^>]*?charset\s*=\s*["']?\s*([-\w.:]+)""", re.IGNORECASE)
+
+# Separador posto no lugar de cada <br> no texto das células. Como as outras quebras de linha viram espaços, ele só
+# aparece onde a página tinha um <br>
+QUEBRA = "\n"
+
+# Marca provisória dos <br> enquanto a célula é lida: um caractere de uso privado do Unicode, que não aparece no texto
+# das páginas e que o lxml aceita (ele recusa caracteres de controle)
+_MARCA_BR = "\ue000"
+
+
+def configurarParser(parser: str) -> None:
+    '''
+    Função que troca o backend de parsing ("lxml" ou "html.parser").
+
+    Parâmetros:
+    - parser (str): Nome do backend.
+
+    Retorno:
+    - None.
+    '''
+    global PARSER
+
+    if parser not in ("lxml", "html.parser"):
+        raise ValueError(f"Parser desconhecido: {parser}.")
+
+    PARSER = parser
+
+
+def codificacaoDeclarada(inicio: bytes) -> str:
+    '''
+    Função que retorna a codificação declarada no início de uma página (<meta charset="..."> ou
+    <meta http-equiv="Content-Type" content="...; charset=...">).
+
+    Parâmetros:
+    - inicio (bytes): Início da página. Só os primeiros TAMANHO_DECLARACAO bytes são lidos.
+
+    Retorno:
+    - (str): Nome da codificação no Python, ou "utf-8" se a página não declarar uma codificação conhecida.
+    '''
+    declaracao = _DECLARACAO.search(inicio, 0, TAMANHO_DECLARACAO)
+    if declaracao is None:
+        return "utf-8"
+
+    try:
+        nome = codecs.lookup(declaracao.group(1).decode("ascii")).name
+    except LookupError:
+        return "utf-8"
+
+    # Uma página lida como bytes e com <meta> em ASCII não pode estar em UTF-16, então a declaração está errada
+    return "utf-8" if nome.startswith("utf-16") else nome
+
+
+def _decodificar(html: bytes) -> str:
+    '''
+    Função que decodifica a página inteira com a codificação declarada nela.
+    '''
+    if isinstance(html, str):
+        return html
+
+    return html.decode(codificacaoDeclarada(html), errors="replace")
+
+
+def _lerInicio(pedacos: Iterable[bytes]) -> tuple[bytes, Iterator[bytes]]:
+    '''
+    Função que junta os primeiros pedaços da página até haver bytes suficientes para achar a declaração da
+    codificação. Retorna o início e os pedaços restantes (ou, se os pedaços já forem str, o primeiro e os restantes).
+    '''
+    pedacos = iter(pedacos)
+    inicio = b""
+
+    for pedaco in pedacos:
+        if isinstance(pedaco, str):
+            return inicio.decode("utf-8") + pedaco, pedacos
+
+        inicio += pedaco
+        if len(inicio) >= TAMANHO_DECLARACAO:
+            break
+
+    return inicio, pedacos
+
+
+def _decodificarPedacos(inicio: bytes, pedacos: Iterator[bytes]) -> Iterator[str]:
+    '''
+    Função que decodifica a página conforme os pedaços chegam, com a codificação declarada no início (ver _lerInicio).
+    '''
+    if isinstance(inicio, str):
+        yield inicio
+        yield from pedacos
+        return
+
+    decodificador = codecs.getincrementaldecoder(codificacaoDeclarada(inicio))(errors="replace")
+    yield decodificador.decode(inicio)
+
+    for pedaco in pedacos:
+        yield decodificador.decode(pedaco)
+
+    yield decodificador.decode(b"", final=True)
+
+
+def _limparCelula(texto: str) -> str:
+    '''
+    Função que troca as marcas dos <br> por QUEBRA e reduz o espaço em branco entre elas a um único espaço, sem
+    espaços no começo e no fim de cada trecho.
+    '''
+    if _MARCA_BR not in texto:
+        return " ".join(texto.split())
+
+    return QUEBRA.join(" ".join(trecho.split()) for trecho in texto.split(_MARCA_BR))
+
+
+def _marcarQuebrasLxml(elemento) -> None:
+    '''
+    Função que põe a marca de quebra no lugar de cada <br> dentro do elemento lido pelo lxml, para que o itertext()
+    das células a inclua.
+    '''
+    for br in elemento.iter("br"):
+        br.tail = _MARCA_BR + br.tail if br.tail else _MARCA_BR
+
+
+def _textoCelulaSoup(td) -> str:
+    '''
+    Função que retorna o texto de uma célula lida pelo BeautifulSoup, com QUEBRA no lugar de cada <br>.
+    '''
+    for br in td.find_all("br"):
+        br.replace_with(_MARCA_BR)
+
+    return _limparCelula(td.get_text())
+
+
+def _elementoLxml(html: bytes, tag: str):
+    '''
+    Função que procura o primeiro elemento com a tag informada usando o lxml.
+    '''
+    import lxml.html
+
+    if isinstance(html, bytes):
+        codificacao = codificacaoDeclarada(html)
+
+        # O lxml decodifica UTF-8 sozinho, sem a cópia da página em str; as outras codificações são lidas pelo Python
+        if codificacao == "utf-8":
+            return lxml.html.document_fromstring(html, parser=lxml.html.HTMLParser(encoding="utf-8")).find(f".//{tag}")
+
+        html = html.decode(codificacao, errors="replace")
+
+    return lxml.html.document_fromstring(html).find(f".//{tag}")
+
+
+def _elementoSoup(html: bytes, tag: str):
+    '''
+    Função que procura o primeiro elemento com a tag informada usando o BeautifulSoup, montando só esse elemento.
+    '''
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    return BeautifulSoup(_decodificar(html), "html.parser", parse_only=SoupStrainer(tag)).find(tag)
+
+
+def extrairTexto(html: bytes, tag: str) -> str:
+    '''
+    Função que retorna o texto do primeiro elemento com a tag informada.
+
+    Parâmetros:
+    - html (bytes): Conteúdo da página.
+    - tag (str): Tag do elemento procurado.
+
+    Retorno:
+    - (str): Texto do elemento, ou None se a página não tiver o elemento.
+    '''
+    if PARSER == "lxml":
+        elemento = _elementoLxml(html, tag)
+        return None if elemento is None else "".join(elemento.itertext())
+
+    elemento = _elementoSoup(html, tag)
+    return None if elemento is None else elemento.get_text()
+
+
+def extrairLinhas(html: bytes, tag: str = "tbody") -> list[list[str]]:
+    '''
+    Função que retorna o texto das células de cada linha (<tr>) do primeiro elemento com a tag informada. Dentro de
+    uma célula, cada <br> vira QUEBRA e o restante do espaço em branco vira um único espaço.
+
+    Parâmetros:
+    - html (bytes): Conteúdo da página.
+    - tag (str): Tag do elemento que contém as linhas.
+
+    Retorno:
+    - linhas (list[list[str]]): Textos das células de cada linha, ou None se a página não tiver o elemento.
+    '''
+    if PARSER == "lxml":
+        elemento = _elementoLxml(html, tag)
+        if elemento is None:
+            return None
+
+        _marcarQuebrasLxml(elemento)
+        return [[_limparCelula("".join(td.itertext())) for td in tr.iter("td")] for tr in elemento.iter("tr")]
+
+    elemento = _elementoSoup(html, tag)
+    if elemento is None:
+        return None
+
+    return [[_textoCelulaSoup(td) for td in tr.find_all("td")] for tr in elemento.find_all("tr")]
+
+
+class _LeitorLinhas(HTMLParser):
+    '''
+    Parser incremental (html.parser da biblioteca padrão) que junta o texto das células de cada linha do primeiro
+    elemento com a tag informada. As linhas completas ficam em self.linhas até serem consumidas.
+    '''
+
+    def __init__(self, tag: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.tag       = tag
+        self.linhas    = []
+        self.terminado = False
+
+        self._profundidade = 0
+        self._linha        = None
+        self._celula       = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.terminado:
+            return
+
+        if tag == self.tag:
+            self._profundidade += 1
+        elif self._profundidade == 0:
+            return
+        elif tag == "tr":
+            self._linha = []
+        elif tag == "td" and self._linha is not None:
+            self._celula = []
+        elif tag == "br" and self._celula is not None:
+            self._celula.append(_MARCA_BR)
+
+    def handle_endtag(self, tag):
+        if self.terminado or self._profundidade == 0:
+            return
+
+        if tag == "td" and self._celula is not None:
+            self._linha.append(_limparCelula("".join(self._celula)))
+            self._celula = None
+        elif tag == "tr" and self._linha is not None:
+            self.linhas.append(self._linha)
+            self._linha = None
+        elif tag == self.tag:
+            self._profundidade -= 1
+            self.terminado = self._profundidade == 0
+
+    def handle_data(self, data):
+        if self._celula is not None:
+            self._celula.append(data)
+
+
+def _iterarLinhasLxml(pedacos: Iterable[bytes], tag: str) -> Iterator[list[str]]:
+    '''
+    Função que lê as linhas de forma incremental com o HTMLPullParser do lxml. Cada <tr> é descartado da árvore
+    depois de lido, então a memória usada não cresce com o tamanho da tabela.
+    '''
+    import lxml.etree
+
+    inicio, pedacos = _lerInicio(pedacos)
+
+    # Como em _elementoLxml, o lxml recebe os bytes de páginas em UTF-8, e as outras são decodificadas pelo Python
+    if isinstance(inicio, bytes) and codificacaoDeclarada(inicio) == "utf-8":
+        parser = lxml.etree.HTMLPullParser(events=("start", "end"), encoding="utf-8")
+        entrada = itertools.chain((inicio,), pedacos)
+    else:
+        parser = lxml.etree.HTMLPullParser(events=("start", "end"))
+        entrada = _decodificarPedacos(inicio, pedacos)
+
+    profundidade = 0
+    quebras = []
+
+    for pedaco in entrada:
+        parser.feed(pedaco)
+
+        for evento, elemento in parser.read_events():
+            if elemento.tag == tag:
+                profundidade += 1 if evento == "start" else -1
+                if evento == "end" and profundidade == 0:
+                    return
+            elif evento == "end" and elemento.tag == "br":
+                # Os <br> da linha são guardados e marcados quando ela termina, já com o texto que vem depois deles
+                quebras.append(elemento)
+            elif evento == "end" and elemento.tag == "tr" and profundidade > 0:
+                for br in quebras:
+                    br.tail = _MARCA_BR + br.tail if br.tail else _MARCA_BR
+                quebras.clear()
+
+                yield [_limparCelula("".join(td.itertext())) for td in elemento.iter("td")]
+                elemento.clear()
+
+                while elemento.getprevious() is not None:
+                    del elemento.getparent()[0]
+
+
+def _iterarLinhasHtmlParser(pedacos: Iterable[bytes], tag: str) -> Iterator[list[str]]:
+    '''
+    Função que lê as linhas de forma incremental com o html.parser da biblioteca padrão.
+    '''
+    leitor = _LeitorLinhas(tag)
+
+    for pedaco in _decodificarPedacos(*_lerInicio(pedacos)):
+        leitor.feed(pedaco)
+
+        yield from leitor.linhas
+        leitor.linhas.clear()
+
+        if leitor.terminado:
+            return
+
+    leitor.close()
+    yield from leitor.linhas
+
+
+def iterarLinhas(pedacos: Iterable[bytes], tag: str = "tbody") -> Iterator[list[str]]:
+    '''
+    Função que lê a página em pedaços e devolve o texto das células de cada linha do primeiro elemento com a tag
+    informada, assim que a linha termina de ser lida. A leitura para no fim do elemento, sem consumir o resto da
+    página.
+
+    Parâmetros:
+    - pedacos (Iterable[bytes]): Pedaços da página, na ordem (por exemplo, response.iter_content()).
+    - tag (str): Tag do elemento que contém as linhas.
+
+    Retorno:
+    - (Iterator[list[str]]): Textos das células de cada linha.
+    '''
+    if PARSER == "lxml":
+        return _iterarLinhasLxml(pedacos, tag)
+
+    return _iterarLinhasHtmlParser(pedacos, tag)
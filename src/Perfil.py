@@ -0,0 +1,191 @@
+# Imports de sistema
+import json
+import struct
+from os import path, scandir
+from typing import Callable
+
+# Imports locais
+from src.Curso import Curso
+from src.Estudante import Estudante
+from src.EstudanteException import EstudanteException
+
+
+'''
+Este arquivo contém as funções para salvar e carregar perfis de estudantes. Um perfil guarda só o nome do estudante,
+o código do curso e os índices das unidades cursadas dentro da matriz curricular do curso, junto com a assinatura da
+matriz (ver GrafoCurso.assinatura) para detectar quando ela mudou. Assim o arquivo não duplica as UCs, e ao carregar
+o perfil as unidades são religadas aos objetos do Curso já carregado (normalmente vindo do cache), sem novo scraping.
+
+Existem dois formatos, escolhidos pela extensão do arquivo:
+- .json: legível e fácil de editar.
+- .perfil: binário compacto (cabeçalho fixo + nome em UTF-8 + índices como inteiros de 16 bits). Todos os campos são
+  little-endian, então o arquivo pode ser lido em qualquer máquina.
+'''
+
+EXTENSAO_JSON    = ".json"
+EXTENSAO_BINARIA = ".perfil"
+
+_MAGICO    = b"VMO1"
+_CABECALHO = struct.Struct("<4sI8sHH")
+
+
+def salvarPerfil(estudante: "Estudante", caminho: str) -> None:
+    '''
+    Função que salva o perfil de um estudante em arquivo.
+
+    Parâmetros:
+    - estudante (Estudante): Estudante a ser salvo.
+    - caminho (str): Caminho do arquivo (.json ou .perfil).
+
+    Retorno:
+    - None.
+    '''
+    grafo = estudante.curso.grafo
+    indices = sorted(grafo.indices[unidade_curricular] for unidade_curricular in estudante.unidades_cursadas if unidade_curricular in grafo.indices)
+
+    if caminho.endswith(EXTENSAO_BINARIA):
+        nome = estudante.nome.encode("utf-8")
+        dados = _CABECALHO.pack(_MAGICO, estudante.curso.id, bytes.fromhex(grafo.assinatura), len(nome), len(indices))
+
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(dados + nome + struct.pack(f"<{len(indices)}H", *indices))
+    else:
+        perfil = {"nome": estudante.nome, "curso": estudante.curso.id, "assinatura": grafo.assinatura, "cursadas": indices}
+
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(perfil, arquivo, ensure_ascii=False, separators=(",", ":"))
+
+
+def lerPerfil(caminho: str) -> tuple[str, int, str, list[int]]:
+    '''
+    Função que lê um arquivo de perfil sem montar o estudante.
+
+    Parâmetros:
+    - caminho (str): Caminho do arquivo (.json ou .perfil).
+
+    Retorno:
+    - (tuple[str, int, str, list[int]]): Nome, código do curso, assinatura da matriz e índices das UCs cursadas.
+    '''
+    if caminho.endswith(EXTENSAO_BINARIA):
+        with open(caminho, "rb") as arquivo:
+            dados = arquivo.read()
+
+        if len(dados) < _CABECALHO.size:
+            raise _perfilInvalido(caminho)
+
+        magico, codigo, assinatura, tamanho_nome, n_indices = _CABECALHO.unpack_from(dados)
+        inicio = _CABECALHO.size + tamanho_nome
+
+        if magico != _MAGICO or len(dados) != inicio + 2 * n_indices:
+            raise _perfilInvalido(caminho)
+
+        try:
+            nome = dados[_CABECALHO.size:inicio].decode("utf-8")
+        except UnicodeDecodeError:
+            raise _perfilInvalido(caminho)
+
+        return nome, codigo, assinatura.hex(), list(struct.unpack_from(f"<{n_indices}H", dados, inicio))
+
+    try:
+        with open(caminho, "r", encoding="utf-8") as arquivo:
+            perfil = json.load(arquivo)
+    except ValueError:
+        # Inclui UnicodeDecodeError e JSONDecodeError
+        raise _perfilInvalido(caminho)
+
+    if not isinstance(perfil, dict):
+        raise _perfilInvalido(caminho)
+
+    nome, codigo, assinatura, indices = (perfil.get(chave) for chave in ("nome", "curso", "assinatura", "cursadas"))
+
+    if (
+        not isinstance(nome, str) or not _inteiro(codigo) or not isinstance(assinatura, str)
+        or not isinstance(indices, list) or not all(_inteiro(indice) for indice in indices)
+    ):
+        raise _perfilInvalido(caminho)
+
+    return nome, codigo, assinatura, indices
+
+
+def _inteiro(valor) -> bool:
+    '''
+    Função que verifica se um valor lido do JSON é um inteiro (bool é subclasse de int, mas não conta).
+    '''
+    return isinstance(valor, int) and not isinstance(valor, bool)
+
+
+def _perfilInvalido(caminho: str) -> "EstudanteException":
+    '''
+    Função que cria a exceção de um arquivo de perfil malformado.
+    '''
+    return EstudanteException("PerfilInvalido", f"O arquivo {caminho} não é um perfil válido.")
+
+
+def montarEstudante(nome: str, curso: "Curso", assinatura: str, indices: list[int]) -> "Estudante":
+    '''
+    Função que monta um estudante a partir dos dados de um perfil, religando os índices às UCs do curso.
+
+    Parâmetros:
+    - nome (str): Nome do estudante.
+    - curso (Curso): Curso já carregado.
+    - assinatura (str): Assinatura da matriz gravada no perfil.
+    - indices (list[int]): Índices das UCs cursadas.
+
+    Retorno:
+    - (Estudante): Estudante do perfil.
+    '''
+    grafo = curso.grafo
+
+    if assinatura != grafo.assinatura:
+        raise EstudanteException("PerfilDesatualizado", f"A matriz curricular do curso {curso.id} mudou desde que o perfil de {nome} foi salvo.")
+
+    if not all(0 <= indice < len(grafo.unidades) for indice in indices):
+        raise EstudanteException("PerfilInvalido", f"O perfil de {nome} tem UCs fora da matriz curricular do curso {curso.id}.")
+
+    return Estudante.de_confianca(nome, curso, [grafo.unidades[indice] for indice in dict.fromkeys(indices)])
+
+
+def carregarPerfil(caminho: str, obterCurso: Callable[[int], "Curso"]) -> "Estudante":
+    '''
+    Função que carrega o perfil de um estudante salvo em arquivo.
+
+    Parâmetros:
+    - caminho (str): Caminho do arquivo (.json ou .perfil).
+    - obterCurso (Callable[[int], Curso]): Função que devolve o curso a partir do código (por exemplo, via cache).
+
+    Retorno:
+    - (Estudante): Estudante do perfil.
+    '''
+    nome, codigo, assinatura, indices = lerPerfil(caminho)
+    return montarEstudante(nome, obterCurso(codigo), assinatura, indices)
+
+
+def carregarPerfis(diretorio: str, obterCurso: Callable[[int], "Curso"]) -> list["Estudante"]:
+    '''
+    Função que carrega todos os perfis de um diretório. Cada curso é obtido uma única vez, mesmo que vários perfis
+    sejam do mesmo curso.
+
+    Parâmetros:
+    - diretorio (str): Diretório com os arquivos de perfil.
+    - obterCurso (Callable[[int], Curso]): Função que devolve o curso a partir do código.
+
+    Retorno:
+    - estudantes (list[Estudante]): Estudantes carregados, em ordem alfabética de arquivo.
+    '''
+    cursos = {}
+    estudantes = []
+
+    caminhos = sorted(
+        entrada.path for entrada in scandir(diretorio)
+        if entrada.is_file() and path.splitext(entrada.name)[1] in (EXTENSAO_JSON, EXTENSAO_BINARIA)
+    )
+
+    for caminho in caminhos:
+        nome, codigo, assinatura, indices = lerPerfil(caminho)
+
+        if codigo not in cursos:
+            cursos[codigo] = obterCurso(codigo)
+
+        estudantes.append(montarEstudante(nome, cursos[codigo], assinatura, indices))
+
+    return estudantes
@@ -0,0 +1,102 @@
+# Imports de sistema
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator
+
+
+'''
+Este arquivo contém o pipeline em dois estágios usado nas cargas em lote de cursos (findCursosProcessos e o
+rastreador). Com threads, os downloads acontecem em paralelo, mas o parsing do HTML e a criação das UCs disputam o GIL
+e rodam um de cada vez. O pipeline separa as duas partes:
+
+1. Estágio de rede: um pool de threads executa baixar(item), que baixa as páginas e devolve os argumentos do
+   processamento (apenas bytes e tipos básicos) e um contexto que fica no processo principal.
+2. Estágio de CPU: um ProcessPoolExecutor executa processar(*argumentos) em outros processos, um por núcleo, e
+   devolve um resultado que pode ser serializado com pickle (como os registros de Serializacao.matrizParaRegistros).
+   O processo principal recebe o resultado e monta os objetos.
+
+Cada item ocupa uma vaga (um semáforo com max_pendentes vagas) desde antes do download até ser consumido pelo
+processo principal. Quando as vagas acabam, as threads de rede param de baixar, então as páginas em memória ficam
+limitadas mesmo quando o parsing (ou quem consome o resultado) é mais lento que a rede.
+
+Os processos são criados com "spawn", que não copia as threads e as conexões do processo principal (um fork no meio
+dos downloads poderia herdar locks travados). Cada processo importa só o que processar precisa, e é criado uma vez
+para todo o lote.
+'''
+
+
+def executarPipeline(itens: Iterable, baixar: Callable, processar: Callable, max_concurrency: int = 8, processos: int = None, max_pendentes: int = None) -> Iterator[tuple]:
+    '''
+    Função que executa o pipeline sobre os itens e devolve o resultado de cada um conforme fica pronto.
+
+    Parâmetros:
+    - itens (Iterable): Itens do lote, como códigos de cursos.
+    - baixar (Callable): Função executada nas threads de rede. Recebe um item e retorna o par (argumentos, contexto).
+      Se argumentos for None, o item não precisa ser processado (por exemplo, um curso que estava no cache).
+    - processar (Callable): Função executada nos processos. Recebe os argumentos devolvidos por baixar. Deve ser uma
+      função de nível de módulo (para ser encontrada pelos processos), e o seu resultado deve poder ser serializado.
+    - max_concurrency (int): Número de threads de rede.
+    - processos (int): Número de processos de parsing. O padrão é o número de núcleos.
+    - max_pendentes (int): Número máximo de itens baixados e ainda não consumidos. O padrão é max_concurrency mais
+      duas vezes o número de processos, o suficiente para que nenhum dos dois estágios fique parado esperando o outro.
+
+    Retorno:
+    - (Iterator[tuple]): Triplas (item, resultado, contexto), na ordem em que ficam prontas. O resultado é o retorno de
+      processar, None se o item não foi processado, ou a exceção levantada em baixar ou em processar.
+    '''
+    itens = list(itens)
+    processos = processos if processos is not None else (os.cpu_count() or 1)
+    max_pendentes = max_pendentes if max_pendentes is not None else max_concurrency + 2 * processos
+
+    resultados = queue.Queue()
+    vagas = threading.Semaphore(max_pendentes)
+    encerrado = threading.Event()
+
+    with ProcessPoolExecutor(max_workers=processos, mp_context=multiprocessing.get_context("spawn")) as cpu, ThreadPoolExecutor(max_workers=max_concurrency) as rede:
+
+        def estagioRede(item) -> None:
+            vagas.acquire()
+
+            if encerrado.is_set():
+                return
+
+            try:
+                argumentos, contexto = baixar(item)
+
+                if argumentos is None:
+                    resultados.put((item, None, contexto))
+                    return
+
+                futuro = cpu.submit(processar, *argumentos)
+            except Exception as erro:
+                resultados.put((item, erro, None))
+                return
+
+            futuro.add_done_callback(lambda futuro: resultados.put((item, futuro, contexto)))
+
+        try:
+            for item in itens:
+                rede.submit(estagioRede, item)
+
+            for _ in itens:
+                item, resultado, contexto = resultados.get()
+                vagas.release()
+
+                if isinstance(resultado, Future):
+                    try:
+                        resultado = resultado.result()
+                    except Exception as erro:
+                        resultado = erro
+
+                yield item, resultado, contexto
+        finally:
+            # Se o lote for interrompido, as threads que esperam uma vaga são liberadas e encerram sem baixar nada
+            encerrado.set()
+            for _ in range(max_concurrency):
+                vagas.release()
+
+            rede.shutdown(cancel_futures=True)
+            cpu.shutdown(cancel_futures=True)
@@ -0,0 +1,182 @@
+# Imports de sistema
+import random
+from typing import TYPE_CHECKING
+
+# Imports locais
+from src.Estudante import Estudante
+from src.EstudanteException import EstudanteException
+
+if TYPE_CHECKING:
+    from src.GrafoCurso import GrafoCurso
+    from src.UnidadeCurricular import UnidadeCurricular
+
+
+'''
+Este arquivo contém o planejador de semestres. Dado um estudante, ele monta um plano com as unidades que ainda faltam
+(todas as obrigatórias mais optativas suficientes para cumprir uma carga horária mínima), dividido em semestres com
+no máximo carga_maxima horas cada, respeitando os pré-requisitos: uma UC só entra em um semestre se todos os seus
+pré-requisitos foram cursados antes ou em semestres anteriores do plano.
+
+Encontrar o plano com o menor número de semestres é um problema NP-difícil, então o planejador usa uma heurística
+de escalonamento por lista: a cada semestre, as UCs liberadas são ordenadas por prioridade e encaixadas enquanto
+houver carga horária. A prioridade principal é o caminho crítico (quantos semestres, no mínimo, ainda dependem da
+UC). Algumas prioridades diferentes e algumas variações aleatórias são testadas, em um número limitado de tentativas,
+e o melhor plano é devolvido. A busca para antes se algum plano atingir o limite inferior (o maior entre o caminho
+crítico e a carga total dividida pela carga por semestre), pois nesse caso ele já é ótimo.
+'''
+
+
+def _bits(mascara: int) -> list[int]:
+    '''
+    Função que retorna os índices dos bits ligados de um bitset.
+    '''
+    return [i for i, bit in enumerate(bin(mascara)[:1:-1]) if bit == "1"]
+
+
+def _escolherOptativas(grafo: "GrafoCurso", carga: list[int], cursadas: int, alvo: int, horas_optativas: int) -> int:
+    '''
+    Função que acrescenta optativas ao alvo até que as optativas do plano somem horas_optativas. A cada passo é
+    escolhida a optativa com a menor carga total a mais (ela e os pré-requisitos que ainda não estão no plano)
+    por hora de optativa ganha.
+    '''
+    fechamento = grafo.fechamento
+    optativas = grafo.mascara_optativas
+
+    horas = sum(carga[i] for i in _bits(alvo & optativas))
+    candidatas = set(_bits(optativas & ~cursadas & ~alvo))
+
+    while horas < horas_optativas:
+        melhor, melhor_custo, melhor_extra = None, None, 0
+
+        for i in candidatas:
+            extra = (fechamento[i] | (1 << i)) & ~cursadas & ~alvo
+            indices = _bits(extra)
+            ganho = sum(carga[j] for j in indices if (optativas >> j) & 1)
+            custo = (sum(carga[j] for j in indices) / ganho, len(indices), i)
+
+            if melhor_custo is None or custo < melhor_custo:
+                melhor, melhor_custo, melhor_extra = i, custo, extra
+
+        if melhor is None:
+            raise EstudanteException("OptativasInsuficientes", f"O curso não tem optativas suficientes para {horas_optativas}h.")
+
+        for j in _bits(melhor_extra):
+            if (optativas >> j) & 1:
+                horas += carga[j]
+                candidatas.discard(j)
+
+        alvo |= melhor_extra
+
+    return alvo
+
+
+def _escalonar(unidades: list[int], pre_requisitos: dict[int, list[int]], dependentes: dict[int, list[int]], carga: list[int], carga_maxima: int, prioridade: dict[int, tuple]) -> list[list[int]]:
+    '''
+    Função que monta os semestres por escalonamento em lista, com a prioridade informada (menor vem primeiro).
+    '''
+    pendentes = {i: len(pre_requisitos[i]) for i in unidades}
+    liberadas = [i for i in unidades if pendentes[i] == 0]
+    semestres = []
+
+    while liberadas:
+        liberadas.sort(key=prioridade.__getitem__)
+
+        semestre, restantes, horas = [], [], 0
+        for i in liberadas:
+            if horas + carga[i] <= carga_maxima:
+                semestre.append(i)
+                horas += carga[i]
+            else:
+                restantes.append(i)
+
+        for i in semestre:
+            for dependente in dependentes[i]:
+                pendentes[dependente] -= 1
+                if pendentes[dependente] == 0:
+                    restantes.append(dependente)
+
+        semestres.append(semestre)
+        liberadas = restantes
+
+    return semestres
+
+
+def planejarSemestres(estudante: "Estudante", carga_maxima: int, horas_optativas: int = 0, tentativas: int = 16, semente: int = 0) -> list[list["UnidadeCurricular"]]:
+    '''
+    Função que monta um plano de semestres para o estudante concluir o curso.
+
+    Parâmetros:
+    - estudante (Estudante): Estudante para quem o plano é feito.
+    - carga_maxima (int): Carga horária máxima por semestre.
+    - horas_optativas (int): Carga horária mínima de optativas que o plano deve ter (contando as já no plano).
+    - tentativas (int): Número máximo de prioridades testadas.
+    - semente (int): Semente das variações aleatórias, para que o resultado seja reproduzível.
+
+    Retorno:
+    - semestres (list[list[UnidadeCurricular]]): UCs de cada semestre, na ordem.
+    '''
+    if carga_maxima <= 0:
+        raise EstudanteException("CargaMaximaInvalida", "A carga horária máxima por semestre deve ser positiva.")
+
+    grafo = estudante.curso.grafo
+    carga = [unidade_curricular.carga_horaria for unidade_curricular in grafo.unidades]
+    fechamento = grafo.fechamento
+
+    cursadas = grafo.mascara(estudante.unidades_cursadas)
+    obrigatorias = ((1 << len(grafo)) - 1) & ~grafo.mascara_optativas & ~cursadas
+
+    alvo = obrigatorias
+    for i in _bits(obrigatorias):
+        alvo |= fechamento[i] & ~cursadas
+
+    alvo = _escolherOptativas(grafo, carga, cursadas, alvo, horas_optativas)
+    unidades = _bits(alvo)
+
+    for i in unidades:
+        if carga[i] > carga_maxima:
+            raise EstudanteException("CargaMaximaInsuficiente", f"A unidade {grafo.unidades[i].nome} tem mais horas que o limite por semestre.")
+
+    # Pré-requisitos e dependentes restritos ao que falta cursar
+    pre_requisitos = {i: [p for p in grafo.pre_requisitos[i] if (alvo >> p) & 1] for i in unidades}
+    dependentes = {i: [] for i in unidades}
+    for i in unidades:
+        for p in pre_requisitos[i]:
+            dependentes[p].append(i)
+
+    # Caminho crítico (em semestres) e número de descendentes de cada UC, em ordem topológica reversa
+    altura, descendentes = {}, {}
+    for i in reversed([i for i in grafo.ordem_topologica if (alvo >> i) & 1]):
+        altura[i] = 1 + max((altura[d] for d in dependentes[i]), default=0)
+
+        mascara = 0
+        for d in dependentes[i]:
+            mascara |= descendentes[d] | (1 << d)
+        descendentes[i] = mascara
+
+    n_descendentes = {i: bin(descendentes[i]).count("1") for i in unidades}
+    limite_inferior = max(max(altura.values(), default=0), -(-sum(carga[i] for i in unidades) // carga_maxima))
+
+    prioridades = [
+        {i: (-altura[i], -n_descendentes[i], -carga[i], i) for i in unidades},
+        {i: (-n_descendentes[i], -altura[i], -carga[i], i) for i in unidades},
+        {i: (-altura[i], -carga[i], -n_descendentes[i], i) for i in unidades},
+    ]
+
+    aleatorio = random.Random(semente)
+    melhor = None
+
+    for tentativa in range(max(tentativas, 1)):
+        if tentativa < len(prioridades):
+            prioridade = prioridades[tentativa]
+        else:
+            prioridade = {i: (-altura[i], aleatorio.random()) for i in unidades}
+
+        semestres = _escalonar(unidades, pre_requisitos, dependentes, carga, carga_maxima, prioridade)
+
+        if melhor is None or len(semestres) < len(melhor):
+            melhor = semestres
+
+        if len(melhor) <= limite_inferior:
+            break
+
+    return [[grafo.unidades[i] for i in semestre] for semestre in melhor]
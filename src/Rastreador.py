@@ -0,0 +1,242 @@
+# Imports de sistema
+import hashlib
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+# Imports locais
+from src import WebScraper
+from src.CacheCursos import CacheCursos
+from src.Curso import Curso
+from src.CursoException import CursoException
+from src.Pipeline import executarPipeline
+from src.Serializacao import registrosParaMatriz
+
+
+'''
+Este arquivo contém o rastreador de cursos, que mantém no cache local uma cópia de todos os cursos do site da UFMS.
+
+Os códigos podem ser descobertos de duas formas: pelos links /cursos/view/{codigo} de uma página de listagem, ou
+sondando um intervalo de códigos em paralelo. A cada atualização, a página da matriz de cada código é baixada (com
+requisição condicional quando há ETag/Last-Modified) e o hash do trecho da tabela é comparado com o registrado no
+catálogo do cache. Só os cursos novos ou com a matriz alterada são processados de novo; para os outros, a entrada do
+cache apenas tem o ttl renovado. Assim, uma atualização noturna do catálogo inteiro custa uma requisição por curso e
+quase nenhum parsing.
+
+O max_cursos do cache deve ser maior que o número de cursos do catálogo, ou os cursos removidos pelo limite serão
+processados de novo a cada atualização.
+'''
+
+PADRAO_CODIGO = re.compile(rb"/cursos/view/(\d+)")
+
+
+def hashMatriz(html: bytes) -> str:
+    '''
+    Função que calcula o hash do conteúdo de uma página de matriz curricular. Só o trecho da tabela (do primeiro
+    <tbody ao último </tbody>) é considerado, para que partes dinâmicas da página (menus, tokens, rodapé) não façam
+    um curso parecer alterado.
+
+    Parâmetros:
+    - html (bytes): Conteúdo da página.
+
+    Retorno:
+    - (str): Hash do trecho, em hexadecimal.
+    '''
+    inicio = html.find(b"<tbody")
+    fim = html.rfind(b"</tbody>")
+
+    if inicio != -1 and fim > inicio:
+        html = html[inicio:fim]
+
+    return hashlib.blake2b(html, digest_size=16).hexdigest()
+
+
+def listarCodigos(url: str = None) -> list[int]:
+    '''
+    Função que descobre os códigos dos cursos a partir dos links de uma página de listagem.
+
+    Parâmetros:
+    - url (str): Endereço da página de listagem. Se não for informado, é usado {URL_BASE}/cursos.
+
+    Retorno:
+    - (list[int]): Códigos encontrados, em ordem crescente.
+    '''
+    pagina = WebScraper.baixarPagina(url if url is not None else f"{WebScraper.URL_BASE}/cursos")
+
+    if pagina.status_code != 200:
+        raise CursoException("ListagemNotFound", "Não foi possível baixar a página de listagem de cursos.")
+
+    return sorted({int(codigo) for codigo in PADRAO_CODIGO.findall(pagina.content)})
+
+
+def sondarCodigos(codigos: Iterable[int], max_concurrency: int = 8) -> list[int]:
+    '''
+    Função que verifica, em paralelo, quais códigos de um intervalo existem no site.
+
+    Parâmetros:
+    - codigos (Iterable[int]): Códigos a verificar, por exemplo range(1, 3000).
+    - max_concurrency (int): Número máximo de verificações ao mesmo tempo.
+
+    Retorno:
+    - (list[int]): Códigos que existem, em ordem crescente.
+    '''
+    codigos = list(codigos)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        return [codigo for codigo, existe in zip(codigos, executor.map(WebScraper.exists, codigos)) if existe]
+
+
+def verificarCurso(codigo: int, cache: "CacheCursos") -> "str | tuple":
+    '''
+    Função com a parte de rede de atualizarCurso: baixa a matriz (com requisição condicional) e, se ela mudou, a
+    página do curso.
+
+    Parâmetros:
+    - codigo (int): Código do curso.
+    - cache (CacheCursos): Cache local de cursos.
+
+    Retorno:
+    - (str | tuple): A situação ("inalterado" ou "inexistente"), se o curso não precisa ser processado, ou a tupla
+      (pagina_curso, pagina_matriz, hash_atual, hash_anterior).
+    '''
+    hash_anterior = cache.obter_hash(codigo)
+    cabecalhos = cache.cabecalhos_condicionais(codigo) if hash_anterior is not None else {}
+
+    pagina_matriz = WebScraper.baixarPaginaMatriz(codigo, cabecalhos)
+
+    if pagina_matriz.status_code == 304:
+        if cache.revalidar(codigo) is not None:
+            cache.salvar_hash(codigo, hash_anterior)
+            return "inalterado"
+
+        # A entrada do curso foi removida do cache, então a página precisa ser baixada inteira
+        pagina_matriz = WebScraper.baixarPaginaMatriz(codigo)
+
+    if pagina_matriz.status_code != 200:
+        if not WebScraper.exists(codigo):
+            cache.remover(codigo)
+            return "inexistente"
+
+        raise CursoException("MatrizCurricularNotFound", f"Não foi possível achar a matriz curricular do curso com código {codigo}.")
+
+    hash_atual = hashMatriz(pagina_matriz.content)
+
+    if hash_atual == hash_anterior and cache.revalidar(codigo) is not None:
+        cache.salvar_hash(codigo, hash_atual)
+        return "inalterado"
+
+    pagina_curso = WebScraper.baixarPaginaCurso(codigo)
+
+    if pagina_curso.status_code != 200:
+        cache.remover(codigo)
+        return "inexistente"
+
+    return pagina_curso, pagina_matriz, hash_atual, hash_anterior
+
+
+def salvarCurso(curso: "Curso", cache: "CacheCursos", cabecalhos: dict[str, str], hash_atual: str, hash_anterior: str) -> str:
+    '''
+    Função que grava no cache um curso processado de novo, junto com o hash da sua matriz.
+
+    Parâmetros:
+    - curso (Curso): Curso processado.
+    - cache (CacheCursos): Cache local de cursos.
+    - cabecalhos (dict[str, str]): Cabeçalhos da resposta da página da matriz (ETag e Last-Modified).
+    - hash_atual (str): Hash da matriz baixada.
+    - hash_anterior (str): Hash registrado antes da atualização, ou None se o curso é novo.
+
+    Retorno:
+    - (str): "novo" ou "alterado".
+    '''
+    cache.salvar(curso, cabecalhos.get("ETag"), cabecalhos.get("Last-Modified"))
+    cache.salvar_hash(curso.id, hash_atual)
+
+    return "novo" if hash_anterior is None else "alterado"
+
+
+def atualizarCurso(codigo: int, cache: "CacheCursos") -> str:
+    '''
+    Função que atualiza um curso no cache, processando a matriz curricular só se ela mudou desde a última vez.
+
+    Parâmetros:
+    - codigo (int): Código do curso.
+    - cache (CacheCursos): Cache local de cursos.
+
+    Retorno:
+    - (str): "novo", "alterado", "inalterado" ou "inexistente".
+    '''
+    verificacao = verificarCurso(codigo, cache)
+
+    if isinstance(verificacao, str):
+        return verificacao
+
+    pagina_curso, pagina_matriz, hash_atual, hash_anterior = verificacao
+
+    nome = WebScraper.scrapeNomeCurso(codigo, pagina_curso.content)
+    matriz_curricular = WebScraper.scrapeMatrizCurricular(codigo, pagina_matriz.content)
+
+    if matriz_curricular is None:
+        raise CursoException("MatrizCurricularNotFound", f"Não foi possível achar a matriz curricular do curso com código {codigo}.")
+
+    return salvarCurso(Curso.de_confianca(codigo, nome, matriz_curricular), cache, pagina_matriz.headers, hash_atual, hash_anterior)
+
+
+def atualizarCatalogo(cache: "CacheCursos", codigos: Iterable[int] = None, max_concurrency: int = 8, processos: int = None) -> dict[str, int]:
+    '''
+    Função que atualiza no cache todos os cursos do catálogo, em paralelo.
+
+    Parâmetros:
+    - cache (CacheCursos): Cache local de cursos.
+    - codigos (Iterable[int]): Códigos a atualizar. Se não for informado, são usados os códigos já catalogados.
+    - max_concurrency (int): Número máximo de cursos sendo atualizados ao mesmo tempo.
+    - processos (int): Se informado, o parsing das matrizes alteradas é feito nesse número de processos (ver
+      Pipeline), e as threads só baixam as páginas. Compensa na primeira carga do catálogo, quando todos os cursos
+      precisam ser processados.
+
+    Retorno:
+    - resumo (dict[str, int]): Número de cursos em cada situação ("novo", "alterado", "inalterado", "inexistente"
+      e "erro").
+    '''
+    if codigos is None:
+        codigos = cache.codigos_catalogados()
+
+    def atualizar(codigo: int) -> str:
+        try:
+            return atualizarCurso(codigo, cache)
+        except Exception:
+            return "erro"
+
+    resumo = Counter({"novo": 0, "alterado": 0, "inalterado": 0, "inexistente": 0, "erro": 0})
+
+    if processos is None:
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            resumo.update(executor.map(atualizar, codigos))
+
+        return dict(resumo)
+
+    def baixar(codigo: int) -> tuple:
+        verificacao = verificarCurso(codigo, cache)
+
+        if isinstance(verificacao, str):
+            return None, verificacao
+
+        pagina_curso, pagina_matriz, hash_atual, hash_anterior = verificacao
+        return (codigo, pagina_curso.content, pagina_matriz.content), (pagina_matriz.headers, hash_atual, hash_anterior)
+
+    for codigo, resultado, contexto in executarPipeline(codigos, baixar, WebScraper.processarPaginas, max_concurrency, processos):
+        if resultado is None:
+            situacao = contexto
+        elif isinstance(resultado, Exception) or resultado[1] is None:
+            situacao = "erro"
+        else:
+            nome, registros = resultado
+
+            try:
+                situacao = salvarCurso(Curso.de_confianca(codigo, nome, registrosParaMatriz(registros)), cache, *contexto)
+            except Exception:
+                situacao = "erro"
+
+        resumo[situacao] += 1
+
+    return dict(resumo)
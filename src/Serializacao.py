@@ -0,0 +1,66 @@
+# Imports locais
+from src.UnidadeCurricular import UnidadeCurricular
+
+
+'''
+Este arquivo contém as funções que convertem a matriz curricular de um curso para uma representação compacta,
+feita apenas de tipos básicos (listas, strings, inteiros e booleanos), e vice-versa. Cada unidade curricular vira
+um registro [nome, carga_horaria, obrigatoria, [índices dos pré-requisitos]], em que os índices apontam para a
+posição do pré-requisito dentro da própria matriz. Essa representação pode ser gravada em JSON sem duplicar objetos.
+'''
+
+
+def matrizParaRegistros(matriz_curricular: list["UnidadeCurricular"]) -> list[list]:
+    '''
+    Função que converte uma matriz curricular em uma lista de registros.
+
+    Parâmetros:
+    - matriz_curricular (list[UnidadeCurricular]): Matriz curricular do curso.
+
+    Retorno:
+    - registros (list[list]): Registros no formato [nome, carga_horaria, obrigatoria, [índices]].
+    '''
+    indices = {id(unidade_curricular): i for i, unidade_curricular in enumerate(matriz_curricular)}
+
+    return [
+        [
+            unidade_curricular.nome,
+            unidade_curricular.carga_horaria,
+            unidade_curricular.obrigatoria,
+            [indices[id(pre_requisito)] for pre_requisito in unidade_curricular.pre_requisitos if id(pre_requisito) in indices],
+        ]
+        for unidade_curricular in matriz_curricular
+    ]
+
+
+def registrosParaMatriz(registros: list[list]) -> list["UnidadeCurricular"]:
+    '''
+    Função que reconstrói a matriz curricular a partir dos registros gerados por matrizParaRegistros.
+
+    Parâmetros:
+    - registros (list[list]): Registros no formato [nome, carga_horaria, obrigatoria, [índices]].
+
+    Retorno:
+    - matriz_curricular (list[UnidadeCurricular]): Matriz curricular do curso.
+    '''
+    matriz_curricular = []
+
+    # Os registros são gerados pelo próprio programa, e cada UC só aponta para UCs da mesma matriz. Quando o
+    # pré-requisito aparece depois da UC na matriz, ele é ligado em uma segunda passada.
+    pendentes = []
+
+    for nome, carga_horaria, obrigatoria, indices in registros:
+        i = len(matriz_curricular)
+
+        if all(indice < i for indice in indices):
+            pre_requisitos = tuple(matriz_curricular[indice] for indice in indices)
+        else:
+            pre_requisitos = ()
+            pendentes.append(i)
+
+        matriz_curricular.append(UnidadeCurricular.de_confianca(nome, carga_horaria, pre_requisitos, obrigatoria))
+
+    for i in pendentes:
+        matriz_curricular[i].pre_requisitos = [matriz_curricular[indice] for indice in registros[i][3]]
+
+    return matriz_curricular
@@ -0,0 +1,333 @@
+# Imports de sistema
+import argparse
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+# Imports locais
+from src.BuscaCoalescidaAsync import BuscaCoalescidaAsync
+from src.CacheCursos import CacheCursos
+from src.CatalogoUnidades import CatalogoUnidades
+from src.Curso import Curso
+from src.CursoException import CursoException
+
+_log = logging.getLogger(__name__)
+
+# Status HTTP de cada erro de curso. Os outros (matriz ausente ou inválida na página) respondem 422: o site
+# respondeu, mas o curso não pôde ser processado, então não é um erro de gateway
+_STATUS_CURSO = {"CursoDoesNotExist": 404}
+
+
+class ServidorElegibilidade:
+    '''
+    Este arquivo contém o servidor HTTP que responde consultas de elegibilidade. Ele é escrito apenas
+    com asyncio (sem dependências externas) e mantém os cursos já processados em memória, em um LRU limitado por
+    max_cursos. Um curso que não está em memória é buscado com BuscaCoalescidaAsync (passando pelo cache em disco, se
+    houver) em um pool de threads; se várias requisições pedirem o mesmo curso ao mesmo tempo, todas esperam a mesma
+    busca em vez de cada uma fazer o seu scraping, e códigos inexistentes são lembrados por um tempo curto.
+
+    Rotas:
+    - GET  /cursos/{codigo}: matriz curricular do curso, com os índices das UCs.
+    - GET  /cursos/{codigo}/optativas?cursadas=0,4,7: optativas cursáveis, com as cursadas dadas por índice.
+    - POST /elegibilidade: {"curso": 1905, "cursadas": [0, "Cálculo I", ...]}, com UCs por índice ou por nome.
+    - POST /elegibilidade/lote: {"estudantes": [{"curso": ..., "cursadas": [...]}, ...]}, calculado em lote por curso.
+      Um curso que não pôde ser obtido responde {"erro": ..., "status": ...} só para os estudantes dele.
+    - POST /aproveitamento: {"curso": 1905, "cursadas": [...]}, cursos em memória que têm as UCs cursadas.
+
+    Os cursos em memória são registrados em um CatalogoUnidades, então as UCs comuns entre eles são compartilhadas.
+    '''
+
+
+    def __init__(self, max_cursos: int = 256, cache: "CacheCursos" = None, max_workers: int = 8) -> None:
+        '''
+        Construtor da classe ServidorElegibilidade.
+
+        Parâmetros:
+        - max_cursos (int): Número máximo de cursos mantidos em memória.
+        - cache (CacheCursos): Cache em disco usado ao buscar cursos que não estão em memória (opcional).
+        - max_workers (int): Número de threads usadas para buscar cursos.
+
+        Retorno:
+        - None.
+        '''
+        self.max_cursos = max_cursos
+        self.cache      = cache
+
+        self._cursos   = OrderedDict()
+        self.catalogo  = CatalogoUnidades()
+        self._busca    = BuscaCoalescidaAsync(cache, executor=ThreadPoolExecutor(max_workers=max_workers), ao_concluir=self._guardar)
+        self._servidor = None
+
+
+    async def obter_curso(self, codigo: int) -> "Curso":
+        '''
+        Método que retorna o curso, da memória ou buscando-o. Buscas simultâneas do mesmo curso são unidas em uma só.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - (Curso): Curso.
+        '''
+        curso = self._cursos.get(codigo)
+        if curso is not None:
+            self._cursos.move_to_end(codigo)
+            return curso
+
+        curso = await self._busca.obter(codigo)
+
+        # Normalmente o curso já foi guardado (e registrado no catálogo) por _guardar quando a busca terminou
+        return self._cursos.get(codigo, curso)
+
+
+    def _guardar(self, codigo: int, curso: "Curso") -> None:
+        '''
+        Método que guarda um curso buscado no LRU em memória, descartando os usados há mais tempo.
+        '''
+        self._cursos[codigo] = self.catalogo.registrar(curso)
+
+        while len(self._cursos) > self.max_cursos:
+            removido, _ = self._cursos.popitem(last=False)
+            self.catalogo.remover(removido)
+
+
+    def _resolverCursadas(self, curso: "Curso", cursadas: list) -> tuple[list, list]:
+        '''
+        Método que converte a lista de cursadas da requisição (índices ou nomes, aceitos de forma aproximada) em
+        unidades do curso.
+        '''
+        grafo = curso.grafo
+        unidades, nao_encontradas = [], []
+
+        for cursada in cursadas:
+            if isinstance(cursada, int) and not isinstance(cursada, bool) and 0 <= cursada < len(grafo):
+                unidades.append(grafo.unidades[cursada])
+            elif isinstance(cursada, str):
+                unidade_curricular = curso.buscar_unidade_curricular(cursada, aproximado=True)
+
+                if unidade_curricular is None:
+                    nao_encontradas.append(cursada)
+                else:
+                    unidades.append(unidade_curricular)
+            else:
+                nao_encontradas.append(cursada)
+
+        return unidades, nao_encontradas
+
+
+    @staticmethod
+    def _optativasJson(curso: "Curso", optativas: list) -> list[dict]:
+        '''
+        Método que monta a representação JSON de uma lista de optativas.
+        '''
+        indices = curso.grafo.indices
+        return [
+            {"indice": indices[unidade_curricular], "nome": unidade_curricular.nome, "carga_horaria": unidade_curricular.carga_horaria}
+            for unidade_curricular in optativas
+        ]
+
+
+    async def _rotear(self, metodo: str, caminho: str, consulta: dict, corpo: bytes) -> tuple[int, object]:
+        '''
+        Método que executa a rota pedida e retorna o status HTTP e o objeto da resposta.
+        '''
+        partes = [parte for parte in caminho.split("/") if parte != ""]
+
+        if metodo == "GET" and len(partes) in (2, 3) and partes[0] == "cursos" and partes[1].isdigit():
+            curso = await self.obter_curso(int(partes[1]))
+            grafo = curso.grafo
+
+            if len(partes) == 2:
+                return 200, {
+                    "codigo": curso.id,
+                    "nome": curso.nome,
+                    "unidades": [
+                        {
+                            "indice": i,
+                            "nome": unidade_curricular.nome,
+                            "carga_horaria": unidade_curricular.carga_horaria,
+                            "obrigatoria": unidade_curricular.obrigatoria,
+                            "pre_requisitos": list(grafo.pre_requisitos[i]),
+                        }
+                        for i, unidade_curricular in enumerate(grafo.unidades)
+                    ],
+                }
+
+            if partes[2] == "optativas":
+                texto = consulta.get("cursadas", [""])[0]
+                cursadas = [int(indice) for indice in texto.split(",") if indice.strip().isdigit()]
+                unidades, nao_encontradas = self._resolverCursadas(curso, cursadas)
+
+                return 200, {"optativas": self._optativasJson(curso, curso.optativas_cursaveis(unidades)), "nao_encontradas": nao_encontradas}
+
+        if metodo == "POST" and partes == ["elegibilidade"]:
+            pedido = json.loads(corpo)
+            curso = await self.obter_curso(int(pedido["curso"]))
+            unidades, nao_encontradas = self._resolverCursadas(curso, pedido.get("cursadas", []))
+
+            return 200, {"optativas": self._optativasJson(curso, curso.optativas_cursaveis(unidades)), "nao_encontradas": nao_encontradas}
+
+        if metodo == "POST" and partes == ["aproveitamento"]:
+            pedido = json.loads(corpo)
+            curso = await self.obter_curso(int(pedido["curso"]))
+            unidades, nao_encontradas = self._resolverCursadas(curso, pedido.get("cursadas", []))
+
+            return 200, {
+                "cursos": [
+                    {"codigo": codigo, "nome": self._cursos[codigo].nome, "aproveitadas": aproveitadas}
+                    for codigo, aproveitadas in self.catalogo.cursos_que_aceitam(unidades)
+                    if codigo != curso.id
+                ],
+                "nao_encontradas": nao_encontradas,
+            }
+
+        if metodo == "POST" and partes == ["elegibilidade", "lote"]:
+            estudantes = json.loads(corpo)["estudantes"]
+            resultados = [None] * len(estudantes)
+
+            # Os estudantes são agrupados por curso para que cada grupo seja calculado de uma vez com bitsets
+            grupos = {}
+            for posicao, estudante in enumerate(estudantes):
+                grupos.setdefault(int(estudante["curso"]), []).append(posicao)
+
+            # O requests é importado aqui pelo mesmo motivo que em _atender
+            from requests import RequestException
+
+            for codigo, posicoes in grupos.items():
+                try:
+                    curso = await self.obter_curso(codigo)
+                except CursoException as erro:
+                    for posicao in posicoes:
+                        resultados[posicao] = {"erro": erro.mensagem, "status": _STATUS_CURSO.get(erro.valor, 422)}
+                    continue
+                except RequestException as erro:
+                    _log.warning("Falha ao buscar o curso %d no lote: %s", codigo, erro)
+                    for posicao in posicoes:
+                        resultados[posicao] = {"erro": "Não foi possível obter o curso do site da UFMS.", "status": 502}
+                    continue
+
+                lote, faltantes = [], []
+                for posicao in posicoes:
+                    unidades, nao_encontradas = self._resolverCursadas(curso, estudantes[posicao].get("cursadas", []))
+                    lote.append(unidades)
+                    faltantes.append(nao_encontradas)
+
+                for posicao, optativas, nao_encontradas in zip(posicoes, curso.optativas_cursaveis_lote(lote), faltantes):
+                    resultados[posicao] = {"optativas": self._optativasJson(curso, optativas), "nao_encontradas": nao_encontradas}
+
+            return 200, {"resultados": resultados}
+
+        return 404, {"erro": "Rota não encontrada."}
+
+
+    async def _atender(self, leitor: "asyncio.StreamReader", escritor: "asyncio.StreamWriter") -> None:
+        '''
+        Método que atende uma conexão, processando as requisições em sequência enquanto ela for mantida aberta
+        (keep-alive).
+        '''
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+
+                metodo, alvo, versao = linha.decode("latin-1").split()
+
+                cabecalhos = {}
+                while True:
+                    linha = await leitor.readline()
+                    if linha in (b"\r\n", b"\n", b""):
+                        break
+
+                    chave, _, valor = linha.decode("latin-1").partition(":")
+                    cabecalhos[chave.strip().lower()] = valor.strip()
+
+                corpo = await leitor.readexactly(int(cabecalhos.get("content-length", "0")))
+                url = urlsplit(alvo)
+
+                try:
+                    status, resposta = await self._rotear(metodo, url.path, parse_qs(url.query), corpo)
+                except CursoException as erro:
+                    status, resposta = _STATUS_CURSO.get(erro.valor, 422), {"erro": erro.mensagem}
+                except Exception as erro:
+                    # O requests é importado aqui, e não no topo do arquivo, porque o scraper só o carrega quando um
+                    # curso é baixado. Alguns erros dele também são ValueError, então ele é testado primeiro
+                    from requests import RequestException
+
+                    if isinstance(erro, RequestException):
+                        _log.warning("Falha ao buscar o curso em %s %s: %s", metodo, alvo, erro)
+                        status, resposta = 502, {"erro": "Não foi possível obter o curso do site da UFMS."}
+                    elif isinstance(erro, (ValueError, KeyError, TypeError)):
+                        status, resposta = 400, {"erro": "Requisição inválida."}
+                    else:
+                        _log.exception("Erro ao atender %s %s", metodo, alvo)
+                        status, resposta = 500, {"erro": "Erro interno do servidor."}
+
+                manter = versao == "HTTP/1.1" and cabecalhos.get("connection", "").lower() != "close"
+                dados = json.dumps(resposta, ensure_ascii=False).encode("utf-8")
+
+                escritor.write(
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'Erro'}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(dados)}\r\n"
+                    f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n".encode("latin-1") + dados
+                )
+                await escritor.drain()
+
+                if not manter:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+
+    async def iniciar(self, host: str = "127.0.0.1", porta: int = 8080) -> "asyncio.Server":
+        '''
+        Método que começa a aceitar conexões.
+
+        Parâmetros:
+        - host (str): Endereço em que o servidor escuta.
+        - porta (int): Porta em que o servidor escuta (0 escolhe uma porta livre).
+
+        Retorno:
+        - (asyncio.Server): Servidor do asyncio, com a porta real em sockets[0].getsockname().
+        '''
+        self._servidor = await asyncio.start_server(self._atender, host, porta)
+        return self._servidor
+
+
+    async def servir(self, host: str = "127.0.0.1", porta: int = 8080) -> None:
+        '''
+        Método que inicia o servidor e o mantém rodando até ser cancelado.
+
+        Parâmetros:
+        - host (str): Endereço em que o servidor escuta.
+        - porta (int): Porta em que o servidor escuta.
+
+        Retorno:
+        - None.
+        '''
+        servidor = await self.iniciar(host, porta)
+
+        async with servidor:
+            await servidor.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor HTTP de consultas de elegibilidade.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8080)
+    parser.add_argument("--max-cursos", type=int, default=256)
+    parser.add_argument("--cache", help="Caminho do banco do cache de cursos.")
+    args = parser.parse_args()
+
+    servidor = ServidorElegibilidade(args.max_cursos, CacheCursos(args.cache) if args.cache else None)
+
+    try:
+        asyncio.run(servidor.servir(args.host, args.porta))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,318 @@
+# Imports de sistema
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from os import fstat
+from typing import Iterable
+
+# Imports locais
+from src.Curso import Curso
+from src.CursoException import CursoException
+from src.Serializacao import registrosParaMatriz
+
+
+class Snapshot:
+    '''
+    Este arquivo contém a classe do snapshot do catálogo: um único arquivo binário, em colunas, com as matrizes
+    curriculares de todos os cursos. Ele é aberto com mmap, e as colunas são lidas direto das páginas do arquivo por
+    memoryviews (sem cópia), então abrir um snapshot é quase instantâneo e vários processos que abrem o mesmo arquivo
+    compartilham uma única cópia no cache de páginas do sistema. Os objetos Curso/UnidadeCurricular só são criados
+    quando um curso é pedido, e ficam guardados para os próximos acessos.
+
+    Formato (little-endian, cada seção alinhada em 8 bytes):
+    - Cabeçalho: mágico "VMS1", número de cursos, de UCs, de strings e de arestas de pré-requisito, seguido dos
+      deslocamentos de cada seção.
+    - Cursos, ordenados pelo código: códigos (uint32), nomes (id de string, uint32) e o início das UCs de cada curso
+      nas colunas de UCs (uint32, n_cursos + 1 posições, no formato CSR).
+    - UCs: nomes (id de string, uint32), carga horária (uint16), obrigatória (uint8) e o início dos pré-requisitos de
+      cada UC (uint32, n_unidades + 1 posições).
+    - Pré-requisitos: índice de cada pré-requisito dentro da matriz do próprio curso (uint32).
+    - Strings: início de cada string (uint32, n_strings + 1 posições) e os bytes em UTF-8. Nomes repetidos entre
+      cursos são guardados uma única vez.
+    '''
+
+    MAGICO    = b"VMS1"
+    CABECALHO = struct.Struct("<4sIIII" + "Q" * 11)
+
+    # (nome da coluna, tipo do array)
+    COLUNAS = (
+        ("curso_codigos", "I"), ("curso_nomes", "I"), ("curso_inicios", "I"),
+        ("unidade_nomes", "I"), ("unidade_cargas", "H"), ("unidade_obrigatorias", "B"), ("unidade_inicios", "I"),
+        ("pre_requisitos", "I"),
+        ("string_inicios", "I"), ("string_bytes", "B"),
+    )
+
+
+    def __init__(self, caminho: str) -> None:
+        '''
+        Construtor da classe Snapshot. Abre o arquivo com mmap, sem ler as colunas.
+
+        Parâmetros:
+        - caminho (str): Caminho do arquivo do snapshot.
+
+        Retorno:
+        - None.
+        '''
+        with open(caminho, "rb") as arquivo:
+            if fstat(arquivo.fileno()).st_size < self.CABECALHO.size:
+                raise CursoException("SnapshotInvalido", f"O arquivo {caminho} não é um snapshot do catálogo.")
+
+            self._mmap = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:4] != self.MAGICO:
+            self._mmap.close()
+            raise CursoException("SnapshotInvalido", f"O arquivo {caminho} não é um snapshot do catálogo.")
+
+        magico, n_cursos, n_unidades, n_strings, n_arestas, *deslocamentos = self.CABECALHO.unpack_from(self._mmap)
+        tamanhos = (n_cursos, n_cursos, n_cursos + 1, n_unidades, n_unidades, n_unidades, n_unidades + 1, n_arestas, n_strings + 1)
+
+        # Um arquivo truncado ou com o cabeçalho corrompido tem seções que não cabem entre os deslocamentos
+        if deslocamentos[0] < self.CABECALHO.size or deslocamentos[-1] != len(self._mmap) or any(
+            fim < inicio or (tamanho is not None and fim - inicio < tamanho * array(tipo).itemsize)
+            for (_, tipo), inicio, fim, tamanho in zip(self.COLUNAS, deslocamentos, deslocamentos[1:], tamanhos + (None,))
+        ):
+            self._mmap.close()
+            raise CursoException("SnapshotInvalido", f"O arquivo {caminho} está truncado ou corrompido.")
+
+        self._memoria = memoryview(self._mmap)
+        self._cursos  = {}
+
+        for (nome, tipo), inicio, fim, tamanho in zip(self.COLUNAS, deslocamentos, deslocamentos[1:], tamanhos + (None,)):
+            coluna = self._memoria[inicio:fim]
+
+            if tamanho is not None:
+                coluna = coluna[:tamanho * array(tipo).itemsize]
+
+            setattr(self, nome, self._coluna(coluna, tipo))
+
+        # As últimas posições dos índices CSR têm que fechar com o tamanho das colunas que elas indexam
+        if (self.curso_inicios[-1] != n_unidades or self.unidade_inicios[-1] != n_arestas
+                or self.string_inicios[-1] != len(self.string_bytes)):
+            self.fechar()
+            raise CursoException("SnapshotInvalido", f"O arquivo {caminho} está truncado ou corrompido.")
+
+
+    @staticmethod
+    def _coluna(memoria: memoryview, tipo: str) -> "memoryview | array":
+        '''
+        Método que interpreta um trecho do arquivo como uma coluna do tipo informado. Em máquinas little-endian a
+        coluna é uma memoryview sobre o próprio mmap; nas outras, é feita uma cópia com os bytes invertidos.
+        '''
+        if sys.byteorder == "little" or tipo == "B":
+            return memoria.cast(tipo)
+
+        coluna = array(tipo, memoria.tobytes())
+        coluna.byteswap()
+        return coluna
+
+
+    def __len__(self) -> int:
+        '''
+        Método que retorna o número de cursos do snapshot.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - (int): Número de cursos.
+        '''
+        return len(self.curso_codigos)
+
+
+    def __contains__(self, codigo: int) -> bool:
+        '''
+        Método que informa se um curso está no snapshot.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - (bool): True se o curso está no snapshot.
+        '''
+        return self._posicao(codigo) is not None
+
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+
+    def __exit__(self, *args) -> None:
+        self.fechar()
+
+
+    def _posicao(self, codigo: int) -> int:
+        '''
+        Método que retorna a posição de um curso nas colunas de cursos (busca binária nos códigos), ou None.
+        '''
+        posicao = bisect_left(self.curso_codigos, codigo)
+
+        if posicao < len(self.curso_codigos) and self.curso_codigos[posicao] == codigo:
+            return posicao
+
+        return None
+
+
+    def string(self, indice: int) -> str:
+        '''
+        Método que retorna uma string da tabela de strings.
+
+        Parâmetros:
+        - indice (int): Índice da string.
+
+        Retorno:
+        - (str): String.
+        '''
+        return str(self.string_bytes[self.string_inicios[indice]:self.string_inicios[indice + 1]], "utf-8")
+
+
+    def codigos(self) -> list[int]:
+        '''
+        Método que retorna os códigos dos cursos do snapshot.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - (list[int]): Códigos, em ordem crescente.
+        '''
+        return self.curso_codigos.tolist()
+
+
+    def unidades(self, codigo: int) -> range:
+        '''
+        Método que retorna as posições das UCs de um curso nas colunas de UCs, para leituras sem criar objetos.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - (range): Posições das UCs do curso.
+        '''
+        posicao = self._posicao(codigo)
+
+        if posicao is None:
+            raise CursoException("CursoDoesNotExist", f"O curso com código {codigo} não está no snapshot.")
+
+        return range(self.curso_inicios[posicao], self.curso_inicios[posicao + 1])
+
+
+    def curso(self, codigo: int) -> "Curso":
+        '''
+        Método que retorna um curso do snapshot, criando os objetos na primeira vez que ele é pedido.
+
+        Parâmetros:
+        - codigo (int): Código do curso.
+
+        Retorno:
+        - (Curso): Curso.
+        '''
+        curso = self._cursos.get(codigo)
+        if curso is not None:
+            return curso
+
+        unidades = self.unidades(codigo)
+        registros = [
+            [
+                self.string(self.unidade_nomes[i]),
+                self.unidade_cargas[i],
+                bool(self.unidade_obrigatorias[i]),
+                self.pre_requisitos[self.unidade_inicios[i]:self.unidade_inicios[i + 1]].tolist(),
+            ]
+            for i in unidades
+        ]
+
+        curso = Curso.de_confianca(codigo, self.string(self.curso_nomes[self._posicao(codigo)]), registrosParaMatriz(registros))
+        self._cursos[codigo] = curso
+
+        return curso
+
+
+    def fechar(self) -> None:
+        '''
+        Método que fecha o snapshot. Os cursos já criados continuam válidos, mas as colunas não podem mais ser lidas.
+
+        Parâmetros:
+        - None.
+
+        Retorno:
+        - None.
+        '''
+        for nome, _ in self.COLUNAS:
+            coluna = getattr(self, nome)
+            if isinstance(coluna, memoryview):
+                coluna.release()
+
+        self._memoria.release()
+        self._mmap.close()
+
+
+    @classmethod
+    def escrever(cls, cursos: Iterable["Curso"], caminho: str) -> int:
+        '''
+        Método que grava um snapshot com os cursos informados.
+
+        Parâmetros:
+        - cursos (Iterable[Curso]): Cursos do catálogo.
+        - caminho (str): Caminho do arquivo.
+
+        Retorno:
+        - (int): Tamanho do arquivo, em bytes.
+        '''
+        colunas = {nome: array(tipo) for nome, tipo in cls.COLUNAS}
+        strings = {}
+
+        def indiceString(texto: str) -> int:
+            indice = strings.get(texto)
+
+            if indice is None:
+                indice = strings[texto] = len(strings)
+                colunas["string_inicios"].append(len(colunas["string_bytes"]))
+                colunas["string_bytes"].frombytes(texto.encode("utf-8"))
+
+            return indice
+
+        for curso in sorted(cursos, key=lambda curso: curso.id):
+            grafo = curso.grafo
+
+            colunas["curso_codigos"].append(curso.id)
+            colunas["curso_nomes"].append(indiceString(curso.nome))
+            colunas["curso_inicios"].append(len(colunas["unidade_nomes"]))
+
+            for unidade_curricular, pre_requisitos in zip(grafo.unidades, grafo.pre_requisitos):
+                colunas["unidade_nomes"].append(indiceString(unidade_curricular.nome))
+                colunas["unidade_cargas"].append(unidade_curricular.carga_horaria)
+                colunas["unidade_obrigatorias"].append(1 if unidade_curricular.obrigatoria else 0)
+                colunas["unidade_inicios"].append(len(colunas["pre_requisitos"]))
+                colunas["pre_requisitos"].extend(pre_requisitos)
+
+        colunas["curso_inicios"].append(len(colunas["unidade_nomes"]))
+        colunas["unidade_inicios"].append(len(colunas["pre_requisitos"]))
+        colunas["string_inicios"].append(len(colunas["string_bytes"]))
+
+        if sys.byteorder != "little":
+            for coluna in colunas.values():
+                coluna.byteswap()
+
+        deslocamentos = []
+        posicao = cls.CABECALHO.size
+
+        for nome, _ in cls.COLUNAS:
+            posicao = -(-posicao // 8) * 8
+            deslocamentos.append(posicao)
+            posicao += len(colunas[nome]) * colunas[nome].itemsize
+
+        deslocamentos.append(posicao)
+
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(cls.CABECALHO.pack(
+                cls.MAGICO, len(colunas["curso_codigos"]), len(colunas["unidade_nomes"]), len(strings),
+                len(colunas["pre_requisitos"]), *deslocamentos,
+            ))
+
+            for (nome, _), inicio in zip(cls.COLUNAS, deslocamentos):
+                arquivo.write(b"\0" * (inicio - arquivo.tell()))
+                arquivo.write(colunas[nome].tobytes())
+
+        return posicao
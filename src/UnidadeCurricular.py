@@ -1,3 +1,7 @@
+# Imports de sistema
+import sys
+import threading
+
 # Imports locais
 from src.UnidadeCurricularException import UCException
 
@@ -9,8 +13,18 @@ class UnidadeCurricular:
     Essa classe tem os seguintes atributos: nome, carga_horaria, pre_requisitos e obrigatoria. Estes são os elementos
     mínimos necessários para a aplicação, pois assim é possível representar a relação de dependência entre
     certas unidades e outras.
+
+    Como um catálogo inteiro pode ter dezenas de milhares de UCs em memória, a classe usa __slots__ (sem __dict__
+    por instância), os nomes são internados com sys.intern (o mesmo nome lido em cursos diferentes vira uma única
+    string) e os pré-requisitos são guardados em uma tupla, que ocupa menos que uma lista e não pode ser alterada
+    por fora: as mudanças passam sempre por add_pre_requisito/del_pre_requisito.
     '''
 
+    __slots__ = ("_nome", "_carga_horaria", "_pre_requisitos", "_obrigatoria", "_grafos", "__weakref__")
+
+    # Protege o registro dos grafos, pois a mesma UC pode estar em cursos montados por threads diferentes
+    _lock_grafos = threading.Lock()
+
 
     def __init__(self, nome: str, carga_horaria: int, pre_requisitos: list["UnidadeCurricular"], obrigatoria: bool) -> None:
         '''
@@ -20,16 +34,69 @@ class UnidadeCurricular:
         - nome (str): Nome da unidade.
         - carga_horaria (int): Carga horária da unidade.
         - pre_requisitos (list[UnidadeCurricular]): Unidades curriculares necessárias para cursar esta.
+        - obrigatoria (bool): Se a unidade é obrigatória ou optativa.
 
         Retorno:
         - None.
         '''
+        self._grafos        = ()
         self.nome           = nome
         self.carga_horaria  = carga_horaria
         self.pre_requisitos = pre_requisitos
         self.obrigatoria    = obrigatoria
 
 
+    @classmethod
+    def de_confianca(cls, nome: str, carga_horaria: int, pre_requisitos: tuple["UnidadeCurricular", ...], obrigatoria: bool) -> "UnidadeCurricular":
+        '''
+        Construtor alternativo que não valida os atributos. Deve ser usado apenas com dados que já foram validados,
+        como os lidos do cache ou de um perfil gravado pelo próprio programa.
+
+        Parâmetros:
+        - nome (str): Nome da unidade.
+        - carga_horaria (int): Carga horária da unidade.
+        - pre_requisitos (tuple[UnidadeCurricular, ...]): Unidades curriculares necessárias para cursar esta.
+        - obrigatoria (bool): Se a unidade é obrigatória ou optativa.
+
+        Retorno:
+        - (UnidadeCurricular): Unidade curricular criada.
+        '''
+        unidade_curricular = cls.__new__(cls)
+        unidade_curricular._nome           = sys.intern(nome)
+        unidade_curricular._carga_horaria  = carga_horaria
+        unidade_curricular._pre_requisitos = tuple(pre_requisitos)
+        unidade_curricular._obrigatoria    = obrigatoria
+        unidade_curricular._grafos         = ()
+
+        return unidade_curricular
+
+
+    def registrar_grafo(self, referencia: "weakref.ref") -> None:
+        '''
+        Método chamado pelo GrafoCurso de cada curso que tem esta UC, para ser avisado quando ela mudar. Cada UC guarda
+        só referências fracas aos grafos, em uma tupla: um grafo descartado pelo curso não é mantido vivo pela UC.
+
+        Parâmetros:
+        - referencia (weakref.ref): Referência fraca ao grafo.
+
+        Retorno:
+        - None.
+        '''
+        with UnidadeCurricular._lock_grafos:
+            self._grafos = tuple(outra for outra in self._grafos if outra() is not None) + (referencia,)
+
+
+    def _avisar_grafos(self, atributo: str) -> None:
+        '''
+        Método que avisa os grafos dos cursos que têm esta UC de que um atributo dela mudou. Só esses cursos são
+        atualizados; os outros mantêm as suas estruturas calculadas.
+        '''
+        for referencia in self._grafos:
+            grafo = referencia()
+            if grafo is not None:
+                grafo.atualizar(self, atributo)
+
+
     def __str__(self) -> str:
         '''
         Método chamado quando uma objeto da classe é chamado através do print().
@@ -74,7 +141,8 @@ class UnidadeCurricular:
         if nome == "":
             raise UCException("NomeIsEmpty", "O nome da unidade curricular está vazio.")
         
-        self._nome = nome
+        self._nome = sys.intern(nome)
+        self._avisar_grafos("nome")
 
     
     @property
@@ -109,10 +177,11 @@ class UnidadeCurricular:
             raise UCException("CargaHorariaInvalida", "A carga horária informada para a unidade é inválida.")
 
         self._carga_horaria = carga_horaria
+        self._avisar_grafos("carga_horaria")
 
 
     @property
-    def pre_requisitos(self) -> list["UnidadeCurricular"]:
+    def pre_requisitos(self) -> tuple["UnidadeCurricular", ...]:
         '''
         Getter para os pré-requisitos da unidade curricular.
 
@@ -120,7 +189,7 @@ class UnidadeCurricular:
         - None.
 
         Retorno:
-        - pre_requisitos (list[UnidadeCurricular]): Lista de pré-requisitos da UC.
+        - pre_requisitos (tuple[UnidadeCurricular, ...]): Pré-requisitos da UC.
         '''
         return self._pre_requisitos
 
@@ -131,19 +200,20 @@ class UnidadeCurricular:
         Setter dos pré-requisitos da unidade curricular.
 
         Parâmetros:
-        - pre_requisitos (list[UnidadeCurricular]): Lista de pré-requisitos da UC.
+        - pre_requisitos (list[UnidadeCurricular]): Lista (ou tupla) de pré-requisitos da UC.
 
         Retorno:
         - None.
         '''
 
-        if not isinstance(pre_requisitos, list):
+        if not isinstance(pre_requisitos, (list, tuple)):
             raise UCException("PreRequisitosInvalidos", "Os pré-requisitos da unidade são inválidos.")
 
         if not all(isinstance(pre_requisito, UnidadeCurricular) for pre_requisito in pre_requisitos):
             raise UCException("PreRequisitosInvalidos", "Nem todos os pré-requisitos para a unidade são válidos.")
 
-        self._pre_requisitos = pre_requisitos
+        self._pre_requisitos = tuple(pre_requisitos)
+        self._avisar_grafos("pre_requisitos")
 
 
     @property
@@ -175,6 +245,7 @@ class UnidadeCurricular:
             raise UCException("ObrigatoriedadeNotBool", "A obrigatoriedade da unidade é inválida.")
 
         self._obrigatoria = obrigatoria
+        self._avisar_grafos("obrigatoria")
 
 
     def add_pre_requisito(self, pre_requisito: "UnidadeCurricular") -> None:
@@ -193,7 +264,8 @@ class UnidadeCurricular:
         if pre_requisito in self.pre_requisitos:
             raise UCException("PreRequisitoJaAdicionado", "O pré-requisito já está presente na lista de pré-requisitos da unidade.")
 
-        self.pre_requisitos.append(pre_requisito)
+        self._pre_requisitos += (pre_requisito,)
+        self._avisar_grafos("pre_requisitos")
 
 
     def del_pre_requisito(self, pre_requisito: "UnidadeCurricular") -> None:
@@ -210,4 +282,5 @@ class UnidadeCurricular:
             raise UCException("PreRequisitoInvalido", "O pré-requisito é inválido.")
 
         if pre_requisito in self.pre_requisitos:
-            self.pre_requisitos.append(pre_requisito)
+            self._pre_requisitos = tuple(unidade_curricular for unidade_curricular in self._pre_requisitos if unidade_curricular is not pre_requisito)
+            self._avisar_grafos("pre_requisitos")
@@ -1,13 +1,168 @@
-# Imports de bibliotecas externas
-import requests
-from bs4 import BeautifulSoup
+# Imports de sistema
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator
+from urllib.parse import urlsplit
 
 # Imports locais
+from src import Instrumentacao
+from src.CacheCursos import CacheCursos
 from src.Curso import Curso
 from src.CursoException import CursoException
+from src.IndiceNomes import IndiceNomes
+from src.LimitadorTaxa import LimitadorTaxa
+from src.Normalizacao import normalizarNome
+from src.ParserHTML import QUEBRA, extrairLinhas, extrairTexto, iterarLinhas
+from src.Pipeline import executarPipeline
+from src.Serializacao import matrizParaRegistros, registrosParaMatriz
 from src.UnidadeCurricular import UnidadeCurricular
 
 
+URL_BASE = "https://ensino.ufms.br"
+
+'''
+Configuração da sessão HTTP compartilhada por todas as funções do scraper. A sessão mantém as conexões
+abertas (keep-alive) entre uma requisição e outra, então carregar vários cursos em sequência não precisa
+abrir uma conexão nova para cada página.
+
+O requests (e o urllib3) só é importado quando a sessão é criada, na primeira requisição: importar este arquivo não
+carrega a pilha de rede, então os comandos que não acessam o site iniciam rápido.
+'''
+_config = {
+    "pool_size": 10,
+    "timeout": (5, 30),
+    "tentativas": 3,
+    "backoff": 0.5,
+}
+_sessao = None
+_sessao_lock = threading.Lock()
+_limitador = None
+
+
+def configurarSessao(pool_size: int = 10, timeout: tuple[float, float] = (5, 30), tentativas: int = 3, backoff: float = 0.5, url_base: str = None, requisicoes_por_segundo: float = None) -> None:
+    '''
+    Função que altera a configuração da sessão HTTP usada pelo scraper. A sessão atual é descartada e uma
+    nova é criada na próxima requisição.
+
+    Parâmetros:
+    - pool_size (int): Número máximo de conexões mantidas abertas por host.
+    - timeout (tuple[float, float]): Timeout de conexão e de leitura, em segundos.
+    - tentativas (int): Número de novas tentativas em caso de erro de conexão ou status 429/5xx.
+    - backoff (float): Fator de espera exponencial entre as tentativas.
+    - url_base (str): Endereço base do site de ensino (útil para apontar para um servidor local).
+    - requisicoes_por_segundo (float): Limite de requisições por segundo para cada host. None desativa o limite.
+
+    Retorno:
+    - None.
+    '''
+    global _sessao, _limitador, URL_BASE
+
+    _config["pool_size"] = pool_size
+    _config["timeout"] = timeout
+    _config["tentativas"] = tentativas
+    _config["backoff"] = backoff
+
+    if url_base is not None:
+        URL_BASE = url_base.rstrip("/")
+
+    _limitador = LimitadorTaxa(requisicoes_por_segundo) if requisicoes_por_segundo is not None else None
+
+    if _sessao is not None:
+        _sessao.close()
+    _sessao = None
+
+
+def getSessao() -> "requests.Session":
+    '''
+    Função que retorna a sessão HTTP compartilhada, criando-a na primeira chamada.
+
+    Parâmetros:
+    - None.
+
+    Retorno:
+    - sessao (requests.Session): Sessão com pool de conexões e política de novas tentativas.
+    '''
+    global _sessao
+
+    with _sessao_lock:
+        if _sessao is not None:
+            return _sessao
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # Sem raise_on_status=False, um status da lista que continua depois da última tentativa viraria RetryError;
+        # assim a última resposta é devolvida e quem chamou trata o status, como nas outras respostas de erro
+        retry = Retry(
+            total=_config["tentativas"],
+            backoff_factor=_config["backoff"],
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD"),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=_config["pool_size"], pool_maxsize=_config["pool_size"], max_retries=retry)
+
+        sessao = requests.Session()
+        sessao.mount("http://", adapter)
+        sessao.mount("https://", adapter)
+        _sessao = sessao
+
+        return _sessao
+
+
+def baixarPagina(link: str, cabecalhos: dict[str, str] = None, stream: bool = False) -> "requests.Response":
+    '''
+    Função que baixa uma página usando a sessão compartilhada.
+
+    Parâmetros:
+    - link (str): Endereço da página.
+    - cabecalhos (dict[str, str]): Cabeçalhos extras da requisição (por exemplo, os de requisição condicional).
+    - stream (bool): Se True, o corpo não é baixado de uma vez e pode ser lido aos poucos com iter_content().
+
+    Retorno:
+    - response (requests.Response): Resposta da requisição.
+    '''
+    if _limitador is not None:
+        _limitador.aguardar(urlsplit(link).netloc)
+
+    with Instrumentacao.etapa("rede"):
+        resposta = getSessao().get(link, headers=cabecalhos, timeout=_config["timeout"], stream=stream)
+
+    Instrumentacao.registrarResposta(resposta, stream)
+
+    return resposta
+
+
+def baixarPaginaCurso(codigo: int) -> "requests.Response":
+    '''
+    Função que baixa a página de visualização do curso, usada tanto para saber se ele existe quanto para
+    obter o seu nome.
+
+    Parâmetros:
+    - codigo (int): Código do curso.
+
+    Retorno:
+    - response (requests.Response): Resposta da requisição.
+    '''
+    return baixarPagina(f"{URL_BASE}/cursos/view/{codigo}")
+
+
+def baixarPaginaMatriz(codigo: int, cabecalhos: dict[str, str] = None, stream: bool = False) -> "requests.Response":
+    '''
+    Função que baixa a página com a tabela de pré-requisitos (matriz curricular) do curso.
+
+    Parâmetros:
+    - codigo (int): Código do curso.
+    - cabecalhos (dict[str, str]): Cabeçalhos extras da requisição.
+    - stream (bool): Se True, o corpo pode ser lido aos poucos com iter_content().
+
+    Retorno:
+    - response (requests.Response): Resposta da requisição.
+    '''
+    return baixarPagina(f"{URL_BASE}/cursos/prerequisito/{codigo}", cabecalhos, stream)
+
+
 def exists(codigo: int) -> bool:
     '''
     Função que procura o código de um curso no site da UFMS e retorna se ele existe ou não.
@@ -18,10 +173,7 @@ def exists(codigo: int) -> bool:
     Retorno:
     - (bool): True se existe, False se não existe.
     '''
-    link = f"https://ensino.ufms.br/cursos/view/{codigo}"
-    response = requests.get(link)
-
-    return (True if response.status_code == 200 else False)
+    return baixarPaginaCurso(codigo).status_code == 200
 
 
 def filtrarNome(nome: str) -> str:
@@ -65,20 +217,112 @@ def isObrigatoria(nome: str) -> str:
     return "(OBR)" in nome
 
 
-def scrapeMatrizCurricular(codigo: int) -> list["UnidadeCurricular"]:
+def filtrarPreRequisitos(celula: str) -> list[str]:
+    '''
+    Função que separa a coluna de pré-requisitos da tabela em nomes de UCs. Cada pré-requisito vem depois de um <br>
+    (ou separado por ';') dentro da célula.
+
+    Parâmetros:
+    - celula (str): Texto da célula de pré-requisitos, com QUEBRA no lugar de cada <br> (ver ParserHTML).
+
+    Retorno:
+    - pre_requisitos (list[str]): Nomes filtrados dos pré-requisitos. Vazia se a UC não tiver pré-requisitos.
+    '''
+    pre_requisitos = []
+
+    for parte in celula.replace(QUEBRA, ";").split(";"):
+        nome = filtrarNome(parte)
+
+        if nome != "" and nome != "-":
+            pre_requisitos.append(nome)
+
+    return pre_requisitos
+
+
+def vincularPreRequisitos(matriz_curricular: list["UnidadeCurricular"], pre_requisitos: list[list[str]]) -> list[str]:
+    '''
+    Função que liga cada UC da matriz aos seus pré-requisitos, a partir dos nomes lidos da tabela.
+
+    Os nomes são procurados em um índice (dicionário) do nome normalizado para a UC, então o custo é linear no
+    tamanho da matriz mais o número de pré-requisitos, mesmo para matrizes grandes. Os nomes que não aparecem
+    exatamente na matriz (abreviados ou com erros de digitação na tabela) são procurados em um IndiceNomes, montado
+    só se for preciso, e ligados quando há uma única UC com nome bem parecido.
+
+    Parâmetros:
+    - matriz_curricular (list[UnidadeCurricular]): Matriz curricular do curso.
+    - pre_requisitos (list[list[str]]): Nomes dos pré-requisitos de cada UC, na mesma ordem da matriz.
+
+    Retorno:
+    - nao_resolvidos (list[str]): Nomes de pré-requisitos que não correspondem a nenhuma UC da matriz.
+    '''
+    indice = {}
+    for unidade_curricular in matriz_curricular:
+        indice.setdefault(normalizarNome(unidade_curricular.nome), unidade_curricular)
+
+    nao_resolvidos = []
+    aproximado = None
+
+    for unidade_curricular, nomes in zip(matriz_curricular, pre_requisitos):
+        for nome in nomes:
+            pre_requisito = indice.get(normalizarNome(nome))
+
+            if pre_requisito is None:
+                if aproximado is None:
+                    aproximado = IndiceNomes(candidata.nome for candidata in matriz_curricular)
+
+                posicao = aproximado.melhor(nome)
+                if posicao is not None:
+                    pre_requisito = matriz_curricular[posicao]
+
+            if pre_requisito is None:
+                nao_resolvidos.append(nome)
+            elif pre_requisito is not unidade_curricular and pre_requisito not in unidade_curricular.pre_requisitos:
+                unidade_curricular.add_pre_requisito(pre_requisito)
+
+    return nao_resolvidos
+
+
+def filtrarLinha(td: list[str]) -> tuple["UnidadeCurricular", list[str]]:
+    '''
+    Função que transforma uma linha da tabela da matriz curricular em uma unidade curricular, ainda sem os
+    pré-requisitos ligados.
+
+    Parâmetros:
+    - td (list[str]): Textos das células da linha.
+
+    Retorno:
+    - (tuple[UnidadeCurricular, list[str]]): UC e nomes dos seus pré-requisitos, ou None se a linha não for uma UC.
+    '''
+    if len(td) <= 2:
+        return None
+
+    nome = filtrarNome(td[0])
+    carga_horaria = filtrarCargaHoraria(td[1].strip())
+    pre_requisito = filtrarPreRequisitos(td[2])
+    obrigatoria = isObrigatoria(td[0])
+
+    return UnidadeCurricular(nome, carga_horaria, [], obrigatoria), pre_requisito
+
+
+def scrapeMatrizCurricular(codigo: int, html: bytes = None, nao_resolvidos: list[str] = None) -> list["UnidadeCurricular"]:
     '''
     Função responsável por organizar as informações da matriz curricular de um curso.
 
     Parâmetros:
     - codigo (int): Código do curso.
+    - html (bytes): Conteúdo da página de pré-requisitos já baixado. Se não for informado, a página é baixada.
+    - nao_resolvidos (list[str]): Lista opcional que recebe os nomes de pré-requisitos não encontrados na matriz.
 
     Retorno:
     - matriz_curricular (list[UnidadeCurricular]): matriz curricular do curso.
     '''
-    html = requests.get(f"https://ensino.ufms.br/cursos/prerequisito/{codigo}")
-    table = BeautifulSoup(html.content, "html.parser").find("tbody")
+    if html is None:
+        html = baixarPaginaMatriz(codigo).content
+
+    with Instrumentacao.etapa("parsing"):
+        linhas = extrairLinhas(html, "tbody")
 
-    if isinstance(table, type(None)):
+    if isinstance(linhas, type(None)):
         return None
 
     pre_requisitos = []
@@ -92,69 +336,275 @@ def scrapeMatrizCurricular(codigo: int) -> list["UnidadeCurricular"]:
     complicado de fazer o web scraping nas tabelas dos cursos da Facom, que foi os que eu testei. Então tem
     a grande possibilidade de não funcionar para cursos de fora da Facom ou para cursos com PPC antigo.
     '''
-    for tr in table.find_all('tr'):
-        td = tr.find_all('td')
-
-        if len(td) > 2:
-            nome = filtrarNome(td[0].get_text())
-            carga_horaria = filtrarCargaHoraria(td[1].get_text())
-            pre_requisito = filtrarNome(td[2].get_text())
-            obrigatoria = isObrigatoria(td[0].get_text())
+    with Instrumentacao.etapa("filtragem"):
+        for td in linhas:
+            linha = filtrarLinha(td)
 
-            unidade_curricular = UnidadeCurricular(nome, carga_horaria, [], obrigatoria)
+            if linha is not None:
+                unidade_curricular, pre_requisito = linha
 
-            matriz_curricular.append(unidade_curricular)
-            pre_requisitos.append(pre_requisito)
+                matriz_curricular.append(unidade_curricular)
+                pre_requisitos.append(pre_requisito)
 
     # Essa parte é responsável por adicionar os pré-requisitos de cada matéria do curso
-    for i in range(len(matriz_curricular)):
-        pre_requisito = ""
-        
-        for j in range(len(matriz_curricular)):
-            if matriz_curricular[j].nome == pre_requisitos[i]:
-                pre_requisito = matriz_curricular[i]
-                break
+    with Instrumentacao.etapa("vinculacao"):
+        nao_encontrados = vincularPreRequisitos(matriz_curricular, pre_requisitos)
 
-        if isinstance(pre_requisito, UnidadeCurricular):
-            matriz_curricular[i].add_pre_requisito(pre_requisito)
+    if nao_resolvidos is not None:
+        nao_resolvidos.extend(nao_encontrados)
 
     return matriz_curricular
 
 
-def scrapeNomeCurso(codigo: int) -> str:
+def iterarMatrizCurricular(codigo: int, pedacos: Iterable[bytes] = None, nao_resolvidos: list[str] = None) -> Iterator["UnidadeCurricular"]:
+    '''
+    Versão incremental de scrapeMatrizCurricular. A página é lida em pedaços conforme chega pela rede, e cada
+    unidade curricular é devolvida assim que a sua linha termina de ser lida, sem esperar o resto da tabela.
+
+    Como um pré-requisito pode aparecer depois da UC que depende dele, os pré-requisitos só são ligados em uma
+    passada final, quando a tabela termina: as UCs já devolvidas recebem os seus pré-requisitos nesse momento, então
+    eles só estão completos depois que o iterador é consumido até o fim.
+
+    Parâmetros:
+    - codigo (int): Código do curso.
+    - pedacos (Iterable[bytes]): Pedaços da página de pré-requisitos. Se não for informado, a página é baixada.
+    - nao_resolvidos (list[str]): Lista opcional que recebe os nomes de pré-requisitos não encontrados na matriz.
+
+    Retorno:
+    - (Iterator[UnidadeCurricular]): Unidades curriculares, na ordem da tabela.
+    '''
+    resposta = None
+
+    if pedacos is None:
+        resposta = baixarPaginaMatriz(codigo, stream=True)
+        pedacos = resposta.iter_content(chunk_size=16 * 1024)
+
+    pre_requisitos = []
+    matriz_curricular = []
+
+    try:
+        for td in iterarLinhas(pedacos, "tbody"):
+            linha = filtrarLinha(td)
+
+            if linha is not None:
+                unidade_curricular, pre_requisito = linha
+
+                matriz_curricular.append(unidade_curricular)
+                pre_requisitos.append(pre_requisito)
+
+                yield unidade_curricular
+    finally:
+        if resposta is not None:
+            resposta.close()
+
+    with Instrumentacao.etapa("vinculacao"):
+        nao_encontrados = vincularPreRequisitos(matriz_curricular, pre_requisitos)
+
+    if nao_resolvidos is not None:
+        nao_resolvidos.extend(nao_encontrados)
+
+
+def scrapeNomeCurso(codigo: int, html: bytes = None) -> str:
     '''
     Função que busca o nome do curso com base no seu código.
 
     Parâmetros:
     - codigo (int): Código do curso.
+    - html (bytes): Conteúdo da página do curso já baixado. Se não for informado, a página é baixada.
 
     Retorno:
     - nome (str): Nome do curso.
     '''
-    link = f"https://ensino.ufms.br/cursos/view/{codigo}"
-    html = requests.get(link)
-    
-    nome = BeautifulSoup(html.content, "html.parser").find("small").get_text()
+    if html is None:
+        html = baixarPaginaCurso(codigo).content
+
+    with Instrumentacao.etapa("parsing"):
+        nome = extrairTexto(html, "small")
+
     return " ".join(nome.split()[2:len(nome.split())])
 
 
-def findCurso(codigo: int) -> "Curso":
+def baixarCurso(codigo: int, cache: "CacheCursos" = None) -> "Curso | tuple[requests.Response, requests.Response]":
     '''
-    Função que busca as informações de um curso no site da UFMS.
+    Função com a parte de rede de findCurso: consulta o cache e baixa as páginas do curso e da matriz curricular.
+
+    Cada página do curso é baixada uma única vez: a existência do curso é verificada pelo status da própria
+    página de onde o nome é extraído. Se um cache for informado, uma entrada atualizada é devolvida sem acessar
+    a rede, e uma entrada expirada é revalidada com uma requisição condicional à página da matriz.
 
     Parâmetros:
     - codigo (int): Código do curso.
+    - cache (CacheCursos): Cache local de cursos (opcional).
 
     Retorno:
-    - (Curso): curso.
+    - (Curso | tuple[requests.Response, requests.Response]): O curso, se ele estava no cache, ou as respostas da
+      página do curso e da página da matriz.
     '''
-    if not exists(codigo):
+    pagina_matriz = None
+
+    if cache is not None:
+        with Instrumentacao.etapa("cache"):
+            curso = cache.obter(codigo)
+
+        if curso is not None:
+            return curso
+
+        cabecalhos = cache.cabecalhos_condicionais(codigo)
+        if cabecalhos:
+            pagina_matriz = baixarPaginaMatriz(codigo, cabecalhos)
+
+            if pagina_matriz.status_code == 304:
+                curso = cache.revalidar(codigo)
+                if curso is not None:
+                    return curso
+
+                pagina_matriz = None
+
+    pagina_curso = baixarPaginaCurso(codigo)
+
+    if pagina_curso.status_code != 200:
         raise CursoException("CursoDoesNotExist", f"O curso com código {codigo} não existe.")
 
-    nome = scrapeNomeCurso(codigo)
-    matriz_curricular = scrapeMatrizCurricular(codigo)
+    if pagina_matriz is None:
+        pagina_matriz = baixarPaginaMatriz(codigo)
+
+    return pagina_curso, pagina_matriz
+
 
+def montarCurso(codigo: int, nome: str, matriz_curricular: list["UnidadeCurricular"], cabecalhos: dict[str, str], cache: "CacheCursos" = None) -> "Curso":
+    '''
+    Função que cria o curso a partir do que foi lido das páginas e o grava no cache.
+
+    Parâmetros:
+    - codigo (int): Código do curso.
+    - nome (str): Nome do curso.
+    - matriz_curricular (list[UnidadeCurricular]): Matriz curricular, ou None se ela não foi encontrada na página.
+    - cabecalhos (dict[str, str]): Cabeçalhos da resposta da página da matriz (ETag e Last-Modified).
+    - cache (CacheCursos): Cache local de cursos (opcional).
+
+    Retorno:
+    - (Curso): curso.
+    '''
     if isinstance(matriz_curricular, type(None)):
         raise CursoException("MatrizCurricularNotFound", f"Não foi possível achar a matriz curricular do curso com código.")
 
-    return Curso(codigo, nome, matriz_curricular)
\ No newline at end of file
+    curso = Curso.de_confianca(codigo, nome, matriz_curricular)
+
+    if cache is not None:
+        with Instrumentacao.etapa("gravacao_cache"):
+            cache.salvar(curso, cabecalhos.get("ETag"), cabecalhos.get("Last-Modified"))
+
+    return curso
+
+
+def processarPaginas(codigo: int, html_curso: bytes, html_matriz: bytes) -> tuple[str, list[list]]:
+    '''
+    Função com a parte de CPU de findCurso, executada nos processos de findCursosProcessos. O resultado é devolvido
+    como registros (ver Serializacao), que são pequenos e passam pelo pickle muito mais rápido que os objetos.
+
+    Parâmetros:
+    - codigo (int): Código do curso.
+    - html_curso (bytes): Conteúdo da página do curso.
+    - html_matriz (bytes): Conteúdo da página da matriz curricular.
+
+    Retorno:
+    - (tuple[str, list[list]]): Nome do curso e registros da matriz curricular (None se ela não foi encontrada).
+    '''
+    nome = scrapeNomeCurso(codigo, html_curso)
+    matriz_curricular = scrapeMatrizCurricular(codigo, html_matriz)
+
+    return nome, (matrizParaRegistros(matriz_curricular) if matriz_curricular is not None else None)
+
+
+def findCurso(codigo: int, cache: "CacheCursos" = None) -> "Curso":
+    '''
+    Função que busca as informações de um curso no site da UFMS (ver baixarCurso).
+
+    Parâmetros:
+    - codigo (int): Código do curso.
+    - cache (CacheCursos): Cache local de cursos (opcional).
+
+    Retorno:
+    - (Curso): curso.
+    '''
+    paginas = baixarCurso(codigo, cache)
+
+    if isinstance(paginas, Curso):
+        return paginas
+
+    pagina_curso, pagina_matriz = paginas
+
+    nome = scrapeNomeCurso(codigo, pagina_curso.content)
+    matriz_curricular = scrapeMatrizCurricular(codigo, pagina_matriz.content)
+
+    return montarCurso(codigo, nome, matriz_curricular, pagina_matriz.headers, cache)
+
+
+def findCursos(codigos: Iterable[int], max_concurrency: int = 8, cache: "CacheCursos" = None) -> Iterator[tuple[int, "Curso | Exception"]]:
+    '''
+    Função que busca vários cursos ao mesmo tempo, usando um pool de threads sobre a sessão compartilhada.
+
+    Os resultados são devolvidos conforme cada curso termina de ser carregado, e não na ordem dos códigos. Um erro
+    em um curso não interrompe os outros: a exceção é devolvida no lugar do curso. O limite de requisições por host
+    é o definido em configurarSessao, e o pool_size da sessão deve ser pelo menos max_concurrency para que as
+    threads não fiquem esperando por conexões livres.
+
+    Parâmetros:
+    - codigos (Iterable[int]): Códigos dos cursos.
+    - max_concurrency (int): Número máximo de cursos sendo carregados ao mesmo tempo.
+    - cache (CacheCursos): Cache local de cursos (opcional).
+
+    Retorno:
+    - (Iterator[tuple[int, Curso | Exception]]): Pares (código, curso ou exceção) na ordem em que ficam prontos.
+    '''
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futuros = {executor.submit(findCurso, codigo, cache): codigo for codigo in codigos}
+
+        for futuro in as_completed(futuros):
+            codigo = futuros[futuro]
+
+            try:
+                yield codigo, futuro.result()
+            except Exception as erro:
+                yield codigo, erro
+
+
+def findCursosProcessos(codigos: Iterable[int], max_concurrency: int = 8, processos: int = None, cache: "CacheCursos" = None, max_pendentes: int = None) -> Iterator[tuple[int, "Curso | Exception"]]:
+    '''
+    Versão de findCursos para lotes grandes, em que o parsing é feito em vários processos (ver Pipeline). As threads
+    baixam as páginas (e consultam o cache), os processos executam processarPaginas e o processo principal monta os
+    cursos a partir dos registros e os grava no cache.
+
+    Parâmetros:
+    - codigos (Iterable[int]): Códigos dos cursos.
+    - max_concurrency (int): Número de cursos sendo baixados ao mesmo tempo.
+    - processos (int): Número de processos de parsing. O padrão é o número de núcleos.
+    - cache (CacheCursos): Cache local de cursos (opcional).
+    - max_pendentes (int): Número máximo de cursos baixados e ainda não devolvidos (ver executarPipeline).
+
+    Retorno:
+    - (Iterator[tuple[int, Curso | Exception]]): Pares (código, curso ou exceção) na ordem em que ficam prontos.
+    '''
+    def baixar(codigo: int) -> tuple:
+        paginas = baixarCurso(codigo, cache)
+
+        if isinstance(paginas, Curso):
+            return None, paginas
+
+        pagina_curso, pagina_matriz = paginas
+        return (codigo, pagina_curso.content, pagina_matriz.content), pagina_matriz.headers
+
+    for codigo, resultado, contexto in executarPipeline(codigos, baixar, processarPaginas, max_concurrency, processos, max_pendentes):
+        if resultado is None:
+            curso = contexto
+        elif isinstance(resultado, Exception):
+            curso = resultado
+        else:
+            nome, registros = resultado
+
+            try:
+                curso = montarCurso(codigo, nome, registrosParaMatriz(registros) if registros is not None else None, contexto, cache)
+            except Exception as erro:
+                curso = erro
+
+        yield codigo, curso
@@ -0,0 +1,151 @@
+# Imports de sistema
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Imports locais
+from benchmarks.gerador import gerarCurso
+from src.BuscaCoalescida import BuscaCoalescida
+from src.BuscaCoalescidaAsync import BuscaCoalescidaAsync
+from src.CursoException import CursoException
+
+
+class BuscaFalsa:
+    '''
+    Substituto de findCurso que conta as chamadas e só termina quando liberado.
+    '''
+
+    def __init__(self, erro: Exception = None) -> None:
+        self.erro      = erro
+        self.chamadas  = 0
+        self.iniciada  = threading.Event()
+        self.liberada  = threading.Event()
+
+    def __call__(self, codigo: int, cache) -> "Curso":
+        self.chamadas += 1
+        self.iniciada.set()
+        self.liberada.wait(5)
+
+        if self.erro is not None:
+            raise self.erro
+
+        return gerarCurso(5, codigo=codigo, semente=codigo)
+
+
+class TestBuscaCoalescida(unittest.TestCase):
+    '''
+    Testes da busca coalescida com threads.
+    '''
+
+    def test_buscas_simultaneas_fazem_uma_so_busca(self) -> None:
+        buscar = BuscaFalsa()
+        busca = BuscaCoalescida(buscar=buscar)
+        largada = threading.Barrier(8)
+
+        def obter() -> "Curso":
+            largada.wait(5)
+            return busca.obter(1)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futuros = [executor.submit(obter) for _ in range(8)]
+            buscar.iniciada.wait(5)
+            # Dá tempo para as outras threads chegarem à busca em andamento antes de liberá-la
+            time.sleep(0.1)
+            buscar.liberada.set()
+            cursos = [futuro.result(5) for futuro in futuros]
+
+        self.assertEqual(buscar.chamadas, 1)
+        self.assertTrue(all(curso is cursos[0] for curso in cursos))
+
+
+    def test_curso_inexistente_e_lembrado(self) -> None:
+        buscar = BuscaFalsa(CursoException("CursoDoesNotExist", "O curso com código 1 não existe."))
+        buscar.liberada.set()
+        busca = BuscaCoalescida(buscar=buscar)
+
+        for _ in range(3):
+            with self.assertRaises(CursoException) as contexto:
+                busca.obter(1)
+            self.assertEqual(contexto.exception.valor, "CursoDoesNotExist")
+
+        self.assertEqual(buscar.chamadas, 1)
+
+        busca.esquecer(1)
+        with self.assertRaises(CursoException):
+            busca.obter(1)
+        self.assertEqual(buscar.chamadas, 2)
+
+
+    def test_outros_erros_nao_sao_lembrados(self) -> None:
+        for erro in (ConnectionError("sem rede"), CursoException("MatrizCurricularNotFound", "Sem matriz.")):
+            with self.subTest(erro=erro):
+                buscar = BuscaFalsa(erro)
+                buscar.liberada.set()
+                busca = BuscaCoalescida(buscar=buscar)
+
+                for _ in range(2):
+                    with self.assertRaises(type(erro)):
+                        busca.obter(1)
+
+                self.assertEqual(buscar.chamadas, 2)
+
+
+    def test_erro_compartilhado_pelas_buscas_simultaneas(self) -> None:
+        buscar = BuscaFalsa(ConnectionError("sem rede"))
+        busca = BuscaCoalescida(buscar=buscar)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futuros = [executor.submit(busca.obter, 1) for _ in range(4)]
+            buscar.iniciada.wait(5)
+            buscar.liberada.set()
+
+            for futuro in futuros:
+                self.assertIsInstance(futuro.exception(5), ConnectionError)
+
+        self.assertEqual(buscar.chamadas, 1)
+
+
+class TestBuscaCoalescidaAsync(unittest.TestCase):
+    '''
+    Testes da busca coalescida com asyncio.
+    '''
+
+    def test_buscas_simultaneas_fazem_uma_so_busca(self) -> None:
+        buscar = BuscaFalsa()
+        concluidos = []
+
+        async def executar() -> list:
+            busca = BuscaCoalescidaAsync(buscar=buscar, ao_concluir=lambda codigo, curso: concluidos.append(codigo))
+            tarefas = [asyncio.create_task(busca.obter(1)) for _ in range(8)]
+
+            await asyncio.sleep(0)
+            buscar.liberada.set()
+            return await asyncio.gather(*tarefas)
+
+        cursos = asyncio.run(executar())
+
+        self.assertEqual(buscar.chamadas, 1)
+        self.assertTrue(all(curso is cursos[0] for curso in cursos))
+        self.assertEqual(concluidos, [1])
+
+
+    def test_curso_inexistente_e_lembrado_e_outros_erros_nao(self) -> None:
+        for erro, chamadas in ((CursoException("CursoDoesNotExist", "Não existe."), 1), (ConnectionError("sem rede"), 3)):
+            with self.subTest(erro=erro):
+                buscar = BuscaFalsa(erro)
+                buscar.liberada.set()
+
+                async def executar() -> None:
+                    busca = BuscaCoalescidaAsync(buscar=buscar)
+                    for _ in range(3):
+                        with self.assertRaises(type(erro)):
+                            await busca.obter(1)
+
+                asyncio.run(executar())
+                self.assertEqual(buscar.chamadas, chamadas)
+
+
+if __name__ == "__main__":
+    unittest.main()
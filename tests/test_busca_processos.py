@@ -0,0 +1,53 @@
+# Imports de sistema
+import unittest
+
+# Imports locais
+from benchmarks.site_local import SiteLocal
+from src import WebScraper
+from src.CursoException import CursoException
+
+
+def descrever(resultado: "Curso | Exception") -> tuple:
+    '''
+    Função que resume o resultado de uma busca: o conteúdo do curso, ou o tipo e o valor da exceção.
+    '''
+    if isinstance(resultado, Exception):
+        return type(resultado).__name__, getattr(resultado, "valor", None)
+
+    return resultado.id, resultado.nome, [
+        (unidade.nome, unidade.carga_horaria, unidade.obrigatoria, [pre_requisito.nome for pre_requisito in unidade.pre_requisitos])
+        for unidade in resultado.matriz_curricular
+    ]
+
+
+class TestFindCursosProcessos(unittest.TestCase):
+    '''
+    Testes da busca com parsing em processos (spawn) contra a busca só com threads.
+    '''
+
+    def setUp(self) -> None:
+        self.site = SiteLocal([1, 2, 3, 4], n_unidades=30).iniciar()
+        # Um curso com a página da matriz sem tabela
+        self.site.alterar(4, b"<html><body><p>Sem matriz.</p></body></html>")
+        WebScraper.configurarSessao(url_base=self.site.url, tentativas=0)
+
+
+    def tearDown(self) -> None:
+        WebScraper.configurarSessao(url_base="https://ensino.ufms.br")
+        self.site.parar()
+
+
+    def test_mesmos_resultados_e_erros_que_findCursos(self) -> None:
+        codigos = [1, 2, 3, 4, 99]
+
+        threads = {codigo: descrever(resultado) for codigo, resultado in WebScraper.findCursos(codigos, max_concurrency=4)}
+        processos = {codigo: descrever(resultado) for codigo, resultado in WebScraper.findCursosProcessos(codigos, max_concurrency=4, processos=2)}
+
+        self.assertEqual(processos, threads)
+        self.assertEqual(threads[99], (CursoException.__name__, "CursoDoesNotExist"))
+        self.assertEqual(threads[4], (CursoException.__name__, "MatrizCurricularNotFound"))
+        self.assertEqual(len(threads[1][2]), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Imports de sistema
+import gc
+import unittest
+
+# Imports locais
+from src.CatalogoUnidades import CatalogoUnidades
+from src.Curso import Curso
+from src.Normalizacao import normalizarNome
+from src.UnidadeCurricular import UnidadeCurricular
+
+
+def montarCurso(codigo: int, nome_algoritmos: str, especifica: str, optativa_obrigatoria: bool = False) -> "Curso":
+    '''
+    Função que monta um curso pequeno com UCs comuns (Algoritmos I e II) e uma UC específica, com objetos próprios.
+    '''
+    algoritmos_1 = UnidadeCurricular(nome_algoritmos, 68, [], True)
+    algoritmos_2 = UnidadeCurricular("Algoritmos e Programação II", 68, [algoritmos_1], True)
+    propria = UnidadeCurricular(especifica, 51, [], True)
+    optativa = UnidadeCurricular("Tópicos Avançados", 51, [algoritmos_2, propria], optativa_obrigatoria)
+
+    return Curso(codigo, f"Curso {codigo}", [algoritmos_1, algoritmos_2, propria, optativa])
+
+
+def descrever(curso: "Curso") -> list[tuple]:
+    '''
+    Função que resume a matriz de um curso, com os nomes normalizados (a UC compartilhada fica com o nome do primeiro
+    curso registrado).
+    '''
+    return [
+        (
+            normalizarNome(unidade.nome), unidade.carga_horaria, unidade.obrigatoria,
+            [normalizarNome(pre_requisito.nome) for pre_requisito in unidade.pre_requisitos],
+        )
+        for unidade in curso.matriz_curricular
+    ]
+
+
+class TestCatalogoUnidades(unittest.TestCase):
+    '''
+    Testes do compartilhamento de UCs entre cursos no catálogo global.
+    '''
+
+    def setUp(self) -> None:
+        self.catalogo = CatalogoUnidades()
+        self.originais = [
+            montarCurso(1, "Algoritmos e Programação I", "Cálculo I"),
+            montarCurso(2, "ALGORITMOS E PROGRAMAÇÃO I", "Física I"),
+        ]
+        self.cursos = [self.catalogo.registrar(curso) for curso in self.originais]
+
+
+    def test_ucs_iguais_sao_compartilhadas(self) -> None:
+        primeiro, segundo = self.cursos
+
+        # Algoritmos I (com nome normalizado igual) e II são o mesmo objeto nos dois cursos
+        self.assertIs(primeiro.matriz_curricular[0], segundo.matriz_curricular[0])
+        self.assertIs(primeiro.matriz_curricular[1], segundo.matriz_curricular[1])
+        self.assertIsNot(primeiro.matriz_curricular[2], segundo.matriz_curricular[2])
+
+        # A optativa tem pré-requisitos diferentes em cada curso, então não é compartilhada
+        self.assertIsNot(primeiro.matriz_curricular[3], segundo.matriz_curricular[3])
+
+        # Os cursos registrados têm o mesmo conteúdo dos originais, que não são alterados
+        for original, registrado in zip(self.originais, self.cursos):
+            self.assertEqual(descrever(registrado), descrever(original))
+
+        self.assertIsNot(self.originais[1].matriz_curricular[0], segundo.matriz_curricular[0])
+
+        self.assertEqual(self.catalogo.cursos_com(self.originais[0].matriz_curricular[1]), {1, 2})
+        self.assertEqual(self.catalogo.cursos_que_aceitam(self.originais[0].matriz_curricular[:3]), [(1, 3), (2, 2)])
+
+
+    def test_obrigatoriedade_diferente_nao_e_compartilhada(self) -> None:
+        terceiro = self.catalogo.registrar(montarCurso(3, "Algoritmos e Programação I", "Cálculo I", optativa_obrigatoria=True))
+        primeiro = self.cursos[0]
+
+        self.assertIs(terceiro.matriz_curricular[2], primeiro.matriz_curricular[2])
+        self.assertIsNot(terceiro.matriz_curricular[3], primeiro.matriz_curricular[3])
+        self.assertTrue(terceiro.matriz_curricular[3].obrigatoria)
+        self.assertFalse(primeiro.matriz_curricular[3].obrigatoria)
+
+
+    def test_remover_preserva_os_outros_cursos(self) -> None:
+        primeiro, segundo = self.cursos
+        antes = descrever(segundo)
+        self.assertEqual(len(self.catalogo), 5)
+        calculo = primeiro.matriz_curricular[2]
+
+        self.catalogo.remover(1)
+        del primeiro, self.cursos[0]
+        gc.collect()
+
+        self.assertNotIn(1, self.catalogo)
+        self.assertIs(self.catalogo.curso(2), segundo)
+        self.assertEqual(descrever(segundo), antes)
+        self.assertEqual(
+            segundo.optativas_cursaveis(segundo.matriz_curricular[:3]),
+            [segundo.matriz_curricular[3]],
+        )
+
+        # As UCs comuns continuam indexadas para o curso 2; a UC só do curso 1 sai do índice
+        self.assertEqual(self.catalogo.cursos_com(segundo.matriz_curricular[0]), {2})
+        self.assertIsNone(self.catalogo.equivalente(segundo.matriz_curricular[0], 1))
+        self.assertEqual(self.catalogo.cursos_com(calculo), set())
+        self.assertEqual(len(self.catalogo), 4)
+
+        # Um curso registrado depois ainda compartilha as UCs que ficaram com o curso 2
+        terceiro = self.catalogo.registrar(montarCurso(3, "Algoritmos e Programação I", "Cálculo I"))
+        self.assertIs(terceiro.matriz_curricular[1], segundo.matriz_curricular[1])
+        self.assertEqual(descrever(terceiro), descrever(self.originais[0]))
+
+
+    def test_registrar_de_novo_substitui(self) -> None:
+        self.catalogo.registrar(montarCurso(2, "Algoritmos e Programação I", "Química I"))
+
+        self.assertEqual(self.catalogo.cursos_com(self.originais[1].matriz_curricular[2]), set())
+        self.assertEqual(self.catalogo.curso(2).matriz_curricular[2].nome, "Química I")
+        self.assertIs(self.catalogo.curso(2).matriz_curricular[0], self.cursos[0].matriz_curricular[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+# Imports de sistema
+import random
+import unittest
+
+# Imports locais
+from benchmarks.gerador import gerarCurso
+from src.Curso import Curso
+from src.Estudante import Estudante
+from src.GrafoCurso import GrafoCurso
+from src.UnidadeCurricular import UnidadeCurricular
+
+
+class TestGrafoCurso(unittest.TestCase):
+    '''
+    Testes da atualização do grafo de pré-requisitos quando as UCs mudam.
+    '''
+
+    def assertGrafoIgualAoRecalculado(self, curso: "Curso") -> None:
+        grafo, novo = curso.grafo, GrafoCurso(curso.matriz_curricular)
+
+        self.assertEqual(grafo.pre_requisitos, novo.pre_requisitos)
+        self.assertEqual(grafo.mascaras_pre_requisitos, novo.mascaras_pre_requisitos)
+        self.assertEqual(grafo.mascara_optativas, novo.mascara_optativas)
+        self.assertEqual([sorted(d) for d in grafo.dependentes], [sorted(d) for d in novo.dependentes])
+        self.assertEqual(grafo.fechamento, novo.fechamento)
+
+        posicoes = {i: posicao for posicao, i in enumerate(grafo.ordem_topologica)}
+        for i, pre_requisitos in enumerate(grafo.pre_requisitos):
+            self.assertTrue(all(posicoes[p] < posicoes[i] for p in pre_requisitos))
+
+
+    def test_alterar_uc_de_outro_curso_mantem_o_grafo(self) -> None:
+        a, b = gerarCurso(40, codigo=1, semente=1), gerarCurso(40, codigo=2, semente=2)
+        grafo = a.grafo
+        fechamento = list(grafo.fechamento)
+
+        b.matriz_curricular[10].add_pre_requisito(b.matriz_curricular[0])
+        b.matriz_curricular[5].obrigatoria = not b.matriz_curricular[5].obrigatoria
+        UnidadeCurricular("Outra", 68, [], False).pre_requisitos = [a.matriz_curricular[0]]
+
+        self.assertIs(a.grafo, grafo)
+        self.assertEqual(grafo.versao, 0)
+        self.assertEqual(grafo.fechamento, fechamento)
+
+
+    def test_alteracoes_incrementais_iguais_ao_recalculo(self) -> None:
+        curso = gerarCurso(60, codigo=1, semente=3)
+        grafo = curso.grafo
+        grafo.fechamento
+        aleatorio = random.Random(0)
+        matriz = curso.matriz_curricular
+
+        for _ in range(200):
+            i, j = sorted(aleatorio.sample(range(len(matriz)), 2))
+            unidade_curricular = matriz[j]
+            operacao = aleatorio.random()
+
+            if operacao < 0.4 and matriz[i] not in unidade_curricular.pre_requisitos:
+                unidade_curricular.add_pre_requisito(matriz[i])
+            elif operacao < 0.8 and unidade_curricular.pre_requisitos:
+                unidade_curricular.del_pre_requisito(aleatorio.choice(unidade_curricular.pre_requisitos))
+            else:
+                unidade_curricular.obrigatoria = not unidade_curricular.obrigatoria
+
+            self.assertIs(curso.grafo, grafo)
+            self.assertGrafoIgualAoRecalculado(curso)
+
+
+    def test_aresta_contra_a_ordem_refaz_a_ordem(self) -> None:
+        a = UnidadeCurricular("A", 68, [], True)
+        b = UnidadeCurricular("B", 68, [a], True)
+        curso = Curso(1, "Curso", [b, a])
+        self.assertEqual(curso.ordem_topologica(), [a, b])
+
+        b.del_pre_requisito(a)
+        a.add_pre_requisito(b)
+
+        self.assertEqual(curso.ordem_topologica(), [b, a])
+        self.assertEqual(curso.pre_requisitos_transitivos(a), [b])
+        self.assertGrafoIgualAoRecalculado(curso)
+
+
+    def test_mudanca_de_nome_atualiza_a_busca(self) -> None:
+        curso = gerarCurso(10, codigo=1, semente=0)
+        unidade_curricular = curso.matriz_curricular[3]
+        curso.buscar_unidade_curricular("qualquer")
+
+        unidade_curricular.nome = "Nome Novo"
+
+        self.assertIs(curso.buscar_unidade_curricular("nome novo"), unidade_curricular)
+
+
+    def test_estudante_incremental_ve_mudanca_de_pre_requisito(self) -> None:
+        a = UnidadeCurricular("A", 68, [], True)
+        b = UnidadeCurricular("B", 68, [], True)
+        optativa = UnidadeCurricular("Optativa", 68, [], False)
+        curso = Curso(1, "Curso", [a, b, optativa])
+
+        estudante = Estudante("Ana", curso, [a])
+        estudante.ativar_modo_incremental()
+        self.assertEqual(estudante.optativas_cursaveis(), [optativa])
+
+        optativa.add_pre_requisito(b)
+
+        self.assertEqual(estudante.optativas_cursaveis(), [])
+
+
+
+class TestElegibilidade(unittest.TestCase):
+    '''
+    Testes de que os caminhos de elegibilidade (por conjuntos, em lote e incremental) dão o mesmo resultado.
+    '''
+
+    def setUp(self) -> None:
+        self.externa = UnidadeCurricular("UC de outro curso", 68, [], True)
+        self.a = UnidadeCurricular("A", 68, [], True)
+        self.b = UnidadeCurricular("B", 68, [self.a], True)
+        self.optativa_a = UnidadeCurricular("Optativa A", 68, [self.a], False)
+        self.optativa_ab = UnidadeCurricular("Optativa AB", 68, [self.a, self.b], False)
+        self.optativa_externa = UnidadeCurricular("Optativa Externa", 68, [self.a, self.externa], False)
+        self.livre = UnidadeCurricular("Livre", 68, [], False)
+
+        self.curso = Curso(1, "Curso", [self.a, self.b, self.optativa_a, self.optativa_ab, self.optativa_externa, self.livre])
+
+
+    def test_lote(self) -> None:
+        lote = [[], [self.a], [self.a, self.b, self.livre], [self.a, self.externa], [self.optativa_a, self.a]]
+
+        self.assertEqual(self.curso.optativas_cursaveis_lote(lote), [
+            [self.livre],
+            [self.optativa_a, self.livre],
+            [self.optativa_a, self.optativa_ab],
+            [self.optativa_a, self.optativa_externa, self.livre],
+            [self.livre],
+        ])
+
+
+    def test_pre_requisito_externo_igual_nos_dois_caminhos(self) -> None:
+        lote = [[self.a], [self.a, self.externa], [self.externa], [self.a, self.b, self.externa, self.optativa_a]]
+
+        self.assertEqual(
+            self.curso.optativas_cursaveis_lote(lote),
+            [self.curso.optativas_cursaveis(cursadas) for cursadas in lote],
+        )
+        self.assertNotIn(self.optativa_externa, self.curso.optativas_cursaveis_lote([[self.a]])[0])
+
+
+    def test_lote_aleatorio_igual_ao_calculo_por_conjuntos(self) -> None:
+        curso = gerarCurso(80, codigo=1, semente=5)
+        externas = [UnidadeCurricular(f"Externa {i}", 68, [], True) for i in range(3)]
+        optativas = [unidade_curricular for unidade_curricular in curso.matriz_curricular if not unidade_curricular.obrigatoria]
+        for optativa, externa in zip(optativas[::3], externas * 10):
+            optativa.add_pre_requisito(externa)
+
+        aleatorio = random.Random(1)
+        candidatas = curso.matriz_curricular + externas
+        lote = [aleatorio.sample(candidatas, aleatorio.randrange(len(candidatas))) for _ in range(70)]
+
+        self.assertEqual(curso.optativas_cursaveis_lote(lote), [curso.optativas_cursaveis(cursadas) for cursadas in lote])
+
+
+    def test_incremental_aleatorio_igual_ao_recalculo(self) -> None:
+        curso = gerarCurso(60, codigo=1, semente=6)
+        externas = [UnidadeCurricular(f"Externa {i}", 68, [], True) for i in range(2)]
+        optativas = [unidade_curricular for unidade_curricular in curso.matriz_curricular if not unidade_curricular.obrigatoria]
+        for optativa, externa in zip(optativas[::4], externas * 10):
+            optativa.add_pre_requisito(externa)
+
+        candidatas = curso.matriz_curricular + externas
+        aleatorio = random.Random(2)
+        estudante = Estudante("Ana", curso, [])
+        estudante.ativar_modo_incremental()
+
+        for passo in range(400):
+            unidade_curricular = aleatorio.choice(candidatas)
+
+            if unidade_curricular in estudante.unidades_cursadas:
+                estudante.del_unidade_curricular(unidade_curricular)
+            else:
+                estudante.add_unidade_curricular(unidade_curricular)
+
+            # De vez em quando o curso também muda no meio do caminho
+            if passo % 50 == 49:
+                optativa = aleatorio.choice(optativas)
+                if externas[0] in optativa.pre_requisitos:
+                    optativa.del_pre_requisito(externas[0])
+                else:
+                    optativa.add_pre_requisito(externas[0])
+
+            self.assertEqual(estudante.optativas_cursaveis(), curso.optativas_cursaveis(estudante.unidades_cursadas))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# Imports de sistema
+import unittest
+
+# Imports locais
+from src.IndiceNomes import IndiceNomes
+from src.UnidadeCurricular import UnidadeCurricular
+from src.WebScraper import vincularPreRequisitos
+
+
+NOMES = [
+    "Cálculo I",
+    "Cálculo II",
+    "Estágio Obrigatório I",
+    "Estruturas de Dados",
+    "Redes de Computadores",
+    "Algoritmos e Programação I",
+    "Algoritmos e Programação II",
+]
+
+
+class TestIndiceNomes(unittest.TestCase):
+    '''
+    Testes da busca aproximada de nomes de UCs.
+    '''
+
+    def setUp(self) -> None:
+        self.indice = IndiceNomes(NOMES)
+
+
+    def melhor(self, consulta: str) -> str:
+        posicao = self.indice.melhor(consulta)
+        return None if posicao is None else NOMES[posicao]
+
+
+    def test_aceita_abreviacoes_e_numerais_arabicos(self) -> None:
+        self.assertEqual(self.melhor("Alg. e Prog. I"), "Algoritmos e Programação I")
+        self.assertEqual(self.melhor("calculo 2"), "Cálculo II")
+        self.assertEqual(self.melhor("Estruturas de Dado"), "Estruturas de Dados")
+
+
+    def test_rejeita_numeral_diferente(self) -> None:
+        self.assertIsNone(self.melhor("Calculo 3"))
+        self.assertIsNone(self.melhor("Estágio Obrigatório II"))
+
+
+    def test_rejeita_numeral_de_um_lado_so(self) -> None:
+        self.assertIsNone(self.melhor("Estruturas de Dados II"))
+        self.assertIsNone(self.melhor("Redes de Computadores II"))
+        self.assertIsNone(self.melhor("Estágio Obrigatório"))
+
+
+    def test_rejeita_nome_ambiguo(self) -> None:
+        self.assertIsNone(self.melhor("Calculo"))
+
+
+    def test_vinculacao_nao_liga_numeral_errado(self) -> None:
+        matriz = [UnidadeCurricular.de_confianca(nome, 68, (), True) for nome in NOMES]
+        pre_requisitos = [[] for _ in NOMES]
+        pre_requisitos[1] = ["Calculo 1", "Estruturas de Dados II"]
+
+        nao_resolvidos = vincularPreRequisitos(matriz, pre_requisitos)
+
+        self.assertEqual(matriz[1].pre_requisitos, (matriz[0],))
+        self.assertEqual(nao_resolvidos, ["Estruturas de Dados II"])
+
+
+if __name__ == "__main__":
+    unittest.main()
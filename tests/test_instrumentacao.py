@@ -0,0 +1,112 @@
+# Imports de sistema
+import pstats
+import tempfile
+import unittest
+from os import path
+from types import SimpleNamespace
+
+# Imports locais
+from src import Instrumentacao
+from src.Curso import Curso
+from src.UnidadeCurricular import UnidadeCurricular
+
+
+class TestInstrumentacao(unittest.TestCase):
+    '''
+    Testes das medições da instrumentação opcional do carregamento de cursos.
+    '''
+
+    def setUp(self) -> None:
+        self.construtores = {(classe, atributo): classe.__dict__[atributo] for classe, atributo in Instrumentacao.CONSTRUTORES}
+
+
+    def tearDown(self) -> None:
+        Instrumentacao.desativar()
+        Instrumentacao.zerar()
+
+
+    def criarCurso(self) -> "Curso":
+        calculo = UnidadeCurricular("Cálculo I", 68, [], True)
+        topicos = UnidadeCurricular.de_confianca("Tópicos", 51, (calculo,), False)
+        return Curso(1, "Curso", [calculo, topicos])
+
+
+    def test_desligada_por_padrao(self) -> None:
+        self.assertFalse(Instrumentacao.ativa)
+        Instrumentacao.zerar()
+
+        with Instrumentacao.etapa("parsing"):
+            pass
+        Instrumentacao.contar("linhas", 5)
+        Instrumentacao.registrarResposta(SimpleNamespace(status_code=200, content=b"abc", headers={}))
+        self.criarCurso()
+
+        resumo = Instrumentacao.resumo()
+        self.assertEqual((resumo["etapas"], resumo["contadores"], resumo["construcoes"]), ({}, {}, {}))
+
+        # Desligada, os construtores são os originais, sem envolvimento
+        for (classe, atributo), original in self.construtores.items():
+            self.assertIs(classe.__dict__[atributo], original)
+
+
+    def test_registra_etapas_contadores_e_construcoes(self) -> None:
+        Instrumentacao.ativar()
+
+        for _ in range(3):
+            with Instrumentacao.etapa("parsing"):
+                pass
+        with Instrumentacao.etapa("vinculacao"):
+            self.criarCurso()
+
+        Instrumentacao.contar("linhas", 5)
+        Instrumentacao.contar("linhas")
+        Instrumentacao.registrarResposta(SimpleNamespace(status_code=200, content=b"abcd", headers={}))
+        Instrumentacao.registrarResposta(SimpleNamespace(status_code=304, content=b"", headers={"Content-Length": "7"}), stream=True)
+
+        Instrumentacao.desativar()
+        resumo = Instrumentacao.resumo()
+
+        self.assertEqual(resumo["etapas"]["parsing"]["chamadas"], 3)
+        self.assertEqual(resumo["etapas"]["vinculacao"]["chamadas"], 1)
+        self.assertGreaterEqual(resumo["etapas"]["vinculacao"]["total_ms"], 0)
+        self.assertEqual(resumo["etapas"]["construcao.UnidadeCurricular.__init__"]["chamadas"], 1)
+        self.assertEqual(resumo["etapas"]["construcao.UnidadeCurricular.de_confianca"]["chamadas"], 1)
+        self.assertEqual(resumo["construcoes"], {"Curso": 1, "UnidadeCurricular": 2})
+        self.assertEqual(resumo["contadores"], {
+            "http.bytes": 11, "http.requisicoes": 2, "http.status.200": 1, "http.status.304": 1, "linhas": 6,
+        })
+
+        # Depois de desativar() os construtores voltam a ser os originais e nada mais é medido
+        for (classe, atributo), original in self.construtores.items():
+            self.assertIs(classe.__dict__[atributo], original)
+
+        self.criarCurso()
+        Instrumentacao.contar("linhas")
+        self.assertEqual(Instrumentacao.resumo()["construcoes"], resumo["construcoes"])
+        self.assertEqual(Instrumentacao.resumo()["contadores"]["linhas"], 6)
+
+
+    def test_ativar_de_novo_zera_as_medicoes(self) -> None:
+        Instrumentacao.ativar()
+        Instrumentacao.contar("linhas")
+        Instrumentacao.ativar()
+
+        self.assertEqual(Instrumentacao.resumo()["contadores"], {})
+
+        self.criarCurso()
+        self.assertEqual(Instrumentacao.resumo()["construcoes"], {"Curso": 1, "UnidadeCurricular": 2})
+
+
+    def test_perfil(self) -> None:
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = path.join(diretorio, "perfil.prof")
+
+            Instrumentacao.ativar(perfil=caminho)
+            self.criarCurso()
+            Instrumentacao.desativar()
+
+            self.assertTrue(pstats.Stats(caminho).total_calls > 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# Imports de sistema
+import threading
+import unittest
+from unittest import mock
+
+# Imports locais
+from src.LimitadorTaxa import LimitadorTaxa
+
+
+class RelogioFalso:
+    '''
+    Substituto do módulo time: monotonic() devolve o horário falso e sleep() o avança (se avancar=True), guardando as
+    esperas pedidas.
+    '''
+
+    def __init__(self, avancar: bool = True) -> None:
+        self.agora    = 100.0
+        self.avancar  = avancar
+        self.esperas  = []
+        self._lock    = threading.Lock()
+
+    def monotonic(self) -> float:
+        return self.agora
+
+    def sleep(self, segundos: float) -> None:
+        with self._lock:
+            self.esperas.append(segundos)
+            if self.avancar:
+                self.agora += segundos
+
+
+class TestLimitadorTaxa(unittest.TestCase):
+    '''
+    Testes do limite de requisições por host, com um relógio falso.
+    '''
+
+    def limitador(self, relogio: "RelogioFalso", requisicoes_por_segundo: float) -> "LimitadorTaxa":
+        self.addCleanup(mock.patch.stopall)
+        mock.patch("src.LimitadorTaxa.time", relogio).start()
+        return LimitadorTaxa(requisicoes_por_segundo)
+
+
+    def test_requisicoes_seguidas_sao_espacadas(self) -> None:
+        relogio = RelogioFalso()
+        limitador = self.limitador(relogio, 4)
+
+        for _ in range(5):
+            limitador.aguardar("ensino.ufms.br")
+
+        # A primeira passa direto, e as outras esperam o intervalo de 0,25s
+        self.assertEqual(relogio.esperas, [0.25] * 4)
+        self.assertAlmostEqual(relogio.agora, 101.0)
+
+
+    def test_hosts_sao_independentes(self) -> None:
+        relogio = RelogioFalso()
+        limitador = self.limitador(relogio, 1)
+
+        limitador.aguardar("a.ufms.br")
+        limitador.aguardar("b.ufms.br")
+        self.assertEqual(relogio.esperas, [])
+
+        limitador.aguardar("a.ufms.br")
+        self.assertEqual(relogio.esperas, [1.0])
+
+
+    def test_sem_espera_depois_de_um_tempo_parado(self) -> None:
+        relogio = RelogioFalso()
+        limitador = self.limitador(relogio, 2)
+
+        limitador.aguardar("ensino.ufms.br")
+        relogio.agora += 10
+        limitador.aguardar("ensino.ufms.br")
+
+        self.assertEqual(relogio.esperas, [])
+
+
+    def test_threads_simultaneas_recebem_horarios_distintos(self) -> None:
+        # Com o relógio parado, cada thread reserva o próximo horário livre e espera até ele
+        relogio = RelogioFalso(avancar=False)
+        limitador = self.limitador(relogio, 10)
+
+        threads = [threading.Thread(target=limitador.aguardar, args=("ensino.ufms.br",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(round(espera, 6) for espera in relogio.esperas), [round(0.1 * i, 6) for i in range(1, 8)])
+
+
+    def test_taxa_invalida(self) -> None:
+        for taxa in (0, -1):
+            with self.subTest(taxa=taxa):
+                with self.assertRaises(ValueError):
+                    LimitadorTaxa(taxa)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+# Imports de sistema
+import argparse
+import csv
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from os import path
+
+# Imports locais
+import main
+from benchmarks.gerador import gerarCurso
+from benchmarks.site_local import SiteLocal
+from src import WebScraper
+from src.CacheCursos import CacheCursos
+from src.Snapshot import Snapshot
+from tests.test_web_scraper import paginaMatriz
+
+
+class TestCheck(unittest.TestCase):
+    '''
+    Testes do comando "check", que verifica vários arquivos de unidades cursadas de uma vez.
+    '''
+
+    def setUp(self) -> None:
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.curso = gerarCurso(30, codigo=1, semente=0)
+        Snapshot.escrever([self.curso], self.caminho("catalogo.snapshot"))
+
+        main.cursos.clear()
+        main.cache, main.snapshot = None, None
+
+
+    def tearDown(self) -> None:
+        main.cursos.clear()
+        if main.cache is not None:
+            main.cache.fechar()
+        main.cache, main.snapshot = None, None
+
+        WebScraper.configurarSessao(url_base="https://ensino.ufms.br")
+        self.diretorio.cleanup()
+
+
+    def caminho(self, nome: str) -> str:
+        return path.join(self.diretorio.name, nome)
+
+
+    def escrever(self, nome: str, dados: bytes) -> str:
+        caminho = self.caminho(nome)
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(dados)
+        return caminho
+
+
+    def executarCheck(self, cursadas: list[str], curso: int, formato: str = "jsonl") -> tuple[int, str, str]:
+        args = argparse.Namespace(
+            cursadas=cursadas, curso=curso, format=formato, cache=self.caminho("cache.db"), snapshot=self.caminho("catalogo.snapshot"),
+        )
+        saida, erros = io.StringIO(), io.StringIO()
+
+        with redirect_stdout(saida), redirect_stderr(erros):
+            codigo = main.check(args)
+
+        return codigo, saida.getvalue(), erros.getvalue()
+
+
+    def executarCheckJson(self, cursadas: list[str], curso: int) -> tuple[int, list[dict]]:
+        codigo, saida, _ = self.executarCheck(cursadas, curso)
+        return codigo, [json.loads(linha) for linha in saida.splitlines()]
+
+
+    def test_erro_em_um_arquivo_nao_interrompe_os_outros(self) -> None:
+        nome = self.curso.matriz_curricular[0].nome
+        valido = self.escrever("valido.csv", f"{nome}\n".encode("utf-8"))
+        latin1 = self.escrever("latin1.csv", "Cálculo I\n".encode("latin-1"))
+        inexistente = self.caminho("inexistente.csv")
+
+        codigo, resultados = self.executarCheckJson([inexistente, latin1, valido], 1)
+
+        self.assertEqual(codigo, 1)
+        self.assertEqual([resultado["arquivo"] for resultado in resultados], [inexistente, latin1, valido])
+        self.assertIn("Não foi possível abrir o arquivo", resultados[0]["erro"])
+        self.assertIn("Não foi possível ler o arquivo", resultados[1]["erro"])
+        self.assertNotIn("erro", resultados[2])
+
+
+    def test_falha_de_rede_mostra_a_mensagem_do_erro(self) -> None:
+        WebScraper.configurarSessao(url_base="http://127.0.0.1:9", tentativas=0, timeout=(1, 1))
+        cursadas = self.escrever("cursadas.csv", b"Qualquer\n")
+
+        codigo, resultados = self.executarCheckJson([cursadas, cursadas], 999)
+
+        self.assertEqual(codigo, 1)
+        self.assertEqual(len(resultados), 2)
+        self.assertIn("Não foi possível obter o curso", resultados[0]["erro"])
+        self.assertNotIn("None", resultados[0]["erro"])
+
+
+
+    def test_csv_avisa_nomes_e_lista_estudante_sem_optativas(self) -> None:
+        optativas = [uc for uc in self.curso.matriz_curricular if not uc.obrigatoria]
+        todas = self.escrever("todas.csv", "".join(f"{uc.nome}\n" for uc in optativas).encode("utf-8"))
+        com_erro = self.escrever("com_erro.csv", f"{self.curso.matriz_curricular[0].nome.replace('Curricular', 'Curriclar')}\nNome Inexistente Qualquer\n".encode("utf-8"))
+
+        codigo, saida, erros = self.executarCheck([todas, com_erro], 1, "csv")
+        linhas = list(csv.reader(io.StringIO(saida)))
+
+        self.assertEqual(codigo, 0)
+        self.assertEqual(linhas[0], ["arquivo", "estudante", "curso", "optativa", "carga_horaria"])
+        # Quem já cursou todas as optativas não tem nenhuma cursável, mas ainda aparece na saída
+        self.assertIn([todas, "todas", "1", "", ""], linhas)
+        self.assertTrue(any(linha[0] == com_erro for linha in linhas[1:]))
+        self.assertIn("Nome Inexistente Qualquer", erros)
+        self.assertIn(f"lido como '{self.curso.matriz_curricular[0].nome}'", erros)
+
+
+class TestVerificarArquivo(unittest.TestCase):
+    '''
+    Testes da leitura de arquivos de unidades cursadas, com o curso vindo de um substituto local do site.
+    '''
+
+    def setUp(self) -> None:
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.site = SiteLocal([1], n_unidades=5).iniciar()
+        self.site.alterar(1, paginaMatriz().encode("utf-8"))
+        WebScraper.configurarSessao(url_base=self.site.url, tentativas=0)
+
+        main.cursos.clear()
+        main.cache, main.snapshot = CacheCursos(path.join(self.diretorio.name, "cache.db")), None
+
+
+    def tearDown(self) -> None:
+        main.cursos.clear()
+        main.cache.fechar()
+        main.cache = None
+
+        WebScraper.configurarSessao(url_base="https://ensino.ufms.br")
+        self.site.parar()
+        self.diretorio.cleanup()
+
+
+    def test_nomes_aproximados_contam_como_cursados(self) -> None:
+        caminho = path.join(self.diretorio.name, "ana.csv")
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write("Calculo 1\nCálculo I\ncalculo 2\nEstruturas de Dados II\n")
+
+        resultado = main.verificarArquivo(caminho, 1)
+
+        self.assertEqual(resultado["estudante"], "ana")
+        self.assertEqual(resultado["nao_encontradas"], ["Estruturas de Dados II"])
+        self.assertEqual(resultado["aproximadas"], [
+            {"informado": "Calculo 1", "nome": "Cálculo I"},
+            {"informado": "calculo 2", "nome": "Cálculo II"},
+        ])
+        # Tópicos em Computação só depende de Cálculo II, informado de forma aproximada
+        self.assertEqual(resultado["optativas"], [{"nome": "Tópicos em Computação", "carga_horaria": 51}])
+
+
+if __name__ == "__main__":
+    unittest.main()
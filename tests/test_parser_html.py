@@ -0,0 +1,117 @@
+# Imports de sistema
+import unittest
+from importlib.util import find_spec
+from os import path
+
+# Imports locais
+from src import ParserHTML, WebScraper
+
+FIXTURE = path.join(path.dirname(__file__), "..", "benchmarks", "fixtures", "prerequisito_sintetico.html")
+
+
+PAGINAS = {
+    "utf-8": (
+        '<html><head><meta charset="utf-8"></head><body><table><tbody>'
+        '<tr><td>Cálculo <b>I</b><!-- comentário --><br>Álgebra <a href="#">Linear</a></td><td>68h</td></tr>'
+        '</tbody></table></body></html>'
+    ).encode("utf-8"),
+    "latin-1": (
+        '<html><head><meta http-equiv="Content-Type" content="text/html; charset=ISO-8859-1"></head><body><table>'
+        '<tbody><tr><td>Cálculo <b>I</b><br/>Álgebra Linear</td><td>68h</td></tr></tbody></table></body></html>'
+    ).encode("latin-1"),
+    "sem declaração": (
+        '<table><tbody><tr><td>Cálculo I<br>Álgebra Linear</td><td>68h</td></tr></tbody></table>'
+    ).encode("utf-8"),
+    # Nomes quebrados em várias linhas no código da página, sem <br>
+    "várias linhas": (
+        '<table><tbody><tr><td>\n      Cálculo\n      I\n    <br>\n  Álgebra\t <b>Linear</b></td><td>68h</td></tr></tbody></table>'
+    ).encode("utf-8"),
+}
+
+ESPERADO = {
+    "utf-8": [["Cálculo I\nÁlgebra Linear", "68h"]],
+    "latin-1": [["Cálculo I\nÁlgebra Linear", "68h"]],
+    "sem declaração": [["Cálculo I\nÁlgebra Linear", "68h"]],
+    "várias linhas": [["Cálculo I\nÁlgebra Linear", "68h"]],
+}
+
+
+class TestParserHTML(unittest.TestCase):
+    '''
+    Testes de que todos os backends e a leitura incremental extraem os mesmos textos.
+    '''
+
+    def setUp(self) -> None:
+        self.parser_original = ParserHTML.PARSER
+
+
+    def tearDown(self) -> None:
+        ParserHTML.configurarParser(self.parser_original)
+
+
+    def verificarBackend(self, parser: str) -> None:
+        ParserHTML.configurarParser(parser)
+
+        for nome, html in PAGINAS.items():
+            with self.subTest(parser=parser, pagina=nome):
+                self.assertEqual(ParserHTML.extrairLinhas(html), ESPERADO[nome])
+
+                # Pedaços de 1 byte cortam os caracteres de vários bytes ao meio
+                for tamanho in (1, 7, 4096):
+                    pedacos = [html[i:i + tamanho] for i in range(0, len(html), tamanho)]
+                    self.assertEqual(list(ParserHTML.iterarLinhas(pedacos)), ESPERADO[nome])
+
+
+    def verificarFixture(self, parser: str) -> None:
+        '''
+        Compara a leitura incremental com a leitura da página inteira na página de matriz salva em benchmarks/fixtures,
+        tanto nas linhas quanto nas UCs montadas pelo scraper.
+        '''
+        ParserHTML.configurarParser(parser)
+
+        with open(FIXTURE, "rb") as arquivo:
+            html = arquivo.read()
+
+        linhas = ParserHTML.extrairLinhas(html)
+        nao_resolvidos = []
+        matriz = [
+            (unidade.nome, unidade.carga_horaria, unidade.obrigatoria, [pre.nome for pre in unidade.pre_requisitos])
+            for unidade in WebScraper.scrapeMatrizCurricular(0, html, nao_resolvidos)
+        ]
+        self.assertTrue(linhas)
+
+        for tamanho in (1000, 16 * 1024):
+            with self.subTest(parser=parser, tamanho=tamanho):
+                pedacos = [html[i:i + tamanho] for i in range(0, len(html), tamanho)]
+                self.assertEqual(list(ParserHTML.iterarLinhas(pedacos)), linhas)
+
+                nao_resolvidos_incremental = []
+                incremental = list(WebScraper.iterarMatrizCurricular(0, iter(pedacos), nao_resolvidos_incremental))
+                self.assertEqual(
+                    [(unidade.nome, unidade.carga_horaria, unidade.obrigatoria, [pre.nome for pre in unidade.pre_requisitos]) for unidade in incremental],
+                    matriz,
+                )
+                self.assertEqual(nao_resolvidos_incremental, nao_resolvidos)
+
+
+    def test_html_parser(self) -> None:
+        self.verificarBackend("html.parser")
+        self.verificarFixture("html.parser")
+
+
+    @unittest.skipIf(find_spec("lxml") is None, "lxml não está instalado")
+    def test_lxml(self) -> None:
+        self.verificarBackend("lxml")
+        self.verificarFixture("lxml")
+
+
+    def test_codificacao_declarada(self) -> None:
+        self.assertEqual(ParserHTML.codificacaoDeclarada(PAGINAS["utf-8"]), "utf-8")
+        self.assertEqual(ParserHTML.codificacaoDeclarada(PAGINAS["latin-1"]), "iso8859-1")
+        self.assertEqual(ParserHTML.codificacaoDeclarada(PAGINAS["sem declaração"]), "utf-8")
+        self.assertEqual(ParserHTML.codificacaoDeclarada(b'<meta charset="desconhecida">'), "utf-8")
+        self.assertEqual(ParserHTML.codificacaoDeclarada(b"<p>" + b" " * 2000 + b'<meta charset="latin-1">'), "utf-8")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+# Imports de sistema
+import json
+import struct
+import tempfile
+import unittest
+from os import path
+
+# Imports locais
+from benchmarks.gerador import gerarCurso
+from src import Perfil
+from src.Estudante import Estudante
+from src.EstudanteException import EstudanteException
+
+
+class TestPerfil(unittest.TestCase):
+    '''
+    Testes da leitura de arquivos de perfil, principalmente dos malformados.
+    '''
+
+    def setUp(self) -> None:
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.curso = gerarCurso(20, codigo=7, semente=0)
+        self.estudante = Estudante("Ana", self.curso, self.curso.matriz_curricular[:3])
+
+
+    def tearDown(self) -> None:
+        self.diretorio.cleanup()
+
+
+    def caminho(self, nome: str) -> str:
+        return path.join(self.diretorio.name, nome)
+
+
+    def escrever(self, nome: str, dados: bytes) -> str:
+        caminho = self.caminho(nome)
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(dados)
+        return caminho
+
+
+    def assertPerfilInvalido(self, caminho: str) -> None:
+        with self.assertRaises(EstudanteException) as contexto:
+            Perfil.carregarPerfil(caminho, lambda codigo: self.curso)
+        self.assertEqual(contexto.exception.valor, "PerfilInvalido")
+
+
+    def test_ida_e_volta(self) -> None:
+        for extensao in (Perfil.EXTENSAO_JSON, Perfil.EXTENSAO_BINARIA):
+            caminho = self.caminho("ana" + extensao)
+            Perfil.salvarPerfil(self.estudante, caminho)
+
+            estudante = Perfil.carregarPerfil(caminho, lambda codigo: self.curso)
+            self.assertEqual(estudante.nome, "Ana")
+            self.assertEqual(estudante.unidades_cursadas, self.curso.matriz_curricular[:3])
+
+
+    def test_indices_binarios_sao_little_endian(self) -> None:
+        caminho = self.caminho("ana.perfil")
+        Perfil.salvarPerfil(self.estudante, caminho)
+
+        with open(caminho, "rb") as arquivo:
+            dados = arquivo.read()
+
+        self.assertEqual(dados[-6:], struct.pack("<3H", 0, 1, 2))
+
+
+    def test_binario_malformado(self) -> None:
+        caminho = self.caminho("ana.perfil")
+        Perfil.salvarPerfil(self.estudante, caminho)
+        with open(caminho, "rb") as arquivo:
+            dados = arquivo.read()
+
+        tamanho_cabecalho = struct.calcsize("<4sI8sHH")
+        nome_invalido = dados[:tamanho_cabecalho] + b"\xff\xfe\xfd" + dados[tamanho_cabecalho + 3:]
+
+        for i, conteudo in enumerate((dados[:10], dados[:-1], dados + b"\x00\x00", b"XXXX" + dados[4:], nome_invalido)):
+            self.assertPerfilInvalido(self.escrever(f"{i}.perfil", conteudo))
+
+
+    def test_indice_fora_da_matriz(self) -> None:
+        assinatura = self.curso.grafo.assinatura
+        cabecalho = struct.pack("<4sI8sHH", b"VMO1", 7, bytes.fromhex(assinatura), 3, 1)
+
+        self.assertPerfilInvalido(self.escrever("binario.perfil", cabecalho + b"Ana" + struct.pack("<H", 500)))
+
+        for i, indice in enumerate((20, -1)):
+            perfil = {"nome": "Ana", "curso": 7, "assinatura": assinatura, "cursadas": [indice]}
+            self.assertPerfilInvalido(self.escrever(f"{i}.json", json.dumps(perfil).encode()))
+
+
+    def test_json_malformado(self) -> None:
+        conteudos = (
+            b"{",
+            b"[1, 2, 3]",
+            b"\xff\xfe{}",
+            b'{"nome": "Ana"}',
+            b'{"nome": "Ana", "curso": "7", "assinatura": "00", "cursadas": []}',
+            b'{"nome": "Ana", "curso": 7, "assinatura": "00", "cursadas": [1.5]}',
+            b'{"nome": "Ana", "curso": 7, "assinatura": "00", "cursadas": {"0": 1}}',
+        )
+
+        for i, conteudo in enumerate(conteudos):
+            self.assertPerfilInvalido(self.escrever(f"{i}.json", conteudo))
+
+
+if __name__ == "__main__":
+    unittest.main()
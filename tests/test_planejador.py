@@ -0,0 +1,100 @@
+# Imports de sistema
+import unittest
+
+# Imports locais
+from benchmarks.gerador import gerarCurso
+from src.Curso import Curso
+from src.Estudante import Estudante
+from src.EstudanteException import EstudanteException
+from src.Planejador import planejarSemestres
+from src.UnidadeCurricular import UnidadeCurricular
+
+
+class TestPlanejador(unittest.TestCase):
+    '''
+    Testes do planejador de semestres.
+    '''
+
+    def setUp(self) -> None:
+        self.curso = gerarCurso(80, codigo=1, semente=4)
+        self.estudante = Estudante("Ana", self.curso, self.curso.matriz_curricular[:5])
+
+
+    def assertPlanoValido(self, estudante: "Estudante", semestres: list, carga_maxima: int) -> None:
+        cursadas = set(estudante.unidades_cursadas)
+        vistas = set(cursadas)
+
+        for semestre in semestres:
+            self.assertLessEqual(sum(unidade_curricular.carga_horaria for unidade_curricular in semestre), carga_maxima)
+
+            for unidade_curricular in semestre:
+                self.assertNotIn(unidade_curricular, vistas)
+                # Todos os pré-requisitos foram cursados antes ou em semestres anteriores do plano
+                self.assertTrue(set(unidade_curricular.pre_requisitos) <= vistas)
+
+            vistas.update(semestre)
+
+
+    def test_plano_respeita_pre_requisitos_e_carga(self) -> None:
+        for carga_maxima in (136, 340, 1000):
+            with self.subTest(carga_maxima=carga_maxima):
+                semestres = planejarSemestres(self.estudante, carga_maxima)
+                self.assertPlanoValido(self.estudante, semestres, carga_maxima)
+
+
+    def test_plano_cobre_as_obrigatorias(self) -> None:
+        semestres = planejarSemestres(self.estudante, 340)
+        planejadas = {unidade_curricular for semestre in semestres for unidade_curricular in semestre}
+
+        faltantes = {
+            unidade_curricular for unidade_curricular in self.curso.matriz_curricular
+            if unidade_curricular.obrigatoria and unidade_curricular not in self.estudante.unidades_cursadas
+        }
+        self.assertTrue(faltantes <= planejadas)
+
+
+    def test_plano_inclui_optativas_suficientes(self) -> None:
+        semestres = planejarSemestres(self.estudante, 340, horas_optativas=200)
+        horas = sum(uc.carga_horaria for semestre in semestres for uc in semestre if not uc.obrigatoria)
+
+        self.assertGreaterEqual(horas, 200)
+        self.assertPlanoValido(self.estudante, semestres, 340)
+
+
+    def test_cadeia_de_pre_requisitos_ocupa_um_semestre_por_uc(self) -> None:
+        a = UnidadeCurricular("A", 68, [], True)
+        b = UnidadeCurricular("B", 68, [a], True)
+        c = UnidadeCurricular("C", 68, [b], True)
+        d = UnidadeCurricular("D", 68, [], True)
+        estudante = Estudante("Ana", Curso(1, "Curso", [c, b, a, d]), [])
+
+        semestres = planejarSemestres(estudante, 136)
+
+        self.assertEqual(len(semestres), 3)
+        self.assertEqual(semestres[0][0], a)
+        self.assertEqual([semestre[0] for semestre in semestres[1:]], [b, c])
+
+
+    def test_optativas_insuficientes(self) -> None:
+        total = sum(uc.carga_horaria for uc in self.curso.matriz_curricular if not uc.obrigatoria)
+
+        with self.assertRaises(EstudanteException) as contexto:
+            planejarSemestres(self.estudante, 340, horas_optativas=total + 1)
+        self.assertEqual(contexto.exception.valor, "OptativasInsuficientes")
+
+
+    def test_carga_maxima_invalida(self) -> None:
+        for carga_maxima in (0, -68):
+            with self.subTest(carga_maxima=carga_maxima), self.assertRaises(EstudanteException) as contexto:
+                planejarSemestres(self.estudante, carga_maxima)
+            self.assertEqual(contexto.exception.valor, "CargaMaximaInvalida")
+
+
+    def test_carga_maxima_menor_que_uma_uc(self) -> None:
+        with self.assertRaises(EstudanteException) as contexto:
+            planejarSemestres(self.estudante, 10)
+        self.assertEqual(contexto.exception.valor, "CargaMaximaInsuficiente")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# Imports de sistema
+import tempfile
+import unittest
+from os import path
+
+# Imports locais
+from benchmarks.gerador import gerarCurso, renderizarPaginaMatriz
+from benchmarks.site_local import SiteLocal
+from src import Rastreador, WebScraper
+from src.CacheCursos import CacheCursos
+
+
+class TestRastreador(unittest.TestCase):
+    '''
+    Testes da atualização do catálogo contra um substituto local do site da UFMS (benchmarks/site_local.py).
+    '''
+
+    def iniciar(self, etag: bool) -> None:
+        self.site = SiteLocal([1, 2], n_unidades=20, etag=etag).iniciar()
+        WebScraper.configurarSessao(url_base=self.site.url, tentativas=0)
+
+
+    def setUp(self) -> None:
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.cache = CacheCursos(path.join(self.diretorio.name, "cache.db"))
+        self.site = None
+
+
+    def tearDown(self) -> None:
+        self.cache.fechar()
+        WebScraper.configurarSessao(url_base="https://ensino.ufms.br")
+        if self.site is not None:
+            self.site.parar()
+        self.diretorio.cleanup()
+
+
+    def atualizar(self) -> tuple[dict[str, int], int]:
+        '''
+        Atualiza os cursos 1, 2 e 99 (inexistente) e retorna o resumo e o número de requisições feitas ao site.
+        '''
+        antes = self.site.requisicoes
+        resumo = Rastreador.atualizarCatalogo(self.cache, [1, 2, 99], max_concurrency=2)
+        return {situacao: n for situacao, n in resumo.items() if n}, self.site.requisicoes - antes
+
+
+    def test_listagem(self) -> None:
+        self.iniciar(etag=True)
+
+        self.assertEqual(Rastreador.listarCodigos(), [1, 2])
+
+
+    def test_matriz_sem_mudanca_responde_304(self) -> None:
+        self.iniciar(etag=True)
+        self.assertEqual(self.atualizar()[0], {"novo": 2, "inexistente": 1})
+
+        bytes_antes = self.site.bytes
+        resumo, requisicoes = self.atualizar()
+
+        self.assertEqual(resumo, {"inalterado": 2, "inexistente": 1})
+        # Uma requisição condicional por curso existente; o inexistente ainda é verificado pela página do curso
+        self.assertEqual(requisicoes, 2 + 2)
+        # As respostas 304 (e as 404 do inexistente) vêm sem corpo
+        self.assertEqual(self.site.bytes, bytes_antes)
+
+
+    def test_matriz_com_mesmo_hash_nao_e_processada(self) -> None:
+        self.iniciar(etag=False)
+        self.atualizar()
+
+        resumo, requisicoes = self.atualizar()
+
+        self.assertEqual(resumo, {"inalterado": 2, "inexistente": 1})
+        # Sem ETag a matriz vem inteira, mas o hash igual evita baixar a página do curso e processá-la
+        self.assertEqual(requisicoes, 2 + 2)
+
+
+    def test_matriz_alterada_e_processada_de_novo(self) -> None:
+        for etag in (True, False):
+            with self.subTest(etag=etag):
+                self.iniciar(etag)
+                self.atualizar()
+
+                nova = gerarCurso(12, codigo=1, semente=99)
+                self.site.alterar(1, renderizarPaginaMatriz(nova).encode("utf-8"))
+                resumo, _ = self.atualizar()
+
+                self.assertEqual(resumo, {"alterado": 1, "inalterado": 1, "inexistente": 1})
+                self.assertEqual(
+                    [unidade.nome for unidade in self.cache.obter(1).matriz_curricular],
+                    [unidade.nome for unidade in nova.matriz_curricular],
+                )
+
+                self.site.parar()
+                self.cache.fechar()
+                self.cache = CacheCursos(path.join(self.diretorio.name, f"cache-{etag}.db"))
+                self.site = None
+
+
+if __name__ == "__main__":
+    unittest.main()
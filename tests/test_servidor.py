@@ -0,0 +1,97 @@
+# Imports de sistema
+import asyncio
+import json
+import unittest
+
+# Imports de bibliotecas externas
+import requests
+
+# Imports locais
+from benchmarks.gerador import gerarCurso
+from src.BuscaCoalescidaAsync import BuscaCoalescidaAsync
+from src.CursoException import CursoException
+from src.Servidor import ServidorElegibilidade
+
+
+class TestServidor(unittest.TestCase):
+    '''
+    Testes das respostas de erro do servidor de elegibilidade.
+    '''
+
+    def consultar(self, buscar, requisicao: bytes = b"GET /cursos/1 HTTP/1.1\r\nConnection: close\r\n\r\n") -> tuple[int, dict]:
+        async def executar() -> tuple[int, dict]:
+            servidor = ServidorElegibilidade()
+            servidor._busca = BuscaCoalescidaAsync(buscar=buscar, ao_concluir=servidor._guardar)
+
+            async with await servidor.iniciar(porta=0) as tcp:
+                leitor, escritor = await asyncio.open_connection(*tcp.sockets[0].getsockname()[:2])
+                escritor.write(requisicao)
+                resposta = await leitor.read()
+                escritor.close()
+
+            cabecalho, _, corpo = resposta.partition(b"\r\n\r\n")
+            return int(cabecalho.split()[1]), json.loads(corpo)
+
+        return asyncio.run(executar())
+
+
+    def test_erro_de_rede_responde_502(self) -> None:
+        def buscar(codigo, cache):
+            raise requests.ConnectionError("conexão recusada")
+
+        with self.assertLogs("src.Servidor", "WARNING"):
+            status, resposta = self.consultar(buscar)
+
+        self.assertEqual(status, 502)
+        self.assertIn("erro", resposta)
+
+
+    def test_erro_inesperado_responde_500(self) -> None:
+        def buscar(codigo, cache):
+            raise RuntimeError("falha")
+
+        with self.assertLogs("src.Servidor", "ERROR"):
+            status, resposta = self.consultar(buscar)
+
+        self.assertEqual(status, 500)
+        self.assertEqual(resposta, {"erro": "Erro interno do servidor."})
+
+
+    def test_erros_de_curso(self) -> None:
+        for valor, esperado in (("CursoDoesNotExist", 404), ("MatrizCurricularNotFound", 422)):
+            with self.subTest(valor=valor):
+                def buscar(codigo, cache):
+                    raise CursoException(valor, "Erro do curso.")
+
+                status, resposta = self.consultar(buscar)
+
+                self.assertEqual(status, esperado)
+                self.assertEqual(resposta, {"erro": "Erro do curso."})
+
+
+    def test_lote_isola_erros_por_curso(self) -> None:
+        def buscar(codigo, cache):
+            if codigo == 2:
+                raise requests.ConnectionError("conexão recusada")
+            if codigo == 3:
+                raise CursoException("MatrizCurricularNotFound", "Sem matriz.")
+            if codigo == 4:
+                raise CursoException("CursoDoesNotExist", "Não existe.")
+            return gerarCurso(10, codigo=codigo, semente=codigo)
+
+        corpo = json.dumps({"estudantes": [{"curso": codigo, "cursadas": []} for codigo in (1, 2, 3, 4)]}).encode()
+        requisicao = b"POST /elegibilidade/lote HTTP/1.1\r\nConnection: close\r\nContent-Length: %d\r\n\r\n%s" % (len(corpo), corpo)
+
+        with self.assertLogs("src.Servidor", "WARNING"):
+            status, resposta = self.consultar(buscar, requisicao)
+
+        self.assertEqual(status, 200)
+        bom, rede, matriz, inexistente = resposta["resultados"]
+        self.assertIn("optativas", bom)
+        self.assertEqual(rede["status"], 502)
+        self.assertEqual(matriz, {"erro": "Sem matriz.", "status": 422})
+        self.assertEqual(inexistente, {"erro": "Não existe.", "status": 404})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Imports de sistema
+import struct
+import tempfile
+import unittest
+from os import path
+
+# Imports locais
+from benchmarks.gerador import gerarCurso
+from src.CursoException import CursoException
+from src.Snapshot import Snapshot
+
+
+def descrever(curso: "Curso") -> tuple:
+    '''
+    Função que resume um curso em tuplas comparáveis: nome e, para cada UC, nome, carga, obrigatoriedade e os nomes
+    dos pré-requisitos.
+    '''
+    return curso.id, curso.nome, [
+        (
+            unidade.nome, unidade.carga_horaria, unidade.obrigatoria,
+            [pre_requisito.nome for pre_requisito in unidade.pre_requisitos],
+        )
+        for unidade in curso.matriz_curricular
+    ]
+
+
+class TestSnapshot(unittest.TestCase):
+    '''
+    Testes da gravação e leitura do snapshot do catálogo.
+    '''
+
+    def setUp(self) -> None:
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = path.join(self.diretorio.name, "catalogo.snapshot")
+        self.cursos = [gerarCurso(n, codigo=codigo, semente=codigo) for codigo, n in ((7, 40), (3, 1), (12, 25))]
+
+        self.tamanho = Snapshot.escrever(self.cursos, self.caminho)
+
+        with open(self.caminho, "rb") as arquivo:
+            self.dados = arquivo.read()
+
+
+    def tearDown(self) -> None:
+        self.diretorio.cleanup()
+
+
+    def gravar(self, dados: bytes) -> None:
+        with open(self.caminho, "wb") as arquivo:
+            arquivo.write(dados)
+
+
+    def test_ida_e_volta(self) -> None:
+        self.assertEqual(self.tamanho, len(self.dados))
+
+        with Snapshot(self.caminho) as snapshot:
+            self.assertEqual(len(snapshot), 3)
+            self.assertEqual(snapshot.codigos(), [3, 7, 12])
+            self.assertNotIn(5, snapshot)
+
+            for curso in self.cursos:
+                self.assertIn(curso.id, snapshot)
+                self.assertEqual(descrever(snapshot.curso(curso.id)), descrever(curso))
+                self.assertIs(snapshot.curso(curso.id), snapshot.curso(curso.id))
+
+            with self.assertRaises(CursoException) as contexto:
+                snapshot.curso(5)
+            self.assertEqual(contexto.exception.valor, "CursoDoesNotExist")
+
+
+    def test_arquivo_truncado(self) -> None:
+        for tamanho in (0, 10, Snapshot.CABECALHO.size, len(self.dados) // 2, len(self.dados) - 1):
+            with self.subTest(tamanho=tamanho):
+                self.gravar(self.dados[:tamanho])
+
+                with self.assertRaises(CursoException) as contexto:
+                    Snapshot(self.caminho)
+                self.assertEqual(contexto.exception.valor, "SnapshotInvalido")
+
+
+    def test_arquivo_corrompido(self) -> None:
+        n_cursos, n_unidades = struct.unpack_from("<II", self.dados, 4)
+        ultimo = Snapshot.CABECALHO.size - 8
+
+        corrompidos = {
+            "mágico": b"XXXX" + self.dados[4:],
+            "número de UCs": self.dados[:8] + struct.pack("<I", n_unidades + 5) + self.dados[12:],
+            "número de cursos": self.dados[:4] + struct.pack("<I", n_cursos + 1000) + self.dados[8:],
+            "deslocamento final": self.dados[:ultimo] + struct.pack("<Q", len(self.dados) + 8) + self.dados[ultimo + 8:],
+            "bytes a mais": self.dados + b"\0" * 8,
+        }
+
+        for descricao, dados in corrompidos.items():
+            with self.subTest(descricao):
+                self.gravar(dados)
+
+                with self.assertRaises(CursoException) as contexto:
+                    Snapshot(self.caminho)
+                self.assertEqual(contexto.exception.valor, "SnapshotInvalido")
+
+
+if __name__ == "__main__":
+    unittest.main()
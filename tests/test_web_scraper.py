@@ -0,0 +1,137 @@
+# Imports de sistema
+import tempfile
+import unittest
+from importlib.util import find_spec
+from os import path
+
+# Imports locais
+from benchmarks.gerador import renderizarPaginaMatriz
+from benchmarks.site_local import SiteLocal
+from src import ParserHTML, WebScraper
+from src.CacheCursos import CacheCursos
+from src.Curso import Curso
+from src.CursoException import CursoException
+from src.UnidadeCurricular import UnidadeCurricular
+
+
+def paginaMatriz() -> str:
+    '''
+    Função que gera a página da matriz de um curso pequeno, com os pré-requisitos escritos como no site real: com
+    abreviações e numerais arábicos, e um nome que não existe na matriz.
+    '''
+    calculo_1 = UnidadeCurricular("Cálculo I", 68, [], True)
+    calculo_2 = UnidadeCurricular("Cálculo II", 68, [calculo_1], True)
+    estruturas = UnidadeCurricular("Estruturas de Dados", 68, [], True)
+    topicos = UnidadeCurricular("Tópicos em Computação", 51, [calculo_2, estruturas], False)
+
+    html = renderizarPaginaMatriz(Curso(1, "Curso", [calculo_1, calculo_2, estruturas, topicos]))
+    html = html.replace("<td>Cálculo I</td>", "<td>Calculo 1</td>")
+    return html.replace("<td>Cálculo II<br>Estruturas de Dados</td>", "<td>Calculo 2<br>Estruturas de Dados II</td>")
+
+
+class TestWebScraper(unittest.TestCase):
+    '''
+    Testes do scraper contra um substituto local do site da UFMS (benchmarks/site_local.py).
+    '''
+
+    def setUp(self) -> None:
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.site = SiteLocal([1], n_unidades=20).iniciar()
+        WebScraper.configurarSessao(url_base=self.site.url, tentativas=0)
+
+
+    def tearDown(self) -> None:
+        WebScraper.configurarSessao(url_base="https://ensino.ufms.br")
+        self.site.parar()
+        self.diretorio.cleanup()
+
+
+    def test_cache_revalida_com_etag(self) -> None:
+        # Com ttl negativo toda entrada já está expirada, então cada busca faz a requisição condicional
+        cache = CacheCursos(path.join(self.diretorio.name, "cache.db"), ttl=-1)
+
+        try:
+            curso = WebScraper.findCurso(1, cache)
+            self.assertEqual(self.site.requisicoes, 2)
+
+            revalidado = WebScraper.findCurso(1, cache)
+            self.assertEqual(self.site.requisicoes, 3)
+            self.assertEqual([uc.nome for uc in revalidado.matriz_curricular], [uc.nome for uc in curso.matriz_curricular])
+
+            self.site.alterar(1, paginaMatriz().encode("utf-8"))
+            alterado = WebScraper.findCurso(1, cache)
+            self.assertEqual(self.site.requisicoes, 5)
+            self.assertEqual(len(alterado.matriz_curricular), 4)
+        finally:
+            cache.fechar()
+
+
+    def test_vincula_pre_requisitos_aproximados(self) -> None:
+        self.site.alterar(1, paginaMatriz().encode("utf-8"))
+
+        curso = WebScraper.findCurso(1)
+        calculo_1, calculo_2, estruturas, topicos = curso.matriz_curricular
+
+        self.assertEqual(list(calculo_2.pre_requisitos), [calculo_1])
+        # "Estruturas de Dados II" não é a UC "Estruturas de Dados", então não é ligada
+        self.assertEqual(list(topicos.pre_requisitos), [calculo_2])
+        self.assertEqual(list(estruturas.pre_requisitos), [])
+
+
+    def test_findCursos_devolve_os_erros_sem_interromper_os_outros(self) -> None:
+        resultados = dict(WebScraper.findCursos([1, 99, 100], max_concurrency=3))
+
+        self.assertEqual(sorted(resultados), [1, 99, 100])
+        self.assertIsInstance(resultados[1], Curso)
+        for codigo in (99, 100):
+            self.assertIsInstance(resultados[codigo], CursoException)
+            self.assertEqual(resultados[codigo].valor, "CursoDoesNotExist")
+
+        # Sem o site no ar, cada curso recebe o seu erro de rede
+        from requests import RequestException
+
+        WebScraper.configurarSessao(url_base="http://127.0.0.1:9", tentativas=0, timeout=(1, 1))
+        resultados = dict(WebScraper.findCursos([1, 2], max_concurrency=2))
+
+        self.assertEqual(sorted(resultados), [1, 2])
+        self.assertTrue(all(isinstance(erro, RequestException) for erro in resultados.values()))
+
+
+
+class TestScrapeMatrizCurricular(unittest.TestCase):
+    '''
+    Testes da leitura da página da matriz, sem rede.
+    '''
+
+    def setUp(self) -> None:
+        self.parser_original = ParserHTML.PARSER
+
+
+    def tearDown(self) -> None:
+        ParserHTML.configurarParser(self.parser_original)
+
+
+    def test_nome_quebrado_em_varias_linhas_no_html(self) -> None:
+        algoritmos = UnidadeCurricular("Algoritmos e Programação I", 68, [], True)
+        calculo = UnidadeCurricular("Cálculo I", 68, [], True)
+        estruturas = UnidadeCurricular("Estruturas de Dados", 68, [algoritmos, calculo], True)
+
+        html = renderizarPaginaMatriz(Curso(1, "Curso", [algoritmos, calculo, estruturas])).replace(
+            "<td>Algoritmos e Programação I<br>Cálculo I</td>",
+            "<td>\n    Algoritmos e\n    Programação I\n    <br>\n    Cálculo I;\n  </td>",
+        )
+
+        parsers = ["html.parser"] + (["lxml"] if find_spec("lxml") is not None else [])
+        for parser in parsers:
+            with self.subTest(parser=parser):
+                ParserHTML.configurarParser(parser)
+                matriz = WebScraper.scrapeMatrizCurricular(1, html.encode("utf-8"))
+
+                self.assertEqual([uc.nome for uc in matriz[2].pre_requisitos], ["Algoritmos e Programação I", "Cálculo I"])
+                self.assertEqual(WebScraper.filtrarPreRequisitos(ParserHTML.extrairLinhas(html.encode("utf-8"))[4][2]), [
+                    "Algoritmos e Programação I", "Cálculo I",
+                ])
+
+
+if __name__ == "__main__":
+    unittest.main()